@@ -15,6 +15,21 @@ p = inflect.engine()
 
 ### Single constants ###
 ABS_MAX_EMBED_CHARACTERS = 3900  # Absolute maximum number of characters in an embed -100 for safety
+AUTOCOMPLETE_FUZZY_CUTOFF = 0.75  # minimum similarity of a fuzzy autocomplete match
+AUTOCOMPLETE_FUZZY_MIN_LENGTH = 3  # shortest autocomplete input which is fuzzy matched
+AUTOCOMPLETE_INDEX_TTL = 600  # seconds an autocomplete index is used before it is rebuilt
+CHANGELOG_CATEGORIES = [
+    "feat",
+    "fix",
+    "docs",
+    "refactor",
+    "style",
+    "test",
+    "chore",
+    "perf",
+    "ci",
+    "build",
+]
 CHANGELOG_EXCLUDE_CATEGORIES = [
     "docs",
     "refactor",
@@ -37,15 +52,31 @@ COGS_PATH = PROJECT_ROOT_PATH / "src" / "valentina" / "discord" / "cogs"
 
 COOL_POINT_VALUE = 10  # 1 cool point equals this many xp
 DEFAULT_DIFFICULTY = 6  # Default difficulty for a roll
+GUILD_PERMISSIONS_CACHE_TTL = (
+    300  # seconds a guild's permission snapshot is used before it is reloaded
+)
+IMAGE_WEBP_QUALITY = 80  # WebP quality of generated image derivatives
 MAX_BUTTONS_PER_ROW = 5
+MAX_CONCURRENT_CHANNEL_OPERATIONS = 5  # Discord channel operations run at once per guild
+MAX_CONCURRENT_GUILD_PROVISIONS = 5  # guilds provisioned at once when the bot starts
 MAX_DOT_DISPLAY = 5  # number of dots to display on a character sheet before converting to text
 MAX_FIELD_COUNT = 1010
+MAX_IMAGE_WORKERS = 2  # images processed at once when generating derivatives
 MAX_OPTION_LIST_SIZE = 25  # maximum number of options in a discord select menu
 MAX_POOL_SIZE = 100  # maximum number of dice that can be rolled
+NAME_POOL_SIZE = 100  # random names pre-generated for each gender and country
+MAX_S3_CONNECTIONS = 10  # size of the shared S3 connection pool and thread pool
+MAX_S3_DELETE_BATCH_SIZE = 1000  # maximum keys in a single S3 delete_objects request
+S3_INDEX_TTL = 900  # seconds before a guild's index of S3 objects is refreshed in the background
+S3_INDEX_WAIT = 2  # seconds autocomplete waits for an index of S3 objects which was never built
+PRECOMPUTED_PROBABILITY_MAX_POOL = 30  # largest d10 pool whose probabilities are built at startup
 PREF_MAX_EMBED_CHARACTERS = 1950  # Preferred maximum number of characters in an embed
 SPACER = "\u200b"  # Zero-width space used in Discord embeds
+STORYTELLER_ROLE_NAMES = frozenset(["Storyteller", "@Storyteller"])
 VALID_IMAGE_EXTENSIONS = frozenset(["png", "jpg", "jpeg", "gif", "webp"])
 STARTING_FREEBIE_POINTS = 21
+TRAIT_MIGRATION_BATCH_SIZE = 100  # characters migrated to embedded traits per database round trip
+TRAIT_RESTORE_ATTEMPTS = 3  # attempts to raise a lowered trait again when its refund fails
 
 
 class BrokerTaskType(Enum):
@@ -205,6 +236,17 @@ class HTTPStatus(Enum):
     INTERNAL_SERVER_ERROR = 500
 
 
+class ImageVariant(Enum):
+    """Enum for the WebP derivatives generated from uploaded images.
+
+    Values are the maximum width and height in pixels. None keeps the original size.
+    """
+
+    THUMBNAIL = 256
+    SHEET = 1024
+    FULL = None
+
+
 class LogLevel(StrEnum):
     """Enum for logging levels."""
 
@@ -1,18 +1,22 @@
 """Manage channels within a Guild."""
 
 import asyncio
-from threading import Lock
+from collections.abc import Coroutine
+from typing import Any
+from weakref import WeakValueDictionary
 
 import discord
 from loguru import logger
 
 from valentina.constants import (
     CHANNEL_PERMISSIONS,
+    MAX_CONCURRENT_CHANNEL_OPERATIONS,
     CampaignChannelName,
     ChannelPermission,
     EmojiDict,
 )
 from valentina.models import Campaign, CampaignBook, Character
+from valentina.utils.channel_cache import channel_cache
 
 from valentina.discord.utils import set_channel_perms  # isort:skip
 
@@ -21,15 +25,48 @@ CAMPAIGN_COMMON_CHANNELS = {  # channel_db_key: channel_name
     "channel_general": CampaignChannelName.GENERAL.value,
 }
 
-# create lock
-LOCK = Lock()
+# One lock per campaign so a campaign's category is only modified by one coroutine at a time while different campaigns are confirmed concurrently. Locks are dropped once no coroutine holds or waits on them.
+CAMPAIGN_LOCKS: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+
+def campaign_lock(campaign_id: str) -> asyncio.Lock:
+    """Return the lock of a campaign, creating it when no coroutine holds or waits on it.
+
+    Args:
+        campaign_id (str): The id of the campaign.
+
+    Returns:
+        asyncio.Lock: The campaign's lock. Keep a reference to it for as long as it is held.
+    """
+    lock = CAMPAIGN_LOCKS.get(campaign_id)
+    if lock is None:
+        lock = CAMPAIGN_LOCKS[campaign_id] = asyncio.Lock()
+
+    return lock
 
 
 class ChannelManager:  # pragma: no cover
-    """Manage channels within a Guild."""
+    """Manage channels within a Guild.
+
+    Discord operations are not spaced out with fixed sleeps. py-cord paces every request according to the rate-limit bucket headers Discord returns for its route, so independent channel operations are run concurrently, bounded by a per-guild semaphore.
+    """
 
     def __init__(self, guild: discord.Guild):
         self.guild = guild
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNEL_OPERATIONS)
+
+    async def _run_concurrently(self, *operations: Coroutine[Any, Any, Any]) -> None:
+        """Run independent channel operations concurrently.
+
+        Args:
+            *operations (Coroutine): The coroutines to run. Each one is run while holding the guild's semaphore.
+        """
+
+        async def _bounded(operation: Coroutine[Any, Any, Any]) -> None:
+            async with self.semaphore:
+                await operation
+
+        await asyncio.gather(*(_bounded(operation) for operation in operations))
 
     @staticmethod
     def _channel_sort_order(channel: discord.TextChannel) -> tuple[int, str]:  # pragma: no cover
@@ -71,7 +108,6 @@ class ChannelManager:  # pragma: no cover
                 book.channel == channel.id for book in await campaign.fetch_books()
             ):
                 await self.delete_channel(channel)
-                await asyncio.sleep(1)
 
             if (
                 channel.name.startswith(EmojiDict.CHANNEL_PLAYER)
@@ -81,7 +117,6 @@ class ChannelManager:  # pragma: no cover
                 for character in await campaign.fetch_player_characters()
             ):
                 await self.delete_channel(channel)
-                await asyncio.sleep(1)
 
             if channel.name.startswith(
                 f"{EmojiDict.CHANNEL_PRIVATE}{EmojiDict.CHANNEL_PLAYER}",
@@ -95,7 +130,6 @@ class ChannelManager:  # pragma: no cover
                 )
             ):
                 await self.delete_channel(channel)
-                await asyncio.sleep(1)
 
             if channel.name.startswith(f"{EmojiDict.CHANNEL_PRIVATE}-") or (
                 channel.name.startswith(f"{EmojiDict.CHANNEL_GENERAL}-")
@@ -105,7 +139,6 @@ class ChannelManager:  # pragma: no cover
                 )
             ):
                 await self.delete_channel(channel)
-                await asyncio.sleep(1)
 
     async def _confirm_campaign_common_channels(
         self,
@@ -123,7 +156,6 @@ class ChannelManager:  # pragma: no cover
             channels (list[discord.TextChannel]): The list of existing channels in the category.
         """
         for channel_db_key, channel_name in CAMPAIGN_COMMON_CHANNELS.items():
-            await asyncio.sleep(1)  # Keep the rate limit happy
             channel_db_id = getattr(campaign, channel_db_key, None)
             channel = await self.confirm_channel_in_category(
                 existing_category=category,
@@ -197,13 +229,11 @@ class ChannelManager:  # pragma: no cover
             logger.info(
                 f"Channel {channel_name} exists in {existing_category} but not in database. Add channel id to database.",
             )
-            await asyncio.sleep(1)  # Keep the rate limit happy
             preexisting_channel = next(
                 (channel for channel in existing_channels if channel.name == channel_name),
                 None,
             )
             # update channel permissions
-            await asyncio.sleep(1)  # Keep the rate limit happy
             return await self.channel_update_or_add(
                 channel=preexisting_channel,
                 name=channel_name,
@@ -223,7 +253,6 @@ class ChannelManager:  # pragma: no cover
                 f"Channel {channel_name} exists in database and {existing_category} but name is different. Renamed channel.",
             )
 
-            await asyncio.sleep(1)  # Keep the rate limit happy
             return await self.channel_update_or_add(
                 channel=existing_channel_object,
                 name=channel_name,
@@ -235,11 +264,9 @@ class ChannelManager:  # pragma: no cover
 
         # Finally, if the channel does not exist in the category, create it
 
-        await asyncio.sleep(1)  # Keep the rate limit happy
         logger.info(
             f"Channel {channel_name} does not exist in {existing_category}. Create channel.",
         )
-        await asyncio.sleep(1)  # Keep the rate limit happy
         return await self.channel_update_or_add(
             name=channel_name,
             category=existing_category,
@@ -366,7 +393,6 @@ class ChannelManager:  # pragma: no cover
             topic=f"Channel for book {book.number}. {book.name}",
         )
         await book.update_channel_id(channel)
-        await asyncio.sleep(1)  # Keep the rate limit happy
         return channel
 
     async def confirm_campaign_channels(self, campaign: Campaign) -> None:
@@ -378,10 +404,8 @@ class ChannelManager:  # pragma: no cover
         Args:
             campaign (Campaign): The campaign object containing details about the campaign.
         """
-        global LOCK  # noqa: PLW0602
-
-        # Use a lock to prevent race conditions when multiple instances try to modify channels simultaneously
-        with LOCK:
+        # Use a lock to prevent race conditions when multiple instances try to modify the same campaign's channels simultaneously
+        async with campaign_lock(str(campaign.id)):
             # Format category name with emoji prefix for visual organization in Discord sidebar
             campaign_category_channel_name = (
                 f"{EmojiDict.BOOKS}-{campaign.name.lower().replace(' ', '-')}"
@@ -396,6 +420,7 @@ class ChannelManager:  # pragma: no cover
                     category = await self.guild.create_category(campaign_category_channel_name)
                     campaign.channel_campaign_category = category.id
                     await campaign.save()
+                    channel_cache.invalidate(category.id)
                     logger.debug(
                         f"Campaign category '{campaign_category_channel_name}' created in '{self.guild.name}'",
                     )
@@ -416,6 +441,7 @@ class ChannelManager:  # pragma: no cover
                 category = await self.guild.create_category(campaign_category_channel_name)
                 campaign.channel_campaign_category = category.id
                 await campaign.save()
+                channel_cache.invalidate(category.id)
                 logger.debug(
                     f"Campaign category '{campaign_category_channel_name}' created in '{self.guild.name}'",
                 )
@@ -429,18 +455,18 @@ class ChannelManager:  # pragma: no cover
                 channels=channels,
             )
 
-            # Add 1 second delay between channel operations to avoid Discord rate limits
-            for book in await campaign.fetch_books():
-                await self.confirm_book_channel(book=book, campaign=campaign)
-                await asyncio.sleep(1)
-
-            for character in await campaign.fetch_player_characters():
-                await self.confirm_character_channel(character=character, campaign=campaign)
-                await asyncio.sleep(1)
-
-            for character in await campaign.fetch_storyteller_characters():
-                await self.confirm_character_channel(character=character, campaign=campaign)
-                await asyncio.sleep(1)
+            # Each book and character has its own channel so they are confirmed concurrently
+            await self._run_concurrently(
+                *(
+                    self.confirm_book_channel(book=book, campaign=campaign)
+                    for book in await campaign.fetch_books()
+                ),
+                *(
+                    self.confirm_character_channel(character=character, campaign=campaign)
+                    for character in await campaign.fetch_player_characters()
+                    + await campaign.fetch_storyteller_characters()
+                ),
+            )
 
             # Clean up any orphaned channels that are no longer associated with books/characters
             await self._remove_unused_campaign_channels(campaign, channels)
@@ -496,7 +522,6 @@ class ChannelManager:  # pragma: no cover
         )
         await character.update_channel_id(channel)
 
-        await asyncio.sleep(1)  # Keep the rate limit happy
         return channel
 
     async def delete_book_channel(self, book: CampaignBook) -> None:
@@ -523,27 +548,25 @@ class ChannelManager:  # pragma: no cover
         """
         logger.debug(f"Deleting campaign channels for campaign {campaign.name}")
 
-        for book in await campaign.fetch_books():
-            await self.delete_book_channel(book)
-
-        for character in await campaign.fetch_player_characters():
-            await self.delete_character_channel(character)
-
-        for character in await campaign.fetch_storyteller_characters():
-            await self.delete_character_channel(character)
+        await self._run_concurrently(
+            *(self.delete_book_channel(book) for book in await campaign.fetch_books()),
+            *(
+                self.delete_character_channel(character)
+                for character in await campaign.fetch_player_characters()
+                + await campaign.fetch_storyteller_characters()
+            ),
+        )
 
         for channel_db_key in CAMPAIGN_COMMON_CHANNELS:
             if getattr(campaign, channel_db_key, None):
                 await self.delete_channel(getattr(campaign, channel_db_key))
                 setattr(campaign, channel_db_key, None)
                 await campaign.save()
-                await asyncio.sleep(1)  # Keep the rate limit happy
 
         if campaign.channel_campaign_category:
             await self.delete_channel(campaign.channel_campaign_category)
             campaign.channel_campaign_category = None
             await campaign.save()
-            await asyncio.sleep(1)
 
     async def delete_channel(
         self,
@@ -571,7 +594,7 @@ class ChannelManager:  # pragma: no cover
 
         logger.debug(f"GUILD: Delete channel '{channel.name}' on '{self.guild.name}'")
         await channel.delete()
-        await asyncio.sleep(1)  # Keep the rate limit happy
+        channel_cache.invalidate(channel.id)
 
     async def delete_character_channel(self, character: Character) -> None:
         """Delete the channel associated with the character.
@@ -628,7 +651,6 @@ class ChannelManager:  # pragma: no cover
                     if channel.position and channel.position == i:
                         continue
                     await channel.edit(position=i)
-                    await asyncio.sleep(2)  # Keep the rate limit happy
 
                 logger.debug(f"Sorted channels: {[channel.name for channel in sorted_channels]}")
                 break
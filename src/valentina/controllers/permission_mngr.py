@@ -1,8 +1,11 @@
 """Manage entitlements for Valentina models."""
 
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from typing import assert_never
 
+from beanie import PydanticObjectId
+
 from valentina.constants import (
     PermissionManageCampaign,
     PermissionsGrantXP,
@@ -11,21 +14,85 @@ from valentina.constants import (
 )
 from valentina.models.character import Character
 from valentina.models.guild import Guild, GuildPermissions
+from valentina.utils.permission_cache import GuildPermissionSnapshot, guild_permission_cache
+
+
+async def _load_guild_snapshot(guild_id: int, version: int) -> GuildPermissionSnapshot | None:
+    """Load the permission settings, administrators, and storytellers of a guild.
+
+    Args:
+        guild_id (int): The id of the guild.
+        version (int): The version of the guild's permissions the snapshot is loaded at.
+
+    Returns:
+        GuildPermissionSnapshot | None: The snapshot, or None if the guild does not exist.
+    """
+    guild = await Guild.get_pymongo_collection().find_one(
+        {"_id": guild_id}, projection=["permissions", "administrators", "storytellers"]
+    )
+    if not guild:
+        return None
+
+    return GuildPermissionSnapshot(
+        guild_id=guild_id,
+        version=version,
+        permissions=GuildPermissions.model_validate(guild.get("permissions") or {}),
+        administrators=frozenset(guild.get("administrators", [])),
+        storytellers=frozenset(guild.get("storytellers", [])),
+    )
 
 
 class PermissionManager:
-    """Manage permissions for Valentina models."""
+    """Manage permissions for Valentina models.
+
+    Permissions are evaluated against a snapshot of the guild shared by every PermissionManager through `guild_permission_cache`. The snapshot is reloaded whenever the guild is saved or its roles are synchronized, so the only database call a check makes is to find the owner of a character.
+    """
 
     def __init__(self, guild_id: int) -> None:
         self.guild_id = guild_id
-        self._guild_db_obj: Guild = None
+        self._snapshot: GuildPermissionSnapshot | None = None
+
+    async def _fetch_snapshot(self) -> GuildPermissionSnapshot:
+        """Retrieve the guild's permission snapshot, replacing it when the guild has changed."""
+        version = guild_permission_cache.version(self.guild_id)
+        if self._snapshot and self._snapshot.version == version:
+            return self._snapshot
+
+        snapshot = await guild_permission_cache.get(
+            self.guild_id, partial(_load_guild_snapshot, self.guild_id)
+        )
+        # A guild which is not in the database grants nothing
+        self._snapshot = snapshot or GuildPermissionSnapshot(
+            guild_id=self.guild_id,
+            version=version,
+            permissions=GuildPermissions(),
+            administrators=frozenset(),
+            storytellers=frozenset(),
+        )
+
+        return self._snapshot
 
     async def _fetch_guild_permissions(self) -> GuildPermissions:
         """Retrieve the guild's permissions."""
-        if not self._guild_db_obj:
-            self._guild_db_obj = await Guild.get(self.guild_id)
+        return (await self._fetch_snapshot()).permissions
+
+    @staticmethod
+    async def _fetch_character_owner(character_id: str) -> tuple[int | None, datetime | None]:
+        """Retrieve the owner and creation date of a character without loading the rest of it.
+
+        Args:
+            character_id (str): The database ID of the character.
 
-        return self._guild_db_obj.permissions
+        Returns:
+            tuple[int | None, datetime | None]: The id of the character's owner and the date it was created, or None for both if the character does not exist.
+        """
+        character = await Character.get_pymongo_collection().find_one(
+            {"_id": PydanticObjectId(character_id)}, projection=["user_owner", "date_created"]
+        )
+        if not character:
+            return None, None
+
+        return character.get("user_owner"), character.get("date_created")
 
     async def can_grant_xp(self, author_id: int, target_id: int) -> bool:
         """Determine if the user can grant XP.
@@ -111,8 +178,8 @@ class PermissionManager:
             bool: True if the user has permission to manage the character's traits,
                   False otherwise.
         """
-        # Always allow administrators to manage traits
-        if await self.is_admin(author_id):
+        # Always allow administrators and storytellers to manage traits
+        if await self.is_admin(author_id) or await self.is_storyteller(author_id):
             return True
 
         # Grab the setting from the database
@@ -128,22 +195,19 @@ class PermissionManager:
                 return True
 
             case PermissionsManageTraits.CHARACTER_OWNER_ONLY:
-                character = await Character.get(character_id)
-                return (author_id == character.user_owner) or await self.is_storyteller(author_id)
+                user_owner, _ = await self._fetch_character_owner(character_id)
+                return author_id == user_owner
 
             case PermissionsManageTraits.WITHIN_24_HOURS:
-                character = await Character.get(character_id)
-                author_is_owner = author_id == character.user_owner
-                is_within_24_hours = datetime.now(UTC) - character.date_created <= timedelta(
-                    hours=24,
-                )
-
-                return (author_is_owner and is_within_24_hours) or await self.is_storyteller(
-                    author_id,
+                user_owner, date_created = await self._fetch_character_owner(character_id)
+                return (
+                    author_id == user_owner
+                    and date_created is not None
+                    and datetime.now(UTC) - date_created <= timedelta(hours=24)
                 )
 
             case PermissionsManageTraits.STORYTELLER_ONLY:
-                return await self.is_storyteller(author_id)
+                return False
 
             case _:
                 assert_never()
@@ -178,8 +242,11 @@ class PermissionManager:
                 return True
 
             case PermissionsKillCharacter.CHARACTER_OWNER_ONLY:
-                character = await Character.get(character_id)
-                return author_id == character.user_owner or await self.is_storyteller(author_id)
+                if await self.is_storyteller(author_id):
+                    return True
+
+                user_owner, _ = await self._fetch_character_owner(character_id)
+                return author_id == user_owner
 
             case PermissionsKillCharacter.STORYTELLER_ONLY:
                 return await self.is_storyteller(author_id)
@@ -196,11 +263,7 @@ class PermissionManager:
         Returns:
             bool: True if the author is a storyteller; otherwise, False.
         """
-        if not self._guild_db_obj:
-            self._guild_db_obj = await Guild.get(self.guild_id)
-
-        # Finally, allow storytellers to grant XP and deny all others
-        return author_id in self._guild_db_obj.storytellers
+        return author_id in (await self._fetch_snapshot()).storytellers
 
     async def is_admin(self, author_id: int) -> bool:
         """Determine if the author is an administrator.
@@ -211,7 +274,4 @@ class PermissionManager:
         Returns:
             bool: True if the author is an administrator; otherwise, False.
         """
-        if not self._guild_db_obj:
-            self._guild_db_obj = await Guild.get(self.guild_id)
-
-        return author_id in self._guild_db_obj.administrators
+        return author_id in (await self._fetch_snapshot()).administrators
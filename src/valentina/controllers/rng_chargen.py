@@ -1,7 +1,8 @@
 """Random character generation controller."""
 
+import asyncio
 import random
-from typing import Literal, cast
+from typing import Any, Literal, cast
 
 from loguru import logger
 from numpy import int32
@@ -22,9 +23,9 @@ from valentina.models import Campaign, Character, CharacterSheetSection, Charact
 from valentina.utils import errors, random_num
 from valentina.utils.helpers import (
     divide_total_randomly,
-    fetch_random_name,
     get_max_trait_value,
 )
+from valentina.utils.names import name_generator
 
 _rng = default_rng()
 
@@ -132,6 +133,37 @@ class RNGCharGen:
         # Constrain the final value between 1 and 5
         return max(min(value, 5), 1)
 
+    @staticmethod
+    async def _add_trait(character: Character, trait: CharacterTrait) -> CharacterTrait:
+        """Add a trait to a character.
+
+        Traits for a character which has not been inserted are staged in memory and written with the character. Otherwise the trait is written immediately.
+
+        Args:
+            character (Character): The character to add the trait to.
+            trait (CharacterTrait): The trait to add.
+
+        Returns:
+            CharacterTrait: The added trait.
+
+        Raises:
+            errors.TraitExistsError: If a trait with the same name and category already exists for the character.
+        """
+        if not character.id:
+            return character.stage_trait(trait)
+
+        return await character.add_trait(trait)
+
+    @staticmethod
+    async def _save(character: Character) -> None:
+        """Save a character unless it is being assembled in memory.
+
+        Args:
+            character (Character): The character to save.
+        """
+        if character.id:
+            await character.save()
+
     async def generate_base_character(  # noqa: PLR0913
         self,
         char_class: CharClass | None = None,
@@ -145,6 +177,7 @@ class RNGCharGen:
         gender: Literal["male", "female"] | None = None,
         nationality: str = "us",
         nickname_is_class: bool = False,
+        insert: bool = True,
     ) -> Character:
         """Generate a base character with random attributes.
 
@@ -162,12 +195,13 @@ class RNGCharGen:
             gender (Literal["male", "female"] | None): Gender for name generation.
             nationality (str): Nationality for name generation. Defaults to "us".
             nickname_is_class (bool): Whether to use the class name as a nickname.
+            insert (bool): Whether to insert the character into the database. When False, the character is assembled in memory. Defaults to True.
 
         Returns:
             Character: The generated base character.
         """
         # Grab random name
-        name_first, name_last = await fetch_random_name(gender=gender, country=nationality)
+        name_first, name_last = name_generator.random_name(gender=gender, country=nationality)
 
         # Grab a random class
         if char_class is None:
@@ -207,7 +241,9 @@ class RNGCharGen:
             campaign=str(self.campaign.id) if self.campaign else None,
         )
 
-        await character.insert()
+        if insert:
+            await character.insert()
+
         return character
 
     async def generate_full_character(  # noqa: PLR0913
@@ -223,12 +259,14 @@ class RNGCharGen:
         gender: Literal["male", "female"] | None = None,
         nationality: str = "us",
         nickname_is_class: bool = False,
+        draft: bool = False,
     ) -> Character:
         """Generate a full character with random values.
 
         Generate a complete character with randomized values for all traits and abilities,
         and add it to the database. This method is primarily used by Storytellers for
-        quick NPC creation.
+        quick NPC creation. The character and its traits are assembled in memory and written
+        with a single bulk insert of the traits followed by a single insert of the character.
 
         Args:
             char_class (CharClass | None): The character's class. If None, a random class is chosen.
@@ -242,13 +280,14 @@ class RNGCharGen:
             gender (Literal["male", "female"] | None): The character's gender. If None, a random gender is chosen.
             nationality (str): The character's nationality. Defaults to "us".
             nickname_is_class (bool): Whether to use the character's class as their nickname. Defaults to False.
+            draft (bool): Whether to return the character without writing it to the database. Draft characters have no id and their traits are staged in memory until `Character.insert_with_traits()` is called. Defaults to False.
 
         Returns:
             Character: The fully generated character object.
         """
-        filtered_locals = {k: v for k, v in locals().items() if k != "self"}
+        filtered_locals = {k: v for k, v in locals().items() if k not in {"self", "draft"}}
 
-        character = await self.generate_base_character(**filtered_locals)
+        character = await self.generate_base_character(**filtered_locals, insert=False)
         character = await self.random_attributes(character)
         character = await self.random_abilities(character)
         character = await self.random_disciplines(character)
@@ -257,7 +296,26 @@ class RNGCharGen:
         character = await self.random_willpower(character)
         character = await self.random_hunter_traits(character)
         character = await self.random_werewolf_traits(character)
-        return await self.concept_special_abilities(character)
+        character = await self.concept_special_abilities(character)
+
+        if draft:
+            return character
+
+        return await character.insert_with_traits()
+
+    async def generate_full_characters(self, count: int, **kwargs: Any) -> list[Character]:
+        """Generate several full characters concurrently.
+
+        Args:
+            count (int): The number of characters to generate.
+            **kwargs (Any): Arguments passed to `generate_full_character()` for every character.
+
+        Returns:
+            list[Character]: The generated characters.
+        """
+        return list(
+            await asyncio.gather(*(self.generate_full_character(**kwargs) for _ in range(count)))
+        )
 
     async def random_attributes(self, character: Character) -> Character:
         """Randomly generate attributes for the character.
@@ -325,7 +383,7 @@ class RNGCharGen:
                     category_name=cat.name,
                 )
                 try:
-                    await character.add_trait(trait)
+                    await self._add_trait(character, trait)
                 except errors.TraitExistsError as e:
                     logger.warning(e)
 
@@ -396,7 +454,7 @@ class RNGCharGen:
 
             for trait in traits:
                 try:
-                    await character.add_trait(trait)
+                    await self._add_trait(character, trait)
                 except errors.TraitExistsError as e:
                     logger.warning(e)
 
@@ -430,7 +488,7 @@ class RNGCharGen:
             RNGCharLevel.ELITE: 3,
         }
 
-        disciplines_to_set = clan.value.disciplines
+        disciplines_to_set = list(clan.value.disciplines)
         other_disciplines = TraitCategory.DISCIPLINES.get_all_class_trait_names(
             CharClass[character.char_class_name],
         )
@@ -458,7 +516,7 @@ class RNGCharGen:
                 category_name=TraitCategory.DISCIPLINES.name,
             )
             try:
-                await character.add_trait(trait)
+                await self._add_trait(character, trait)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -508,7 +566,7 @@ class RNGCharGen:
                 category_name=TraitCategory.VIRTUES.name,
             )
             try:
-                await character.add_trait(trait)
+                await self._add_trait(character, trait)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -558,7 +616,7 @@ class RNGCharGen:
                 category_name=TraitCategory.BACKGROUNDS.name,
             )
             try:
-                await character.add_trait(trait)
+                await self._add_trait(character, trait)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -614,7 +672,7 @@ class RNGCharGen:
             )
 
             try:
-                await character.add_trait(willpower)
+                await self._add_trait(character, willpower)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -627,7 +685,7 @@ class RNGCharGen:
                 max_value=10,
             )
             try:
-                await character.add_trait(humanity)
+                await self._add_trait(character, humanity)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -656,7 +714,7 @@ class RNGCharGen:
         except KeyError:
             creed = HunterCreed.random_member()
             character.creed_name = creed.name
-            await character.save()
+            await self._save(character)
 
         willpower = CharacterTrait(
             name="Willpower",
@@ -666,7 +724,7 @@ class RNGCharGen:
             max_value=10,
         )
         try:
-            await character.add_trait(willpower)
+            await self._add_trait(character, willpower)
         except errors.TraitExistsError as e:
             logger.warning(e)
 
@@ -677,7 +735,7 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=get_max_trait_value("Conviction", TraitCategory.OTHER.name),
         )
-        await character.add_trait(conviction)
+        await self._add_trait(character, conviction)
 
         # Assign Edges
         edges = creed.value.edges
@@ -701,7 +759,7 @@ class RNGCharGen:
                 category_name=TraitCategory.EDGES.name,
             )
             try:
-                await character.add_trait(trait)
+                await self._add_trait(character, trait)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -737,7 +795,7 @@ class RNGCharGen:
                         category_name=category,
                     )
                     try:
-                        await character.add_trait(trait)
+                        await self._add_trait(character, trait)
                     except errors.TraitExistsError as e:
                         logger.warning(e)
 
@@ -748,7 +806,7 @@ class RNGCharGen:
                         for title, content in ability["custom_sections"]
                     ],
                 )
-                await character.save()
+                await self._save(character)
 
         return character
 
@@ -773,7 +831,7 @@ class RNGCharGen:
         tribe = WerewolfTribe.random_member()
         character.tribe = tribe.name
         character.totem = tribe.value.totem
-        await character.save()
+        await self._save(character)
 
         extra_dots_map = {
             RNGCharLevel.NEW: 0,
@@ -790,7 +848,7 @@ class RNGCharGen:
             max_value=10,
         )
         try:
-            await character.add_trait(willpower)
+            await self._add_trait(character, willpower)
         except errors.TraitExistsError as e:
             logger.warning(e)
 
@@ -801,7 +859,7 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=10,
         )
-        await character.add_trait(gnosis)
+        await self._add_trait(character, gnosis)
 
         rage = CharacterTrait(
             name="Rage",
@@ -810,7 +868,7 @@ class RNGCharGen:
             category_name=TraitCategory.OTHER.name,
             max_value=get_max_trait_value("Rage", TraitCategory.OTHER.name),
         )
-        await character.add_trait(rage)
+        await self._add_trait(character, rage)
 
         rank = CharacterTrait(
             name="Rank",
@@ -819,7 +877,7 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=5,
         )
-        await character.add_trait(rank)
+        await self._add_trait(character, rank)
 
         glory = CharacterTrait(
             name="Glory",
@@ -828,7 +886,7 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Glory", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(glory)
+        await self._add_trait(character, glory)
 
         honor = CharacterTrait(
             name="Honor",
@@ -837,7 +895,7 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Honor", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(honor)
+        await self._add_trait(character, honor)
 
         wisdom = CharacterTrait(
             name="Wisdom",
@@ -846,7 +904,7 @@ class RNGCharGen:
             category_name=TraitCategory.RENOWN.name,
             max_value=get_max_trait_value("Wisdom", TraitCategory.RENOWN.name),
         )
-        await character.add_trait(wisdom)
+        await self._add_trait(character, wisdom)
 
         gifts = set(auspice.value.starting_gifts + breed.value.starting_gifts)
         for gift in gifts:
@@ -858,7 +916,7 @@ class RNGCharGen:
                 max_value=1,
             )
             try:
-                await character.add_trait(trait)
+                await self._add_trait(character, trait)
             except errors.TraitExistsError as e:
                 logger.warning(e)
 
@@ -1,34 +1,85 @@
 """A simple task broker for Valentina."""
 
 import asyncio
-from typing import assert_never
+from dataclasses import dataclass, field
 
 import discord
+from beanie import PydanticObjectId
+from beanie.operators import In
 from loguru import logger
 
-from valentina.constants import BrokerTaskType
+from valentina.constants import MAX_CONCURRENT_CHANNEL_OPERATIONS, BrokerTaskType
 from valentina.models import BrokerTask, Campaign, CampaignBook, Character
 
 from .channel_mngr import ChannelManager
 
 
+@dataclass
+class CampaignChannelWork:
+    """The coalesced channel work for a single campaign during one run of the task broker."""
+
+    campaign_id: str | None
+    confirm_campaign: bool = False
+    book_ids: set[str] = field(default_factory=set)
+    characters: dict[str, Character] = field(default_factory=dict)
+    tasks: list[BrokerTask] = field(default_factory=list)
+
+
 class TaskBroker:
-    """A simple task broker for Valentina. Call the run() method from the Dicord bot at a set interval to poll the database for tasks to run."""
+    """A simple task broker for Valentina. Call the run() method from the Dicord bot at a set interval to poll the database for tasks to run.
+
+    Pending tasks are fetched once per run and coalesced so that duplicate tasks, such as several CONFIRM_CHARACTER_CHANNEL tasks for the same character, result in a single Discord operation. Work for different campaigns is run concurrently while work within a campaign is run in order. Discord's rate limits are respected by py-cord, which paces every request by the rate-limit bucket headers of its route.
+    """
 
     def __init__(self, discord_guild: discord.Guild) -> None:
         self.discord_guild = discord_guild
+        self.channel_manager = ChannelManager(guild=self.discord_guild)
+        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHANNEL_OPERATIONS)
+
+    @staticmethod
+    def _log_completed(tasks: list[BrokerTask]) -> None:
+        """Log the completion of a group of tasks.
+
+        Args:
+            tasks (list[BrokerTask]): The tasks which were completed.
+        """
+        for task in tasks:
+            if task.author_name:
+                msg = f"BROKER: {task.author_name}'s task {task.task} completed"
+            else:
+                msg = f"BROKER: Task {task.task} completed"
+
+            logger.info(msg)
+
+    @staticmethod
+    async def _delete_tasks(tasks: list[BrokerTask]) -> None:
+        """Delete completed tasks from the database with a single query.
+
+        Args:
+            tasks (list[BrokerTask]): The tasks to delete.
+        """
+        if not tasks:
+            return
+
+        await BrokerTask.find(In(BrokerTask.id, [task.id for task in tasks])).delete()
+
+    @staticmethod
+    async def _mark_error(task: BrokerTask) -> None:
+        """Flag a task which can not be run so it is not retried.
+
+        Args:
+            task (BrokerTask): The task to flag.
+        """
+        task.has_error = True
+        await task.save()
 
     async def _rebuild_channels(self) -> None:
         """Delete and recreate all campaign channels in the Discord guild.
 
         Rebuild all campaign channels from scratch by first deleting existing channels and then
         recreating them with proper permissions and categories. This ensures channel structure
-        matches the current campaign configuration in the database.
-
-        The rebuild process:
-        1. Fetch all campaigns for the guild from database
-        2. For each campaign, delete all associated Discord channels
-        3. Recreate campaign channels with updated permissions and categories
+        matches the current campaign configuration in the database. Campaigns are rebuilt
+        concurrently as each campaign's channels live in their own category.
 
         Returns:
             None: This method modifies Discord channels but does not return a value
@@ -37,186 +88,169 @@ class TaskBroker:
             discord.Forbidden: If bot lacks permissions to manage channels
             discord.HTTPException: If Discord API request fails
         """
-        # Batch all rebuild tasks together since rebuilding channels is expensive.
-        # This prevents multiple redundant rebuilds from running in parallel.
-        rebuild_channel_tasks = await BrokerTask.find_many(
-            BrokerTask.guild_id == self.discord_guild.id,
-            BrokerTask.task == BrokerTaskType.REBUILD_CHANNELS,
-            BrokerTask.has_error == False,  # noqa: E712
-        ).to_list()
-        if len(rebuild_channel_tasks) > 0:
-            logger.info(
-                f"BROKER: Found {len(rebuild_channel_tasks)} rebuild channel tasks for guild {self.discord_guild.id}",
-            )
-
-            channel_manager = ChannelManager(guild=self.discord_guild)
-            for campaign in await Campaign.find_many(
-                Campaign.guild == self.discord_guild.id,
-                fetch_links=True,
-            ).to_list():
-                await channel_manager.delete_campaign_channels(campaign)
-                # Add delay between operations to avoid hitting Discord rate limits
-                await asyncio.sleep(1)
-                await channel_manager.confirm_campaign_channels(campaign)
-                await asyncio.sleep(1)
-
-            # Clean up all rebuild tasks at once since they've been handled as a batch
-            for task in rebuild_channel_tasks:
-                await task.delete()
 
-            if task.author_name:
-                msg = f"BROKER: {task.author_name}'s task {task.task} completed"
-            else:
-                msg = f"BROKER: Task {task.task} completed"
+        async def _rebuild_campaign(campaign: Campaign) -> None:
+            async with self.semaphore:
+                await self.channel_manager.delete_campaign_channels(campaign)
+                await self.channel_manager.confirm_campaign_channels(campaign)
 
-            logger.info(msg)
+        campaigns = await Campaign.find_many(
+            Campaign.guild == self.discord_guild.id,
+            fetch_links=True,
+        ).to_list()
+        await asyncio.gather(*(_rebuild_campaign(campaign) for campaign in campaigns))
 
-    async def _rename_character_channel(self, task: BrokerTask) -> None:
-        """Rename a character's Discord channel to match their current name.
+    async def _coalesce_tasks(self, tasks: list[BrokerTask]) -> list[CampaignChannelWork]:  # noqa: C901
+        """Group pending tasks by campaign and remove duplicate work.
 
-        Process a character channel rename task by fetching the character from the database and using
-        the channel manager to update the Discord channel. This ensures channel names stay
-        synchronized with character data.
+        Tasks for the same character, book, or campaign are merged. Book and character tasks are dropped when their campaign is already being confirmed, as confirming a campaign confirms every book and character channel within it. Tasks missing required data are flagged with has_error.
 
         Args:
-            task (BrokerTask): The broker task containing character_id in its data field.
+            tasks (list[BrokerTask]): The pending tasks for the guild, excluding REBUILD_CHANNELS tasks.
 
         Returns:
-            None
-
-        Raises:
-            None: Sets task.has_error=True if character_id is invalid or character not found.
+            list[CampaignChannelWork]: The work to do, one item per campaign.
         """
-        if not task.data.get("character_id"):
-            task.has_error = True
-            await task.save()
-            return
+        work: dict[str | None, CampaignChannelWork] = {}
+
+        def _work_for(campaign_id: str | None) -> CampaignChannelWork:
+            if campaign_id not in work:
+                work[campaign_id] = CampaignChannelWork(campaign_id=campaign_id)
+            return work[campaign_id]
+
+        # Fetch every character referenced by a task with a single query
+        character_ids = {
+            str(task.data["character_id"])
+            for task in tasks
+            if task.task == BrokerTaskType.CONFIRM_CHARACTER_CHANNEL
+            and task.data.get("character_id")
+        }
+        characters = {
+            str(character.id): character
+            for character in await Character.find(
+                In(Character.id, [PydanticObjectId(x) for x in character_ids]),
+                fetch_links=True,
+            ).to_list()
+        }
 
-        character = await Character.get(task.data["character_id"], fetch_links=True)
-        if not character:
-            logger.error(f"BROKER: Character {task.data['character_id']} not found")
-            return
+        for task in tasks:
+            match task.task:
+                case BrokerTaskType.CONFIRM_CAMPAIGN_CHANNEL:
+                    if not task.data.get("campaign_id"):
+                        await self._mark_error(task)
+                        continue
 
-        channel_manager = ChannelManager(guild=self.discord_guild)
-        await channel_manager.confirm_character_channel(
-            character=character,
-            campaign=character.campaign,
-        )
+                    campaign_work = _work_for(str(task.data["campaign_id"]))
+                    campaign_work.confirm_campaign = True
 
-    async def _rename_campaign_channel(self, task: BrokerTask) -> None:
-        """Rename a campaign channel and update associated Discord channels.
+                case BrokerTaskType.CONFIRM_BOOK_CHANNEL:
+                    if not task.data.get("campaign_id") or not task.data.get("book_id"):
+                        await self._mark_error(task)
+                        continue
 
-        Process a campaign channel rename task by fetching the campaign from the database and
-        using the channel manager to update all associated Discord channels. This ensures
-        channel names stay synchronized with campaign data.
+                    campaign_work = _work_for(str(task.data["campaign_id"]))
+                    campaign_work.book_ids.add(str(task.data["book_id"]))
 
-        Args:
-            task (BrokerTask): The broker task containing campaign_id in its data field.
+                case BrokerTaskType.CONFIRM_CHARACTER_CHANNEL:
+                    if not task.data.get("character_id"):
+                        await self._mark_error(task)
+                        continue
 
-        Returns:
-            None
+                    character = characters.get(str(task.data["character_id"]))
+                    if not character:
+                        logger.error(f"BROKER: Character {task.data['character_id']} not found")
+                        await self._mark_error(task)
+                        continue
 
-        Raises:
-            None: Sets task.has_error=True if campaign_id is invalid or campaign not found.
-        """
-        campaign = await Campaign.get(task.data.get("campaign_id"), fetch_links=True)
-        if not campaign:
-            task.has_error = True
-            await task.save()
-            return
+                    campaign_work = _work_for(character.campaign)
+                    campaign_work.characters[str(character.id)] = character
 
-        channel_manager = ChannelManager(guild=self.discord_guild)
-        await channel_manager.confirm_campaign_channels(campaign)
+                case _:
+                    await self._mark_error(task)
+                    continue
 
-    async def _rebuild_book_channels(self) -> None:
-        """Delete and recreate all book channels in the Discord guild.
+            campaign_work.tasks.append(task)
 
-        Process all pending book channel tasks by deleting existing book channels and recreating them
-        with updated names and positions. This ensures channel names and order stay synchronized with
-        book data in the database.
+        for campaign_work in work.values():
+            if campaign_work.confirm_campaign:
+                campaign_work.book_ids.clear()
+                campaign_work.characters.clear()
 
-        Returns:
-            None: This method modifies Discord channels but does not return a value.
+        return list(work.values())
 
-        Note:
-            This is an expensive operation that should be used sparingly, as it involves multiple
-            Discord API calls with rate limiting considerations.
+    async def _run_campaign_work(self, campaign_work: CampaignChannelWork) -> None:
+        """Run the coalesced channel work for a single campaign.
+
+        Args:
+            campaign_work (CampaignChannelWork): The work to run.
         """
-        # Find all pending book chapter channel tasks for this guild
-        tasks = await BrokerTask.find_many(
-            BrokerTask.guild_id == self.discord_guild.id,
-            BrokerTask.task == BrokerTaskType.CONFIRM_BOOK_CHANNEL,
-            BrokerTask.has_error == False,  # noqa: E712
-        ).to_list()
+        async with self.semaphore:
+            campaign = (
+                await Campaign.get(campaign_work.campaign_id, fetch_links=True)
+                if campaign_work.campaign_id
+                else None
+            )
 
-        if not tasks:
-            return
+            if campaign_work.confirm_campaign:
+                if not campaign:
+                    for task in campaign_work.tasks:
+                        await self._mark_error(task)
+                    return
 
-        channel_manager = ChannelManager(guild=self.discord_guild)
+                await self.channel_manager.confirm_campaign_channels(campaign)
 
-        # Track campaigns and books to avoid duplicate processing
-        # We need to track campaigns separately since multiple books can be in the same campaign
-        campaigns_to_sort = set()
-        books_processed = set()
+            for book_id in campaign_work.book_ids:
+                book = await CampaignBook.get(book_id)
+                if book:
+                    await self.channel_manager.confirm_book_channel(book=book, campaign=campaign)
 
-        for task in tasks:
-            # Skip invalid tasks that are missing required data
-            if not task.data.get("campaign_id") or not task.data.get("book_id"):
-                task.has_error = True
-                await task.save()
-                continue
-
-            campaigns_to_sort.add(task.data["campaign_id"])
-            books_processed.add(task.data["book_id"])
-
-            # Only process each book once to avoid unnecessary Discord API calls
-            if not task.data["book_id"] not in books_processed:
-                book = await CampaignBook.get(task.data["book_id"])
-                await channel_manager.confirm_book_channel(book=book)
-                # Sleep to avoid hitting Discord rate limits
-                await asyncio.sleep(1)
-
-            await task.delete()
-
-        # After processing all books, sort channels in each affected campaign
-        # This ensures proper ordering of channelsafter any book changes
-        for campaign in campaigns_to_sort:
-            await channel_manager.sort_campaign_channels(
-                await Campaign.get(campaign, fetch_links=True),
-            )
+            for character in campaign_work.characters.values():
+                await self.channel_manager.confirm_character_channel(
+                    character=character,
+                    campaign=campaign,
+                )
 
-        logger.info(f"BROKER: {len(tasks)} book channel tasks completed")
+            # Sort once after all book channels in the campaign have been confirmed
+            if campaign_work.book_ids and campaign:
+                await self.channel_manager.sort_campaign_channels(campaign)
+
+        await self._delete_tasks(campaign_work.tasks)
+        self._log_completed(campaign_work.tasks)
 
     async def run(self) -> None:
         """Poll database for pending tasks and execute them.
 
-        Fetches all incomplete tasks for this guild from the database and processes them based on their type. After each task is executed, marks it as completed and saves the updated state.
+        Fetch all incomplete tasks for this guild with a single query, coalesce duplicates, and run the resulting work. A REBUILD_CHANNELS task supersedes every other task as it recreates all channels in the guild.
 
         Returns:
             None
         """
-        await self._rebuild_channels()
-        await self._rebuild_book_channels()
-
         tasks = await BrokerTask.find_many(
             BrokerTask.guild_id == self.discord_guild.id,
             BrokerTask.has_error == False,  # noqa: E712
         ).to_list()
-        for task in tasks:
-            match task.task:
-                case BrokerTaskType.CONFIRM_CHARACTER_CHANNEL:
-                    await self._rename_character_channel(task)
-                    await asyncio.sleep(1)
-                case BrokerTaskType.CONFIRM_CAMPAIGN_CHANNEL:
-                    await self._rename_campaign_channel(task)
-                    await asyncio.sleep(1)
-                case _:
-                    assert_never(task)
+        if not tasks:
+            return
 
-            if task.author_name:
-                msg = f"BROKER: {task.author_name}'s task {task.task} completed"
-            else:
-                msg = f"BROKER: Task {task.task} completed"
+        logger.debug(f"BROKER: Found {len(tasks)} tasks for guild {self.discord_guild.id}")
 
-            logger.info(msg)
-            await task.delete()
+        if any(task.task == BrokerTaskType.REBUILD_CHANNELS for task in tasks):
+            await self._rebuild_channels()
+            await self._delete_tasks(tasks)
+            self._log_completed(
+                [task for task in tasks if task.task == BrokerTaskType.REBUILD_CHANNELS],
+            )
+            return
+
+        work = await self._coalesce_tasks(tasks)
+        results = await asyncio.gather(
+            *(self._run_campaign_work(campaign_work) for campaign_work in work),
+            return_exceptions=True,
+        )
+
+        # Failed work is left in the database to be retried on the next run
+        for campaign_work, result in zip(work, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"BROKER: Failed to run tasks for campaign {campaign_work.campaign_id} in guild {self.discord_guild.id}: {result}",
+                )
@@ -1,8 +1,12 @@
 """Manage buying traits with freebie points or experience."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
 
-from valentina.constants import TraitCategory, XPMultiplier
+from beanie import UpdateResponse
+from beanie.operators import Inc
+from loguru import logger
+
+from valentina.constants import TRAIT_RESTORE_ATTEMPTS, TraitCategory, XPMultiplier
 from valentina.models import Character, CharacterTrait, User
 from valentina.utils import errors
 from valentina.utils.helpers import get_trait_multiplier, get_trait_new_value
@@ -17,6 +21,12 @@ class TraitModifier:
     This class provides methods to upgrade, downgrade, and validate trait modifications
     for a given character, handling both freebie point and experience point transactions.
 
+    Points and trait values are changed with atomic `$inc` updates guarded in the database, so
+    concurrent changes from Discord and the web UI can not overwrite each other or overspend.
+    A trait is only changed if it still has the value it was priced at, and is re-priced at its
+    current value otherwise. Points are spent before a trait is raised and refunded if the trait
+    can not be raised. A lowered trait is raised again if its points can not be refunded.
+
     Attributes:
         character (Character): The character whose traits are being modified.
         user (User): The user associated with the character.
@@ -64,24 +74,119 @@ class TraitModifier:
 
         return True
 
-    async def _save_trait(self, trait: CharacterTrait) -> CharacterTrait:
-        """Save updates to a trait and ensure it's properly linked to the character.
+    async def _change_trait_value(self, trait: CharacterTrait, amount: int) -> bool:
+        """Atomically change a trait's value if it still has its value in memory, keeping it between 0 and its max value.
 
-        This method fetches all character links, adds the trait to the character,
-        and saves the changes.
+        The change is a single compare-and-set against `trait.value` on the trait embedded in the character, so a price calculated from a stale copy of the trait is never applied to a different value. Traits which are not yet in the database are added to the character with their new value.
 
         Args:
-            trait (CharacterTrait): The trait to be saved and linked.
+            trait (CharacterTrait): The trait to change. Updated in place with its new value, or with its current value when it was changed elsewhere.
+            amount (int): The amount to add to the trait's value. Negative to lower the value.
 
         Returns:
-            CharacterTrait: The saved and linked trait.
+            bool: True if the value was changed, False if the trait was changed elsewhere and must be re-priced.
 
         Raises:
-            errors.TraitExistsError: If the trait already exists for the character.
+            errors.TraitAtMaxValueError: If the change would raise the trait above its max value.
+            errors.TraitAtMinValueError: If the change would lower the trait below 0.
+            errors.TraitExistsError: If a new trait has the same name as an existing trait.
         """
-        await self.character.fetch_all_links()
-        await self.character.add_trait(trait)
-        return trait
+        if trait.id is None:
+            trait.value += amount
+            await self.character.add_trait(trait)
+            return True
+
+        # Lowering below 0 is already prevented by pricing the change at the value it is guarded on
+        if await self.character.change_embedded_trait_value(trait, amount):
+            return True
+
+        current = await self.character.fetch_embedded_trait(trait.id)
+        if current and current.value != trait.value:
+            trait.value, trait.max_value, trait.revision = (
+                current.value,
+                current.max_value,
+                current.revision,
+            )
+            return False
+
+        raise errors.TraitAtMaxValueError if amount > 0 else errors.TraitAtMinValueError
+
+    async def _restore_trait_value(self, trait: CharacterTrait, amount: int) -> None:
+        """Raise a lowered trait again after its savings could not be refunded.
+
+        The trait is raised even if it was changed elsewhere since it was lowered. Failures are logged rather than raised so the caller can re-raise the error which caused the refund to fail.
+
+        Args:
+            trait (CharacterTrait): The trait which was lowered.
+            amount (int): The amount the trait was lowered by.
+        """
+        for _ in range(TRAIT_RESTORE_ATTEMPTS):
+            try:
+                if await self._change_trait_value(trait, amount):
+                    return
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"TRAITS: Could not restore {trait.name} on {trait.character}: {e}")
+                return
+
+        logger.error(
+            f"TRAITS: Could not restore {trait.name} on {trait.character} after {TRAIT_RESTORE_ATTEMPTS} attempts"
+        )
+
+    async def _change_freebie_points(self, amount: int) -> None:
+        """Atomically add freebie points to the character, or spend them when the amount is negative.
+
+        Args:
+            amount (int): The number of freebie points to add.
+
+        Raises:
+            errors.NotEnoughFreebiePointsError: If the character does not have enough freebie points to spend.
+        """
+        query: dict = {"_id": self.character.id}
+        if amount < 0:
+            query["freebie_points"] = {"$gte": -amount}
+
+        updated = cast(
+            "Character | None",
+            await Character.find_one(query).update(
+                Inc({"freebie_points": amount}),
+                response_type=UpdateResponse.NEW_DOCUMENT,
+            ),
+        )
+        if not updated:
+            msg = "Not enough freebie points to upgrade trait"
+            raise errors.NotEnoughFreebiePointsError(msg)
+
+        self.character.freebie_points = updated.freebie_points
+
+    async def _change_campaign_xp(self, campaign: "Campaign", amount: int) -> None:
+        """Atomically add current experience to the user's campaign, or spend it when the amount is negative.
+
+        Args:
+            campaign (Campaign): The campaign associated with the experience points.
+            amount (int): The number of experience points to add.
+
+        Raises:
+            errors.NotEnoughExperienceError: If the user does not have enough experience points to spend.
+        """
+        field = f"campaign_experience.{campaign.id}.xp_current"
+        query: dict = {"_id": self.user.id}
+        if amount < 0:
+            query[field] = {"$gte": -amount}
+
+        updated = cast(
+            "User | None",
+            await User.find_one(query).update(
+                Inc({field: amount}),
+                response_type=UpdateResponse.NEW_DOCUMENT,
+            ),
+        )
+        if not updated:
+            msg = f"Can not spend {-amount} xp with only {self.user.fetch_campaign_xp(campaign)[0]} available"
+            raise errors.NotEnoughExperienceError(msg)
+
+        self.user.campaign_experience[str(campaign.id)] = updated.campaign_experience[
+            str(campaign.id)
+        ]
 
     def cost_to_upgrade(self, trait: CharacterTrait, amount: int = 1) -> int:
         """Calculate the cost to upgrade a trait by the specified amount.
@@ -175,7 +280,7 @@ class TraitModifier:
         """Downgrade a trait using freebie points.
 
         This method checks if the downgrade is possible, calculates the savings,
-        updates the character's freebie points, and saves the changes.
+        lowers the trait, and refunds the savings to the character's freebie points.
 
         Args:
             trait (CharacterTrait): The trait to be downgraded.
@@ -187,14 +292,18 @@ class TraitModifier:
         Raises:
             errors.TraitAtMinValueError: If downgrading would result in a negative trait value.
         """
-        if self.can_trait_be_downgraded(trait, amount):
+        # Re-price the downgrade whenever the trait was changed elsewhere since it was loaded
+        while True:
+            self.can_trait_be_downgraded(trait, amount)
             savings_from_downgrade = self.savings_from_downgrade(trait, amount)
+            if await self._change_trait_value(trait, -amount):
+                break
 
-            self.character.freebie_points = self.character.freebie_points + savings_from_downgrade
-            trait.value = trait.value - amount
-
-            await self.character.save()
-            await self._save_trait(trait)
+        try:
+            await self._change_freebie_points(savings_from_downgrade)
+        except Exception:
+            await self._restore_trait_value(trait, amount)
+            raise
 
         return trait
 
@@ -207,7 +316,7 @@ class TraitModifier:
         """Downgrade a trait using experience points.
 
         This method checks if the downgrade is possible, calculates the savings,
-        adds the experience points to the user's campaign, and saves the changes.
+        lowers the trait, and adds the experience points to the user's campaign.
 
         Args:
             trait (CharacterTrait): The trait to be downgraded.
@@ -220,16 +329,18 @@ class TraitModifier:
         Raises:
             errors.TraitAtMinValueError: If downgrading would result in a negative trait value.
         """
-        if self.can_trait_be_downgraded(trait, amount):
+        # Re-price the downgrade whenever the trait was changed elsewhere since it was loaded
+        while True:
+            self.can_trait_be_downgraded(trait, amount)
             savings_from_downgrade = self.savings_from_downgrade(trait, amount)
+            if await self._change_trait_value(trait, -amount):
+                break
 
-            await self.user.add_campaign_xp(
-                campaign,
-                savings_from_downgrade,
-                increase_lifetime=False,
-            )
-            trait.value = trait.value - amount
-            await self._save_trait(trait)
+        try:
+            await self._change_campaign_xp(campaign, savings_from_downgrade)
+        except Exception:
+            await self._restore_trait_value(trait, amount)
+            raise
 
         return trait
 
@@ -237,7 +348,7 @@ class TraitModifier:
         """Upgrade a trait using freebie points.
 
         This method checks if the upgrade is possible, calculates the cost,
-        deducts the freebie points from the character, and saves the changes.
+        deducts the freebie points from the character, and raises the trait.
 
         Args:
             trait (CharacterTrait): The trait to be upgraded.
@@ -250,21 +361,27 @@ class TraitModifier:
             errors.TraitAtMaxValueError: If upgrading would exceed the trait's maximum value.
             errors.NotEnoughFreebiePointsError: If the character doesn't have enough freebie points.
         """
-        self.can_trait_be_upgraded(trait, amount)
+        # Re-price the upgrade whenever the trait was changed elsewhere since it was loaded
+        while True:
+            self.can_trait_be_upgraded(trait, amount)
 
-        cost_to_upgrade = self.cost_to_upgrade(trait, amount)
+            cost_to_upgrade = self.cost_to_upgrade(trait, amount)
 
-        if self.character.freebie_points < cost_to_upgrade:
-            msg = "Not enough freebie points to upgrade trait"
-            raise errors.NotEnoughFreebiePointsError(msg)
+            if self.character.freebie_points < cost_to_upgrade:
+                msg = "Not enough freebie points to upgrade trait"
+                raise errors.NotEnoughFreebiePointsError(msg)
 
-        self.character.freebie_points = self.character.freebie_points - cost_to_upgrade
-        trait.value = trait.value + amount
+            await self._change_freebie_points(-cost_to_upgrade)
+            try:
+                changed = await self._change_trait_value(trait, amount)
+            except Exception:
+                await self._change_freebie_points(cost_to_upgrade)
+                raise
 
-        await self.character.save()
-        await self._save_trait(trait)
+            if changed:
+                return trait
 
-        return trait
+            await self._change_freebie_points(cost_to_upgrade)
 
     async def upgrade_with_xp(
         self,
@@ -275,7 +392,7 @@ class TraitModifier:
         """Upgrade a trait using experience points.
 
         This method checks if the upgrade is possible, calculates the cost,
-        spends the experience points from the user's campaign, and saves the changes.
+        spends the experience points from the user's campaign, and raises the trait.
 
         Args:
             trait (CharacterTrait): The trait to be upgraded.
@@ -289,12 +406,24 @@ class TraitModifier:
             errors.TraitAtMaxValueError: If upgrading would exceed the trait's maximum value.
             errors.NotEnoughXPError: If the user doesn't have enough experience points in the campaign.
         """
-        self.can_trait_be_upgraded(trait, amount)
+        # Re-price the upgrade whenever the trait was changed elsewhere since it was loaded
+        while True:
+            self.can_trait_be_upgraded(trait, amount)
 
-        cost_to_upgrade = self.cost_to_upgrade(trait, amount)
+            cost_to_upgrade = self.cost_to_upgrade(trait, amount)
 
-        await self.user.spend_campaign_xp(campaign, cost_to_upgrade)
-        trait.value = trait.value + amount
-        await self._save_trait(trait)
+            if (xp_current := self.user.fetch_campaign_xp(campaign)[0]) < cost_to_upgrade:
+                msg = f"Can not spend {cost_to_upgrade} xp with only {xp_current} available"
+                raise errors.NotEnoughExperienceError(msg)
 
-        return trait
+            await self._change_campaign_xp(campaign, -cost_to_upgrade)
+            try:
+                changed = await self._change_trait_value(trait, amount)
+            except Exception:
+                await self._change_campaign_xp(campaign, cost_to_upgrade)
+                raise
+
+            if changed:
+                return trait
+
+            await self._change_campaign_xp(campaign, cost_to_upgrade)
@@ -2,6 +2,7 @@
 
 import asyncio
 import inspect
+from collections import defaultdict
 from datetime import UTC, datetime
 from typing import Any
 
@@ -13,14 +14,25 @@ from beanie.operators import Set
 from discord.ext import commands, tasks
 from loguru import logger
 
-from valentina.constants import COGS_PATH, EmbedColor, LogLevel, WebUIEnvironment
+from valentina.constants import (
+    COGS_PATH,
+    MAX_CONCURRENT_GUILD_PROVISIONS,
+    EmbedColor,
+    LogLevel,
+    WebUIEnvironment,
+)
 from valentina.controllers import TaskBroker
 from valentina.models import (
     ChangelogPoster,
+    Character,
     GlobalProperty,
     User,
 )
 from valentina.models import Guild as DBGuild
+from valentina.models.aws import aws_service
+from valentina.models.broker_task import broker_task_notifier
+from valentina.models.probability import probability_table
+from valentina.models.statistics import roll_statistic_writer
 from valentina.utils import ValentinaConfig, errors
 from valentina.utils.database import init_database
 from valentina.webui import create_app
@@ -215,6 +227,12 @@ class Valentina(commands.Bot):
         self.sync_roles_to_db.start()
         self.run_task_broker.start()
         self.webui_mode = webui_mode
+        self.task_broker_locks: defaultdict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self.task_dispatcher: asyncio.Task | None = None
+        self.trait_migration: asyncio.Task | None = None
+        self.guild_provisioning: asyncio.Task | None = None
+        self.s3_indexing: asyncio.Task | None = None
+        self.s3_region: asyncio.Task | None = None
 
         # Load Cogs
         # #######################
@@ -330,33 +348,37 @@ class Valentina(commands.Bot):
         )
 
         # Add/Update the users in the database
-        for member in guild.members:
-            if not member.bot:
-                logger.debug(f"DATABASE: Update user `{member.name}`")
-
-                user = await User.find_one(User.id == member.id).upsert(
-                    Set(
-                        {
-                            "date_modified": datetime.now(UTC).replace(microsecond=0),
-                            "name": member.display_name,
-                            "avatar_url": str(member.display_avatar.url),
-                        },
-                    ),
-                    on_insert=User(
-                        id=member.id,
-                        name=member.display_name,
-                        avatar_url=str(member.display_avatar.url),
-                    ),
-                    response_type=UpdateResponse.NEW_DOCUMENT,
-                )
-                if guild.id not in user.guilds:
-                    user.guilds.append(guild.id)
-                    await user.save()
+        await User.provision_guild_members(
+            guild.id,
+            {
+                member.id: (member.display_name, str(member.display_avatar.url))
+                for member in guild.members
+                if not member.bot
+            },
+        )
+
         # Setup the necessary roles in the guild
         await guild_object.setup_roles(guild)
 
         logger.info(f"CONNECT: Playing on {guild.name} ({guild.id})")
 
+    async def _provision_guilds(self) -> None:
+        """Provision every connected guild and post its changelog, several guilds at a time."""
+        guilds = list(self.guilds)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GUILD_PROVISIONS)
+
+        async def provision(guild: discord.Guild) -> None:
+            async with semaphore:
+                await self._provision_guild(guild)
+                await self.post_changelog_to_guild(guild)
+
+        results = await asyncio.gather(
+            *(provision(guild) for guild in guilds), return_exceptions=True
+        )
+        for guild, result in zip(guilds, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"CONNECT: Failed to provision {guild.name} ({guild.id}): {result}")
+
     async def on_ready(self) -> None:
         """Override the on_ready method to initialize essential bot tasks.
 
@@ -398,20 +420,50 @@ class Valentina(commands.Bot):
                 db_global_properties.versions.append(self.version)
                 await db_global_properties.save()
 
-            # Work with connected guilds
-            for guild in self.guilds:
-                await self._provision_guild(guild)
-                await self.post_changelog_to_guild(guild)
+            # Migrate characters to embedded traits while the bot serves requests
+            self.trait_migration = asyncio.create_task(Character.embed_linked_traits())
+
+            # Precompute dice roll probabilities so lookups never calculate on demand
+            if not probability_table.is_built:
+                await probability_table.warm()
+
+            # Provision connected guilds in the background so the bot is ready without waiting on them
+            self.guild_provisioning = asyncio.create_task(self._provision_guilds())
+
+            # Index the S3 bucket in the background so image autocomplete and review do not wait on listing it
+            if aws_service.is_configured:
+                self.s3_indexing = aws_service.index.refresh()
+                # Cache the bucket's region so object URLs use its regional endpoint
+                self.s3_region = asyncio.create_task(aws_service.region())
 
         self.welcomed = True
         logger.info(f"{self.user} is ready")
 
+        # Run the task broker as soon as tasks are created rather than waiting for the next poll
+        if not self.task_dispatcher or self.task_dispatcher.done():
+            self.task_dispatcher = asyncio.create_task(self.dispatch_broker_tasks())
+
         # Create the web server if not in testing mode
         if self.webui_mode != WebUIEnvironment.TESTING:
             logger.debug(f"WEBUI MODE: {self.webui_mode.value}")
             logger.info("WEBUI: Creating web server")
             await create_app(self.webui_mode)
 
+    async def close(self) -> None:
+        """Stop the background tasks and write any buffered roll statistics to the database before closing the bot."""
+        for task in (
+            self.task_dispatcher,
+            self.trait_migration,
+            self.guild_provisioning,
+            self.s3_indexing,
+            self.s3_region,
+        ):
+            if task:
+                task.cancel()
+
+        await roll_statistic_writer.close()
+        await super().close()
+
     async def get_guild_from_id(self, guild_id: int) -> discord.Guild | None:
         """Get a discord guild object from a guild ID.
 
@@ -450,16 +502,13 @@ class Valentina(commands.Bot):
 
     @tasks.loop(minutes=30)
     async def sync_roles_to_db(self) -> None:
-        """Synchronize guild-user role lists with Discord role changes.
-
-        Monitor and update the database to reflect role changes made through the Discord interface.
-        Check for administrator permissions and storyteller roles, adding or removing users
-        from the corresponding database lists as needed.
+        """Reconcile guild-user role lists with Discord role changes.
 
-        The task runs every 10 minutes to:
+        Role changes are applied as they happen by the member and role update event listeners.
+        This task runs every 30 minutes as a reconciliation pass to catch any missed events:
         - Add/remove administrators based on Discord permissions
         - Add/remove storytellers based on role assignments
-        - Keep database role lists in sync with Discord state
+        - Write each guild's lists only when they differ from Discord state
 
         Returns:
             None
@@ -467,51 +516,52 @@ class Valentina(commands.Bot):
         logger.info("SYNC: Running sync_roles_to_db task")
         for guild in self.guilds:
             db_guild = await DBGuild.get(guild.id)
-            for member in [x for x in guild.members if not x.bot]:
-                if (
-                    member.guild_permissions.administrator
-                    and member.id not in db_guild.administrators
-                ):
-                    db_guild.administrators.append(member.id)
-                    await db_guild.save()
-                    logger.info(f"PERMS: Add {member.name} as administrator in database")
-
-                if (
-                    not member.guild_permissions.administrator
-                    and member.id in db_guild.administrators
-                ):
-                    db_guild.administrators.remove(member.id)
-                    await db_guild.save()
-                    logger.info(f"PERMS: Remove {member.name} as administrator in database")
-
-                if (
-                    any(role.name in ("Storyteller", "@Storyteller") for role in member.roles)
-                    and member.id not in db_guild.storytellers
-                ):
-                    db_guild.storytellers.append(member.id)
-                    await db_guild.save()
-                    logger.info(f"PERMS: Add {member.name} as @Storyteller in database")
-
-                if (
-                    not any(role.name in ("Storyteller", "@Storyteller") for role in member.roles)
-                    and member.id in db_guild.storytellers
-                ):
-                    db_guild.storytellers.remove(member.id)
-                    await db_guild.save()
-                    logger.info(f"PERMS: Remove {member.name} as @Storyteller in database")
+            if db_guild:
+                await db_guild.sync_roles(guild)
+
+    async def _run_task_brokers(self, guilds: list[discord.Guild]) -> None:
+        """Run the task broker for each guild concurrently.
+
+        A lock per guild ensures the polling loop and the task dispatcher never process the same guild's tasks at the same time.
+
+        Args:
+            guilds (list[discord.Guild]): The guilds to run the task broker for.
+        """
+
+        async def _run(guild: discord.Guild) -> None:
+            async with self.task_broker_locks[guild.id]:
+                await TaskBroker(guild).run()
+
+        results = await asyncio.gather(*(_run(guild) for guild in guilds), return_exceptions=True)
+        for guild, result in zip(guilds, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"BROKER: Task broker failed for guild {guild.name}: {result}")
+
+    async def dispatch_broker_tasks(self) -> None:
+        """Run the task broker for a guild as soon as tasks are created for it.
+
+        Tasks are announced by the BrokerTask notifier, either from this process or from a MongoDB change stream. The run_task_broker loop continues to poll as a fallback.
+        """
+        watcher = asyncio.create_task(broker_task_notifier.watch())
+        try:
+            while not self.is_closed():
+                guild_ids = await broker_task_notifier.wait()
+                logger.debug(f"BROKER: Dispatch tasks for {len(guild_ids)} guilds")
+                await self._run_task_brokers([g for g in self.guilds if g.id in guild_ids])
+        finally:
+            watcher.cancel()
 
     @tasks.loop(minutes=2)
     async def run_task_broker(self) -> None:
         """Process pending tasks from the task broker database.
 
         Scan the task broker database for each connected guild and execute any pending tasks.
-        Tasks are processed sequentially through the TaskBroker class which handles task
-        execution and cleanup.
+        Guilds are processed concurrently through the TaskBroker class which handles task
+        coalescing, execution, and cleanup. This polling loop is the fallback for tasks the
+        task dispatcher was not notified of.
         """
         logger.debug("SYNC: Checking for tasks")
-        for guild in self.guilds:
-            task_broker = TaskBroker(guild)
-            await task_broker.run()
+        await self._run_task_brokers(list(self.guilds))
 
     @run_task_broker.before_loop
     async def before_run_task_broker(self) -> None:
@@ -4,7 +4,6 @@ from typing import cast
 
 import discord
 import inflect
-from beanie import DeleteRules
 from discord.ext import pages
 from discord.ui import Button
 from loguru import logger
@@ -19,7 +18,7 @@ from valentina.constants import (
     RNGCharLevel,
     VampireClan,
 )
-from valentina.controllers import ChannelManager, RNGCharGen, delete_character
+from valentina.controllers import ChannelManager, RNGCharGen
 from valentina.discord.bot import Valentina, ValentinaContext
 from valentina.discord.views import ChangeNameModal, sheet_embed
 from valentina.models import Campaign, Character, User
@@ -440,28 +439,18 @@ class CharGenWizard:  # pragma: no cover
             show_footer=False,
         )
 
-    async def _cancel_character_generation(
-        self,
-        msg: str | None = None,
-        characters: list[Character] = [],
-    ) -> None:
-        """Cancel the character generation process and clean up resources.
+    async def _cancel_character_generation(self, msg: str | None = None) -> None:
+        """Cancel the character generation process.
 
-        This method handles the cancellation of character generation, deleting any partially
-        created characters and displaying a cancellation message to the user.
+        Display a cancellation message to the user. Characters presented by the wizard are drafts which were never written to the database, so there is nothing to clean up.
 
         Args:
             msg (str | None): Custom message to display upon cancellation. If None, a default
                 message is used.
-            characters (list[Character]): List of Character objects to be deleted. These are
-                typically partially created characters that need to be removed from the database.
         """
         if not msg:
             msg = "No character was created."
 
-        for character in characters:
-            await delete_character(character)
-
         embed = discord.Embed(
             title=f"{EmojiDict.CANCEL} Cancelled",
             description=msg,
@@ -548,9 +537,10 @@ Once you select a character you can re-allocate dots and change the name, but yo
     async def present_character_choices(self) -> None:
         """Guide the user through the character selection process.
 
-        Generate three random characters and present them to the user for selection.
+        Generate three random draft characters and present them to the user for selection.
         Display character details using a paginator, allowing the user to review
-        and choose a character, reroll for new options, or cancel the process.
+        and choose a character, reroll for new options, or cancel the process. Drafts live
+        only in memory and only the selected character is written to the database.
 
         This method handles the core logic of character generation and selection,
         including trait assignment and presentation of character options.
@@ -560,10 +550,10 @@ Once you select a character you can re-allocate dots and change the name, but yo
         """
         logger.debug("Starting the character selection process")
 
-        # Generate 3 characters
-        characters = [
-            await self.engine.generate_full_character(chargen_character=True) for _ in range(3)
-        ]
+        # Generate 3 draft characters
+        characters = await self.engine.generate_full_characters(
+            3, chargen_character=True, draft=True
+        )
 
         # Add the pages to the paginator
         description = f"## Created {len(characters)} {p.plural_noun('character', len(characters))} for you to choose from\n"
@@ -611,48 +601,33 @@ Once you select a character you can re-allocate dots and change the name, but yo
         if view.cancelled:
             await self._cancel_character_generation(
                 msg="No character was created but you lost 10 XP for wasting my time.",
-                characters=characters,
             )
             return
 
         if view.reroll:
             campaign_xp, _, _ = self.user.fetch_campaign_xp(self.campaign)
 
-            # Delete the previously created characters
-            logger.debug("Rerolling characters and deleting old ones.")
-            for character in characters:
-                await delete_character(character)
+            # Discard the draft characters
+            logger.debug("Rerolling characters.")
 
             # Check if the user has enough XP to reroll
             if campaign_xp < 10:  # noqa: PLR2004
-                await self._cancel_character_generation(
-                    msg="Not enough XP to reroll.",
-                    characters=characters,
-                )
+                await self._cancel_character_generation(msg="Not enough XP to reroll.")
                 return
 
             # Restart the character generation process
             await self.start(restart=True)
 
         if view.pick_character:
+            # Add the selected character into the database. The other drafts are discarded.
             selected_character = view.selected
+            selected_character.freebie_points = STARTING_FREEBIE_POINTS
+            selected_character.type_player = True
+            selected_character.type_chargen = False
+            await selected_character.insert_with_traits()
 
-            for c in characters:
-                if c.id != selected_character.id:
-                    # Delete the characters the user did not select
-                    await c.delete(link_rule=DeleteRules.DELETE_LINKS)
-
-                if c.id == selected_character.id:
-                    # Add the player into the database
-                    c.freebie_points = STARTING_FREEBIE_POINTS
-                    c.type_player = True
-                    c.type_chargen = False
-                    await c.save()
-
-                    self.user.characters.append(c)
-                    await self.user.save()
-
-                    selected_character = c
+            self.user.characters.append(selected_character)
+            await self.user.save()
 
             # Post-process the character
             await self.finalize_character_selection(selected_character)
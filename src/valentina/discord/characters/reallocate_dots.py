@@ -265,4 +265,4 @@ class DotsReallocationWizard:  # pragma: no cover
         # Delete the embed after a short delay
         await self.msg.delete(delay=5.0)
 
-        return await Character.get(self.character.id, fetch_links=True)
+        return await Character.get_with_traits(self.character.id, links=("inventory",))
@@ -166,4 +166,4 @@ class SpendFreebiePoints(discord.ui.View):  # pragma: no cover
 
         await trait_modifier.upgrade_with_freebie(self.trait)
 
-        return await Character.get(self.character.id, fetch_links=True)
+        return await Character.get_with_traits(self.character.id, links=("inventory",))
@@ -13,6 +13,7 @@ from valentina.constants import (
     CharClass,
     EmbedColor,
     EmojiDict,
+    ImageVariant,
     RNGCharLevel,
 )
 from valentina.controllers import ChannelManager, PermissionManager
@@ -49,7 +50,7 @@ from valentina.discord.views import (
     present_embed,
     show_sheet,
 )
-from valentina.models import AWSService, Character, CharacterSheetSection, CharacterTrait, User
+from valentina.models import Character, CharacterSheetSection, CharacterTrait, User
 from valentina.utils import errors
 from valentina.utils.helpers import (
     fetch_data_from_url,
@@ -64,7 +65,6 @@ class CharactersCog(commands.Cog, name="Character"):
 
     def __init__(self, bot: Valentina) -> None:
         self.bot: Valentina = bot
-        self.aws_svc = AWSService()
 
     chars = discord.SlashCommandGroup("character", "Work with characters")
     bio = chars.create_subgroup("bio", "Add or update a character's biography")
@@ -421,14 +421,14 @@ class CharactersCog(commands.Cog, name="Character"):
         # Upload image and add to character
         # We upload the image prior to the confirmation step to allow us to display the image to the user.  If the user cancels the confirmation, we must delete the image from S3 and from the character object.
         image_key = await character.add_image(extension=extension, data=data)  # type: ignore [arg-type]
-        image_url = self.aws_svc.get_url(image_key)
+        image_url = character.image_url(image_key, ImageVariant.THUMBNAIL)
 
         title = f"Add image to `{character.name}`"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx,
             title,
             hidden=hidden,
-            image=image_url,
+            thumbnail=image_url,
             audit=True,
         )
         if not is_confirmed:
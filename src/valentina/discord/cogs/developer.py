@@ -34,7 +34,6 @@ from valentina.discord.utils.autocomplete import (
 from valentina.discord.utils.converters import ValidCampaign, ValidCharClass
 from valentina.discord.views import confirm_action, present_embed
 from valentina.models import (
-    AWSService,
     Campaign,
     CampaignBook,
     CampaignBookChapter,
@@ -45,9 +44,12 @@ from valentina.models import (
     GlobalProperty,
     InventoryItem,
     RollProbability,
+    RollStatisticRollup,
     User,
 )
 from valentina.models import Guild as DBGuild
+from valentina.models.aws import aws_service
+from valentina.models.probability import probability_table
 from valentina.utils import ValentinaConfig, instantiate_logger
 
 p = inflect.engine()
@@ -58,7 +60,6 @@ class Developer(commands.Cog):
 
     def __init__(self, bot: Valentina) -> None:
         self.bot: Valentina = bot
-        self.aws_svc = AWSService()
 
     developer = discord.SlashCommandGroup(
         "developer",
@@ -120,7 +121,7 @@ class Developer(commands.Cog):
             None
         """
         # Fetch the URL of the image to be deleted
-        url = self.aws_svc.get_url(key)
+        url = aws_service.get_url(key)
 
         # Confirm the deletion action
         title = f"Delete `{key}` from S3"
@@ -136,7 +137,7 @@ class Developer(commands.Cog):
 
         # Delete the object from S3
         # TODO: Search for the url in character data and delete it there too so we don't have dead links
-        self.aws_svc.delete_object(key)
+        await aws_service.delete_object(key)
 
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
@@ -477,7 +478,7 @@ class Developer(commands.Cog):
 
     @server.command(
         name="clear_probability_cache",
-        description="Clear probability data from the database",
+        description="Clear probability data from the database and rebuild the probability table",
     )
     @commands.is_owner()
     async def clear_probability_cache(
@@ -489,10 +490,10 @@ class Developer(commands.Cog):
             default=True,
         ),
     ) -> None:
-        """Clear probability data from the database."""
+        """Clear probability data from the database and rebuild the in-memory probability table."""
         results = await RollProbability.find_all().to_list()
 
-        title = f"Clear `{len(results)}` probability {p.plural_noun('statistic', len(results))} from the database"
+        title = f"Clear `{len(results)}` probability {p.plural_noun('statistic', len(results))} from the database and rebuild the probability table"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx,
             title,
@@ -504,6 +505,36 @@ class Developer(commands.Cog):
         for result in results:
             await result.delete()
 
+        await probability_table.warm()
+
+        await interaction.edit_original_response(embed=confirmation_embed, view=None)
+
+    @server.command(
+        name="rebuild_statistic_rollups",
+        description="Rebuild the daily roll statistic rollups from every logged roll",
+    )
+    @commands.is_owner()
+    async def rebuild_statistic_rollups(
+        self,
+        ctx: ValentinaContext,
+        hidden: Option(
+            bool,
+            description="Make the response only visible to you (default true).",
+            default=True,
+        ),
+    ) -> None:
+        """Rebuild the daily roll statistic rollups from every logged roll."""
+        title = "Rebuild the daily roll statistic rollups from every logged roll"
+        is_confirmed, interaction, confirmation_embed = await confirm_action(
+            ctx,
+            title,
+            hidden=hidden,
+        )
+        if not is_confirmed:
+            return
+
+        await RollStatisticRollup.rebuild()
+
         await interaction.edit_original_response(embed=confirmation_embed, view=None)
 
     @server.command(name="reload", description="Reload all cogs")
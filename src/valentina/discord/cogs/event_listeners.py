@@ -7,11 +7,17 @@ from beanie.operators import Set
 from discord.ext import commands
 from loguru import logger
 
-from valentina.constants import BAD_WORD_PATTERN, BOT_DESCRIPTIONS, EmbedColor
+from valentina.constants import (
+    BAD_WORD_PATTERN,
+    BOT_DESCRIPTIONS,
+    STORYTELLER_ROLE_NAMES,
+    EmbedColor,
+)
 from valentina.discord.bot import Valentina
 from valentina.models import Guild as DBGuild
 from valentina.models import User
 from valentina.models.errors import reporter
+from valentina.utils.channel_cache import channel_cache
 from valentina.utils.helpers import time_now
 
 
@@ -146,6 +152,30 @@ class Events(commands.Cog, name="Events"):
             on_insert=User(id=member.id, name=member.display_name),
         )
 
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member) -> None:
+        """Update the guild's administrators and storytellers when a member's roles change."""
+        if after.bot or DBGuild.member_roles(before) == DBGuild.member_roles(after):
+            return
+
+        await DBGuild.sync_member_roles(after)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role) -> None:
+        """Resynchronize the guild's administrators and storytellers when a role grants or revokes them."""
+        if before.permissions.administrator == after.permissions.administrator and (
+            before.name in STORYTELLER_ROLE_NAMES
+        ) == (after.name in STORYTELLER_ROLE_NAMES):
+            return
+
+        if db_guild := await DBGuild.get(after.guild.id):
+            await db_guild.sync_roles(after.guild)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Forget the campaign, book, and character a deleted channel belonged to."""
+        channel_cache.invalidate(channel.id)
+
     @commands.Cog.listener()
     async def on_guild_join(self, guild: discord.Guild) -> None:
         """Called when the bot joins a guild."""
@@ -2,7 +2,7 @@
 """Miscellaneous commands."""
 
 import random
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import arrow
 import discord
@@ -28,7 +28,7 @@ from valentina.models import (
     User,
 )
 from valentina.models import Guild as DBGuild
-from valentina.utils.helpers import fetch_random_name
+from valentina.utils.names import name_generator
 
 p = inflect.engine()
 
@@ -134,6 +134,12 @@ Roles  : {", ".join([f"@{x.name}" if not x.name.startswith("@") else x.name for
         self,
         ctx: ValentinaContext,
         member: Option(discord.Member, required=False),
+        days: Option(
+            int,
+            description="Only include rolls from the last number of days (default all rolls)",
+            required=False,
+            min_value=1,
+        ),
         hidden: Option(
             bool,
             description="Make the statistics only visible to you (default true).",
@@ -141,7 +147,7 @@ Roles  : {", ".join([f"@{x.name}" if not x.name.startswith("@") else x.name for
         ),
     ) -> None:
         """Display roll statistics for the guild or a specific user."""
-        stats = Statistics(ctx)
+        stats = Statistics(ctx, timeframe=timedelta(days=days) if days else None)
         if member:
             embed = await stats.user_statistics(member, as_embed=True)
         else:
@@ -336,7 +342,7 @@ Roles  : {", ".join([f"@{x.name}" if not x.name.startswith("@") else x.name for
         """Generate a random name."""
         name_list = [
             f"- {name[0].title()} {name[1].title()}\n"
-            for name in await fetch_random_name(gender=gender, country=country, results=number)
+            for name in name_generator.random_names(gender=gender, country=country, count=number)
         ]
 
         await ctx.respond(
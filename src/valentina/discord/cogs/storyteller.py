@@ -15,6 +15,7 @@ from valentina.constants import (
     CharClass,
     DiceType,
     EmbedColor,
+    ImageVariant,
 )
 from valentina.controllers import ChannelManager, RNGCharGen, delete_character
 from valentina.discord.bot import Valentina, ValentinaContext
@@ -53,7 +54,7 @@ from valentina.discord.views import (
     sheet_embed,
     show_sheet,
 )
-from valentina.models import AWSService, Character, CharacterTrait, User
+from valentina.models import Character, CharacterTrait, User
 from valentina.utils.helpers import (
     fetch_data_from_url,
 )
@@ -66,7 +67,6 @@ class StoryTeller(commands.Cog):
 
     def __init__(self, bot: Valentina) -> None:
         self.bot: Valentina = bot
-        self.aws_svc = AWSService()
 
     storyteller = discord.SlashCommandGroup(
         "storyteller",
@@ -549,14 +549,14 @@ class StoryTeller(commands.Cog):
         # Upload image and add to character
         # We upload the image prior to the confirmation step to allow us to display the image to the user.  If the user cancels the confirmation, we must delete the image from S3 and from the character object.
         image_key = await character.add_image(extension=extension, data=data)
-        image_url = self.aws_svc.get_url(image_key)
+        image_url = character.image_url(image_key, ImageVariant.THUMBNAIL)
 
         title = f"Add image to `{character.name}`"
         is_confirmed, interaction, confirmation_embed = await confirm_action(
             ctx,
             title,
             hidden=hidden,
-            image=image_url,
+            thumbnail=image_url,
             audit=True,
         )
 
@@ -6,6 +6,7 @@ from .discord_utils import (
     create_storyteller_role,
     fetch_channel_object,
     get_user_from_id,
+    resolve_channel,
     set_channel_perms,
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "create_storyteller_role",
     "fetch_channel_object",
     "get_user_from_id",
+    "resolve_channel",
     "set_channel_perms",
 ]
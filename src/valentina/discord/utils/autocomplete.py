@@ -4,11 +4,12 @@ from typing import TYPE_CHECKING, cast
 
 import discord
 import inflect
-from beanie.operators import And
+from beanie import PydanticObjectId
 from discord.commands import OptionChoice
 
 from valentina.constants import (
     MAX_OPTION_LIST_SIZE,
+    S3_INDEX_WAIT,
     CharacterConcept,
     CharClass,
     EmojiDict,
@@ -16,9 +17,16 @@ from valentina.constants import (
     TraitCategory,
     VampireClan,
 )
-from valentina.discord.utils import fetch_channel_object
-from valentina.models import AWSService, Campaign, ChangelogParser, Character, User
+from valentina.discord.utils import fetch_channel_object, resolve_channel
+from valentina.models import Campaign, CampaignBook, ChangelogParser, Character, User
+from valentina.models.aws import aws_service
 from valentina.utils import errors
+from valentina.utils.autocomplete_index import (
+    IndexEntry,
+    IndexKind,
+    SearchIndex,
+    autocomplete_index,
+)
 from valentina.utils.helpers import truncate_string
 
 MAX_OPTION_LENGTH = 99
@@ -27,11 +35,151 @@ if TYPE_CHECKING:
     from valentina.discord.bot import Valentina
 
 
+################## Autocomplete Indexes ##################
+async def _character_index(guild_id: int) -> SearchIndex:
+    """Return the cached search index of a guild's characters.
+
+    Args:
+        guild_id (int): The id of the guild.
+
+    Returns:
+        SearchIndex: The guild's characters with their owners' names.
+    """
+
+    async def load() -> list[IndexEntry]:
+        characters = await (
+            Character.get_pymongo_collection()
+            .find(
+                {"guild": guild_id},
+                projection=[
+                    "campaign",
+                    "is_alive",
+                    "name_first",
+                    "name_last",
+                    "type_chargen",
+                    "type_player",
+                    "type_storyteller",
+                    "user_owner",
+                ],
+            )
+            .to_list()
+        )
+        owner_ids = list({x.get("user_owner") for x in characters})
+        owners = {
+            x["_id"]: x.get("name")
+            for x in await User.get_pymongo_collection()
+            .find({"_id": {"$in": owner_ids}}, projection=["name"])
+            .to_list()
+        }
+
+        return [
+            IndexEntry(
+                id=str(x["_id"]),
+                name=f"{x['name_first']} {x['name_last']}",
+                campaign=x.get("campaign"),
+                owner_id=x.get("user_owner"),
+                owner_name=owners.get(x.get("user_owner")),
+                is_alive=x.get("is_alive", True),
+                type_chargen=x.get("type_chargen", False),
+                type_player=x.get("type_player", False),
+                type_storyteller=x.get("type_storyteller", False),
+            )
+            for x in characters
+        ]
+
+    return await autocomplete_index.get(IndexKind.CHARACTERS, guild_id, load)
+
+
+async def _campaign_index(guild_id: int) -> SearchIndex:
+    """Return the cached search index of a guild's campaigns which are not deleted.
+
+    Args:
+        guild_id (int): The id of the guild.
+
+    Returns:
+        SearchIndex: The guild's campaigns.
+    """
+
+    async def load() -> list[IndexEntry]:
+        campaigns = await (
+            Campaign.get_pymongo_collection()
+            .find({"guild": guild_id, "is_deleted": False}, projection=["name"])
+            .to_list()
+        )
+        return [IndexEntry(id=str(x["_id"]), name=x["name"]) for x in campaigns]
+
+    return await autocomplete_index.get(IndexKind.CAMPAIGNS, guild_id, load)
+
+
+async def _book_index(campaign_id: PydanticObjectId | str) -> SearchIndex:
+    """Return the cached search index of a campaign's books, ordered by book number.
+
+    Args:
+        campaign_id (PydanticObjectId | str): The id of the campaign.
+
+    Returns:
+        SearchIndex: The campaign's books.
+    """
+
+    async def load() -> list[IndexEntry]:
+        campaign = await Campaign.get_pymongo_collection().find_one(
+            {"_id": PydanticObjectId(campaign_id)}, projection=["books"]
+        )
+        book_ids = [x.id for x in campaign.get("books", [])] if campaign else []
+        books = await (
+            CampaignBook.get_pymongo_collection()
+            .find({"_id": {"$in": book_ids}}, projection=["name", "number"])
+            .to_list()
+        )
+        return [IndexEntry(id=str(x["_id"]), name=x["name"], number=x["number"]) for x in books]
+
+    return await autocomplete_index.get(
+        IndexKind.BOOKS, campaign_id, load, order=lambda x: x.number
+    )
+
+
+async def _trait_index(character_id: PydanticObjectId | str) -> SearchIndex:
+    """Return the cached search index of a character's traits.
+
+    Args:
+        character_id (PydanticObjectId | str): The id of the character.
+
+    Returns:
+        SearchIndex: The character's traits.
+    """
+
+    async def load() -> list[IndexEntry]:
+        character = await Character.get_with_traits(character_id)
+        if not character:
+            return []
+
+        return [IndexEntry(id=str(x.id), name=x.name) for x in character.traits]
+
+    return await autocomplete_index.get(IndexKind.TRAITS, character_id, load)
+
+
+def _character_option(entry: IndexEntry, show_owner: bool = False) -> OptionChoice:
+    """Return the autocomplete option for an indexed character.
+
+    Args:
+        entry (IndexEntry): The indexed character.
+        show_owner (bool): Whether to show the name of the character's owner. Defaults to False.
+
+    Returns:
+        OptionChoice: The option, with dead characters marked.
+    """
+    name = entry.name if entry.is_alive else f"{EmojiDict.DEAD} {entry.name}"
+    if show_owner and entry.owner_name:
+        name += f" [@{entry.owner_name}]"
+
+    return OptionChoice(name, entry.id)
+
+
 ################## Character Autocomplete Functions ##################
 async def select_any_player_character(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     """Generate a list of all player characters in the guild for autocomplete.
 
-    Fetch all player characters for the guild, filter them based on the user's input, and return a list of OptionChoice objects to populate the autocomplete list.
+    Search the guild's player characters for the user's input and return a list of OptionChoice objects to populate the autocomplete list.
 
     Args:
         ctx (discord.AutocompleteContext): The context object containing interaction and user details.
@@ -39,37 +187,12 @@ async def select_any_player_character(ctx: discord.AutocompleteContext) -> list[
     Returns:
         list[OptionChoice]: A list of OptionChoice objects containing character names and IDs.
     """
-    # Fetch and prepare player characters
-    all_chars_owners = sorted(
-        [
-            (x, await User.get(x.user_owner))
-            async for x in Character.find(
-                And(
-                    Character.guild == ctx.interaction.guild.id,
-                    Character.type_player == True,  # noqa: E712
-                ),
-                fetch_links=True,
-            )
-        ],
-        key=lambda x: x[0].name,
-    )
-
+    index = await _character_index(ctx.interaction.guild.id)
     options = [
-        OptionChoice(
-            f"{character.name} [@{owner.name}]"
-            if character.is_alive
-            else f"{EmojiDict.DEAD} {character.name} [@{owner.name}]",
-            str(character.id),
-        )
-        for character, owner in all_chars_owners
-        if character.name.lower().startswith(ctx.value.lower())
+        _character_option(x, show_owner=True)
+        for x in index.search(ctx.value, where=lambda x: x.type_player)
     ]
 
-    # Check if the number of options exceeds the maximum allowed
-    if len(options) >= MAX_OPTION_LIST_SIZE:  # pragma: no cover
-        instructions = "Keep typing ..." if ctx.value else "Start typing a name."
-        return [OptionChoice(f"Too many characters to display. {instructions}", "")]
-
     return options or [OptionChoice("No characters available", "")]
 
 
@@ -78,7 +201,7 @@ async def select_campaign_any_player_character(
 ) -> list[OptionChoice]:  # pragma: no cover
     """Generate a list of all player characters associated with a specific campaign.
 
-    Fetch all player characters for the campaign, filter them based on the user's input, and return a list of OptionChoice objects to populate the autocomplete list.
+    Search the campaign's player characters for the user's input and return a list of OptionChoice objects to populate the autocomplete list.
 
     Args:
         ctx (discord.AutocompleteContext): The context object containing interaction and user details.
@@ -86,43 +209,19 @@ async def select_campaign_any_player_character(
     Returns:
         list[discord.OptionChoice]: A list of OptionChoice objects containing character names and IDs for the autocomplete list.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    campaign = channel_objects.campaign
+    campaign_id = (await resolve_channel(ctx)).campaign_id
 
-    if not campaign:
+    if not campaign_id:
         return [OptionChoice("Rerun in a channel associated with a campaign", "")]
 
-    # Fetch and prepare player characters
-    all_chars_owners = sorted(
-        [
-            (x, await User.get(x.user_owner))
-            async for x in Character.find(
-                And(
-                    Character.campaign == str(campaign.id),
-                    Character.type_player == True,  # noqa: E712
-                ),
-                fetch_links=True,
-            )
-        ],
-        key=lambda x: x[0].name,
-    )
-
+    index = await _character_index(ctx.interaction.guild.id)
     options = [
-        OptionChoice(
-            f"{character.name} [@{owner.name}]"
-            if character.is_alive
-            else f"{EmojiDict.DEAD} {character.name} [@{owner.name}]",
-            str(character.id),
+        _character_option(x, show_owner=True)
+        for x in index.search(
+            ctx.value, where=lambda x: x.type_player and x.campaign == str(campaign_id)
         )
-        for character, owner in all_chars_owners
-        if character.name.lower().startswith(ctx.value.lower())
     ]
 
-    # Check if the number of options exceeds the maximum allowed
-    if len(options) >= MAX_OPTION_LIST_SIZE:  # pragma: no cover
-        instructions = "Keep typing ..." if ctx.value else "Start typing a name."
-        return [OptionChoice(f"Too many characters to display. {instructions}", "")]
-
     return options or [OptionChoice("No characters available", "")]
 
 
@@ -131,7 +230,7 @@ async def select_campaign_character_from_user(
 ) -> list[OptionChoice]:
     """Generate a list of the user's available characters for autocomplete.
 
-    Fetch all player characters for the user in the current campaign, filter them based on user input,
+    Search the user's player characters in the current campaign for the user's input
     and return a list of OptionChoice objects for autocomplete.
 
     Args:
@@ -140,38 +239,32 @@ async def select_campaign_character_from_user(
     Returns:
         list[discord.OptionChoice]: A list of OptionChoice objects for the autocomplete list.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    campaign = channel_objects.campaign
+    campaign_id = (await resolve_channel(ctx)).campaign_id
 
-    if not campaign:
+    if not campaign_id:
         return [OptionChoice("Rerun in a channel associated with a campaign", "")]
 
-    user_object = await User.get(ctx.interaction.user.id, fetch_links=True)
+    user_object = await User.get(ctx.interaction.user.id)
+    character_ids = {str(x.ref.id) for x in user_object.characters}
 
-    # Prepare character data
-    all_chars = [
-        (
-            f"{character.name}" if character.is_alive else f"{EmojiDict.DEAD} {character.name}",
-            character.id,
+    index = await _character_index(ctx.interaction.guild.id)
+    options = [
+        _character_option(x)
+        for x in index.search(
+            ctx.value,
+            where=lambda x: (
+                x.id in character_ids and x.type_player and x.campaign == str(campaign_id)
+            ),
         )
-        for character in user_object.all_characters(ctx.interaction.guild)
-        if character.type_player and character.campaign == str(campaign.id)
     ]
 
-    # Generate options
-    options = [
-        OptionChoice(name, str(char_id))
-        for name, char_id in sorted(all_chars)
-        if name.lower().startswith(ctx.value.lower())
-    ][:MAX_OPTION_LIST_SIZE]
-
     return options or [OptionChoice("No characters available", "")]
 
 
 async def select_storyteller_character(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     """Generate a list of available storyteller characters for autocomplete.
 
-    This function fetches all storyteller characters, filters them based on the user's input, and returns a list of OptionChoice objects to populate the autocomplete list.
+    This function searches the guild's storyteller characters for the user's input and returns a list of OptionChoice objects to populate the autocomplete list.
 
     Args:
         ctx (discord.AutocompleteContext): The context object containing interaction and user details.
@@ -179,24 +272,10 @@ async def select_storyteller_character(ctx: discord.AutocompleteContext) -> list
     Returns:
         list[OptionChoice]: A list of OptionChoice objects for the autocomplete list which contains character names and ids.
     """
-    # Prepare character data
-    all_chars = [
-        (
-            f"{character.name}" if character.is_alive else f"{EmojiDict.DEAD} {character.name}",
-            character.id,
-        )
-        async for character in Character.find_many(
-            Character.guild == ctx.interaction.guild.id,
-            Character.type_storyteller == True,  # noqa: E712
-        )
-    ]
-
-    # Generate options
+    index = await _character_index(ctx.interaction.guild.id)
     options = [
-        OptionChoice(name, str(char_id))
-        for name, char_id in sorted(all_chars)
-        if name.lower().startswith(ctx.value.lower())
-    ][:MAX_OPTION_LIST_SIZE]
+        _character_option(x) for x in index.search(ctx.value, where=lambda x: x.type_storyteller)
+    ]
 
     return options or [OptionChoice("No characters available", "")]
 
@@ -204,7 +283,7 @@ async def select_storyteller_character(ctx: discord.AutocompleteContext) -> list
 async def select_any_character(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     """Generate a list of available characters for autocomplete. This list will include all character types.
 
-    This function fetches all storyteller characters, filters them based on the user's input, and returns a list of OptionChoice objects to populate the autocomplete list.
+    This function searches all of the guild's characters for the user's input and returns a list of OptionChoice objects to populate the autocomplete list.
 
     Args:
         ctx (discord.AutocompleteContext): The context object containing interaction and user details.
@@ -212,23 +291,8 @@ async def select_any_character(ctx: discord.AutocompleteContext) -> list[OptionC
     Returns:
         list[OptionChoice]: A list of OptionChoice objects for the autocomplete list which contains character names and ids.
     """
-    # Prepare character data
-    all_chars = [
-        (
-            f"{character.name}" if character.is_alive else f"{EmojiDict.DEAD} {character.name}",
-            character.id,
-        )
-        async for character in Character.find_many(
-            Character.guild == ctx.interaction.guild.id,
-        )
-    ]
-
-    # Generate options
-    options = [
-        OptionChoice(name, str(char_id))
-        for name, char_id in sorted(all_chars)
-        if name.lower().startswith(ctx.value.lower())
-    ][:MAX_OPTION_LIST_SIZE]
+    index = await _character_index(ctx.interaction.guild.id)
+    options = [_character_option(x) for x in index.search(ctx.value)]
 
     return options or [OptionChoice("No characters available", "")]
 
@@ -239,7 +303,7 @@ async def select_aws_object_from_guild(
 ) -> list[OptionChoice]:  # pragma: no cover
     """Populate the autocomplete list for the aws_object option based on the user's input.
 
-    Fetch AWS objects associated with the current guild and generate autocomplete options.
+    Search the index of the current guild's AWS objects for keys starting with the user's input and generate autocomplete options.
 
     Args:
         ctx (discord.AutocompleteContext): The context object containing interaction details.
@@ -248,11 +312,10 @@ async def select_aws_object_from_guild(
         list[OptionChoice]: A list of OptionChoice objects representing AWS objects,
                             limited to MAX_OPTION_LIST_SIZE.
     """
-    aws_svc = AWSService()
-
     guild_prefix = f"{ctx.interaction.guild.id}/"
+    objects = await aws_service.index.find(f"{guild_prefix}{ctx.value}", wait=S3_INDEX_WAIT)
 
-    return [OptionChoice(x.strip(guild_prefix), x) for x in aws_svc.list_objects(guild_prefix)][
+    return [OptionChoice(x.key.removeprefix(guild_prefix), x.key) for x in objects][
         :MAX_OPTION_LIST_SIZE
     ]
 
@@ -302,10 +365,9 @@ async def select_changelog_version_2(
 async def select_book(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     """Populate the autocomplete for the book option.
 
-    Fetch the active campaign, retrieve all books for that campaign, sort them by book number,
-    and filter based on the user's input. If no active campaign is found, return a single option
-    indicating this. If the number of books exceeds the maximum allowed options, return all
-    matching books up to the limit.
+    Search the books of the channel's campaign for the user's input, ordered by book number.
+    If no active campaign is found, return a single option indicating this. If the number of
+    books exceeds the maximum allowed options, return all matching books up to the limit.
 
     Args:
         ctx (discord.AutocompleteContext): The context of the autocomplete interaction.
@@ -315,20 +377,16 @@ async def select_book(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
             Each option contains the book number and name as the label, and the book's
             database ID as the value.
     """
-    # Fetch the active campaign
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    campaign = channel_objects.campaign
+    campaign_id = (await resolve_channel(ctx)).campaign_id
 
-    if not campaign:
+    if not campaign_id:
         return [OptionChoice("No active campaign", "")]
 
-    books = await campaign.fetch_books()
-
+    index = await _book_index(campaign_id)
     choices = [
-        OptionChoice(f"{book.number}. {book.name}", str(book.id))
-        for book in sorted(books, key=lambda x: x.number)
-        if book.name.lower().startswith(ctx.options["book"].lower())
-    ][:MAX_OPTION_LIST_SIZE]
+        OptionChoice(f"{book.number}. {book.name}", book.id)
+        for book in index.search(ctx.options["book"])
+    ]
 
     return choices or [OptionChoice("No books", "")]
 
@@ -336,8 +394,7 @@ async def select_book(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
 async def select_campaign(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
     """Generate a list of available campaigns for the guild.
 
-    Fetch and sort non-deleted campaigns for the current guild, then filter based on user input.
-    If too many options are available, return a single option prompting for more specific input.
+    Search the non-deleted campaigns of the current guild for the user's input. The best matches are returned first, limited to MAX_OPTION_LIST_SIZE.
 
     Args:
         ctx (discord.AutocompleteContext): The autocomplete context containing interaction details.
@@ -346,25 +403,8 @@ async def select_campaign(ctx: discord.AutocompleteContext) -> list[OptionChoice
         list[OptionChoice]: A list of OptionChoice objects representing available campaigns.
             Each option contains the campaign name as the label and the campaign's database ID as the value.
     """
-    all_campaigns = sorted(
-        await Campaign.find(
-            Campaign.guild == ctx.interaction.guild.id,
-            Campaign.is_deleted == False,  # noqa: E712
-            fetch_links=True,
-        ).to_list(),
-        key=lambda x: x.name,
-    )
-
-    options = [
-        OptionChoice(f"{campaign.name}", str(campaign.id))
-        for campaign in all_campaigns
-        if campaign.name.lower().startswith(ctx.value.lower())
-    ]
-
-    # Check if the number of options exceeds the maximum allowed
-    if len(options) >= MAX_OPTION_LIST_SIZE:  # pragma: no cover
-        instructions = "Keep typing ..." if ctx.value else "Start typing a name."
-        return [OptionChoice(f"Too many campaigns to display. {instructions}", "")]
+    index = await _campaign_index(ctx.interaction.guild.id)
+    options = [OptionChoice(campaign.name, campaign.id) for campaign in index.search(ctx.value)]
 
     return options or [OptionChoice("No campaigns available", "")]
 
@@ -503,21 +543,17 @@ async def select_char_trait(ctx: discord.AutocompleteContext) -> list[OptionChoi
     Returns:
         list[OptionChoice]: A list of available names and their index in character.traits.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    character = channel_objects.character
+    character_id = (await resolve_channel(ctx)).character_id
 
-    if not character:
+    if not character_id:
         return [OptionChoice("Rerun command in a character channel", "")]
 
     # Determine the option to retrieve the argument
     argument = ctx.options.get("trait") or ctx.options.get("trait_one") or ""
 
-    # Filter and return the character's traits
-    return [
-        OptionChoice(t.name, str(t.id))  # type: ignore [attr-defined]
-        for t in sorted(character.traits, key=lambda x: x.name)  # type: ignore [attr-defined]
-        if t.name.lower().startswith(argument.lower())  # type: ignore [attr-defined]
-    ][:MAX_OPTION_LIST_SIZE]
+    # Search the character's traits
+    index = await _trait_index(character_id)
+    return [OptionChoice(t.name, t.id) for t in index.search(argument)]
 
 
 async def select_char_trait_two(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
@@ -534,18 +570,14 @@ async def select_char_trait_two(ctx: discord.AutocompleteContext) -> list[Option
     Returns:
         list[OptionChoice]: A list of available trait names and their index in character.traits.
     """
-    channel_objects = await fetch_channel_object(ctx, raise_error=False)
-    character = channel_objects.character
+    character_id = (await resolve_channel(ctx)).character_id
 
-    if not character:
+    if not character_id:
         return [OptionChoice("Rerun command in a character channel", "")]
 
-    # Filter and return the character's traits
-    return [
-        OptionChoice(t.name, str(t.id))  # type: ignore [attr-defined]
-        for t in sorted(character.traits, key=lambda x: x.name)  # type: ignore [attr-defined]
-        if t.name.lower().startswith(ctx.options["trait_two"].lower())  # type: ignore [attr-defined]
-    ][:MAX_OPTION_LIST_SIZE]
+    # Search the character's traits
+    index = await _trait_index(character_id)
+    return [OptionChoice(t.name, t.id) for t in index.search(ctx.options["trait_two"])]
 
 
 async def select_custom_section(ctx: discord.AutocompleteContext) -> list[OptionChoice]:
@@ -732,19 +764,9 @@ async def select_trait_from_char_option(ctx: discord.AutocompleteContext) -> lis
     # Determine the argument based on the Discord option
     argument = ctx.options.get("trait") or ctx.options.get("trait_one") or ""
 
-    # Fetch the character from the ctx options
-    character = await Character.get(ctx.options["character"], fetch_links=True)
-
-    # Fetch and filter traits
-    # Filter and return the character's traits
-    # We pass the character id before the trait name for the validation to work
-    # Filter and return the character's traits
-
-    options = [
-        OptionChoice(t.name, str(t.id))
-        for t in character.traits
-        if t.name.lower().startswith(argument.lower())
-    ][:MAX_OPTION_LIST_SIZE]
+    # Search the traits of the character from the ctx options
+    index = await _trait_index(ctx.options["character"])
+    options = [OptionChoice(t.name, t.id) for t in index.search(argument)]
 
     return options or [OptionChoice("No traits", "")]
 
@@ -760,16 +782,9 @@ async def select_trait_from_char_option_two(ctx: discord.AutocompleteContext) ->
     Returns:
         list[str]: A list of trait names for the autocomplete list.
     """
-    # Fetch the character from the ctx options
-    character = await Character.get(ctx.options["character"], fetch_links=True)
-
-    # Fetch and filter traits
-    # Filter and return the character's traits
-    options = [
-        OptionChoice(t.name, str(t.id))
-        for t in character.traits
-        if t.name.lower().startswith(ctx.options["trait_two"].lower())
-    ][:MAX_OPTION_LIST_SIZE]
+    # Search the traits of the character from the ctx options
+    index = await _trait_index(ctx.options["character"])
+    options = [OptionChoice(t.name, t.id) for t in index.search(ctx.options["trait_two"])]
 
     return options or [OptionChoice("No traits", "")]
 
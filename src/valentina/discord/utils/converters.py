@@ -295,8 +295,8 @@ class ValidCharacterObject(Converter):
     """A converter that returns a Character object from the database.from it's id."""
 
     async def convert(self, ctx: commands.Context, argument: str) -> Character:  # noqa: ARG002
-        """Return a character object from a character id."""
-        character = await Character.get(argument, fetch_links=True)
+        """Return a character object from a character id, with its traits and inventory."""
+        character = await Character.get_with_traits(argument, links=("inventory",))
         if character:
             return character
 
@@ -1,8 +1,12 @@
 """Helper utilities for working with the discord API."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
 from typing import TYPE_CHECKING
 
 import discord
+from beanie import Document, PydanticObjectId
 from discord.ext import commands
 from loguru import logger
 
@@ -10,6 +14,7 @@ from valentina.constants import CampaignChannelName, ChannelPermission
 from valentina.discord.dataclasses import ChannelObjects
 from valentina.models import Campaign, CampaignBook, Character
 from valentina.utils import errors
+from valentina.utils.channel_cache import ChannelEntityIds, channel_cache
 
 if TYPE_CHECKING:
     from valentina.discord.bot import ValentinaContext
@@ -213,6 +218,80 @@ def set_channel_perms(
     return perms
 
 
+def _lean_lookup(kind: str, field: str, value: int) -> list[dict]:
+    """Return an aggregation pipeline which finds the id of the first document matching a channel."""
+    return [
+        {"$match": {field: value}},
+        {"$limit": 1},
+        {"$project": {"_id": 1, "kind": {"$literal": kind}}},
+    ]
+
+
+async def resolve_channel(
+    ctx: discord.ApplicationContext | discord.AutocompleteContext | commands.Context,
+) -> ChannelEntityIds:
+    """Return the ids of the campaign, book, and character the context's channel belongs to.
+
+    Resolved ids are cached, so most calls make no database queries. On a cache miss, the ids are read with a single aggregation which projects only the `_id` of the matching campaign, book, and character.
+
+    Args:
+        ctx (discord.ApplicationContext | discord.AutocompleteContext | commands.Context): The context containing the channel object.
+
+    Returns:
+        ChannelEntityIds: The ids of the campaign, book, and character the channel belongs to.
+    """
+    discord_channel = (
+        ctx.interaction.channel if isinstance(ctx, discord.AutocompleteContext) else ctx.channel
+    )
+    category_id = discord_channel.category.id if discord_channel.category else None
+
+    if cached := channel_cache.get(discord_channel.id, category_id):
+        return cached
+
+    pipeline = [
+        *_lean_lookup("character_id", "channel", discord_channel.id),
+        {
+            "$unionWith": {
+                "coll": CampaignBook.get_collection_name(),
+                "pipeline": _lean_lookup("book_id", "channel", discord_channel.id),
+            }
+        },
+    ]
+    if category_id:
+        pipeline.append(
+            {
+                "$unionWith": {
+                    "coll": Campaign.get_collection_name(),
+                    "pipeline": _lean_lookup(
+                        "campaign_id", "channel_campaign_category", category_id
+                    ),
+                }
+            }
+        )
+
+    cursor = await Character.get_pymongo_collection().aggregate(pipeline)
+    ids = ChannelEntityIds(**{doc["kind"]: doc["_id"] for doc in await cursor.to_list()})
+
+    channel_cache.set(discord_channel.id, category_id, ids)
+    return ids
+
+
+async def _fetch_channel_document[T: Document](
+    fetch: Callable[[PydanticObjectId], Awaitable[T | None]],
+    document_id: PydanticObjectId | None,
+    channel_id: int,
+) -> T | None:
+    """Fetch a document a channel belongs to, forgetting the channel if the document was deleted."""
+    if not document_id:
+        return None
+
+    document = await fetch(document_id)
+    if document is None:
+        channel_cache.invalidate(channel_id)
+
+    return document
+
+
 async def fetch_channel_object(
     ctx: discord.ApplicationContext | discord.AutocompleteContext | commands.Context,
     raise_error: bool = True,
@@ -222,7 +301,7 @@ async def fetch_channel_object(
 ) -> ChannelObjects:  # pragma: no cover
     """Determine the channel type and fetch associated objects.
 
-    Identify the channel type and fetch related campaign, book, and character objects. Raise errors if specified conditions are not met.
+    Identify the channel type and fetch related campaign, book, and character objects. Raise errors if specified conditions are not met. The channel is resolved with `resolve_channel()`, and only the documents the channel belongs to are loaded. Use `resolve_channel()` directly when only their ids are needed.
 
     Args:
         ctx (discord.ApplicationContext | discord.AutocompleteContext | commands.Context): The context containing the channel object.
@@ -240,15 +319,22 @@ async def fetch_channel_object(
     discord_channel = (
         ctx.interaction.channel if isinstance(ctx, discord.AutocompleteContext) else ctx.channel
     )
-
-    channel_category = discord_channel.category
-
-    campaign = await Campaign.find_one(
-        Campaign.channel_campaign_category == channel_category.id,
-        fetch_links=True,
+    ids = await resolve_channel(ctx)
+
+    campaign, book, character = await asyncio.gather(
+        _fetch_channel_document(
+            partial(Campaign.get, fetch_links=True), ids.campaign_id, discord_channel.id
+        ),
+        _fetch_channel_document(
+            partial(CampaignBook.get, fetch_links=True), ids.book_id, discord_channel.id
+        ),
+        # Characters embed their traits, so only their other links are fetched
+        _fetch_channel_document(
+            partial(Character.get_with_traits, links=("inventory", "notes")),
+            ids.character_id,
+            discord_channel.id,
+        ),
     )
-    book = await CampaignBook.find_one(CampaignBook.channel == discord_channel.id, fetch_links=True)
-    character = await Character.find_one(Character.channel == discord_channel.id, fetch_links=True)
 
     if raise_error and need_character and not character:
         msg = "Rerun command in a character channel."
@@ -6,10 +6,10 @@ import arrow
 import discord
 from discord.ext import pages
 
-from valentina.constants import MAX_DOT_DISPLAY, EmbedColor, InventoryItemType
+from valentina.constants import MAX_DOT_DISPLAY, EmbedColor, ImageVariant, InventoryItemType
 from valentina.controllers import CharacterSheetBuilder, PermissionManager
 from valentina.discord.bot import ValentinaContext
-from valentina.models import AWSService, Character, Statistics
+from valentina.models import Character, Statistics
 
 
 async def __embed1(  # noqa: PLR0913
@@ -150,9 +150,7 @@ def __image_embed(
         footer += f"Last updated: {modified}"
         embed.set_footer(text=footer)
 
-    aws_svc = AWSService()
-    image_url = aws_svc.get_url(image_key)
-    embed.set_image(url=image_url)
+    embed.set_image(url=character.image_url(image_key, ImageVariant.SHEET))
 
     return embed
 
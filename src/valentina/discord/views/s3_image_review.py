@@ -7,9 +7,11 @@ from discord.ext import pages
 from discord.ui import Button
 from loguru import logger
 
-from valentina.constants import EmbedColor, EmojiDict
+from valentina.constants import EmbedColor, EmojiDict, ImageVariant
 from valentina.discord.bot import ValentinaContext
-from valentina.models import AWSService, Character
+from valentina.models import Character
+from valentina.models.aws import aws_service
+from valentina.utils.images import derivative_key, is_derivative_key
 
 
 class DeleteS3Images(discord.ui.View):
@@ -94,18 +96,16 @@ class S3ImageReview:
             review_type (str): The type of review being performed (character, campaign, etc.)
             hidden (bool, optional): Whether or not the paginator should be hidden. Defaults to True.
         """
-        self.aws_svc = AWSService()
         self.ctx = ctx
         self.prefix = prefix
-        self.known_images = {x: self.aws_svc.get_url(x) for x in known_images}
-        self.images_by_prefix = self._get_images_by_prefix()
-        self.images = self.images_by_prefix | self.known_images
+        self.known_images = {x: aws_service.get_url(x) for x in known_images}
+        self.images: dict[str, str] = {}
         self.hidden = hidden
 
-    def _get_images_by_prefix(self) -> dict[str, str]:
+    async def _get_images_by_prefix(self) -> dict[str, str]:
         """Retrieve all the images in the database that match the specified prefix.
 
-        This function queries the AWS service to list all objects with the given prefix and then fetches their URLs.
+        This function searches the index of the AWS objects for the given prefix and then fetches their URLs.
         It returns a dictionary where the keys are thumbnail IDs and the values are corresponding URLs.
 
         Returns:
@@ -115,11 +115,17 @@ class S3ImageReview:
             Any exceptions raised by the AWS service will propagate up.
         """
         try:
-            # Use dictionary comprehension to build the images dictionary
+            keys = {x.key for x in await aws_service.index.find(self.prefix)}
+
+            # Preview each image with its thumbnail when one was generated
             return {
-                x: self.aws_svc.get_url(x)
-                for x in self.aws_svc.list_objects(self.prefix)
-                if x not in self.known_images
+                key: aws_service.get_url(
+                    thumbnail
+                    if (thumbnail := derivative_key(key, ImageVariant.THUMBNAIL)) in keys
+                    else key
+                )
+                for key in sorted(keys)
+                if key not in self.known_images and not is_derivative_key(key)
             }
         except Exception as e:
             logger.error(f"An error occurred while fetching image URLs: {e}")
@@ -157,6 +163,8 @@ class S3ImageReview:
 
     async def send(self, ctx: ValentinaContext) -> None:
         """Send the paginator."""
+        self.images = await self._get_images_by_prefix() | self.known_images
+
         if not self.images:
             await self.ctx.respond(
                 embed=discord.Embed(
@@ -14,7 +14,13 @@ from .campaign import (
     CampaignBookChapter,
     CampaignNPC,
 )
-from .character import Character, CharacterSheetSection, CharacterTrait, InventoryItem
+from .character import (
+    Character,
+    CharacterSheetSection,
+    CharacterTrait,
+    EmbeddedTrait,
+    InventoryItem,
+)
 from .database import GlobalProperty
 from .dictionary import DictionaryTerm
 from .guild import Guild, GuildChannels, GuildPermissions, GuildRollResultThumbnail
@@ -22,8 +28,8 @@ from .note import Note
 from .user import CampaignExperience, User, UserMacro
 
 from .aws import AWSService  # isort: skip
-from .statistics import Statistics, RollStatistic  # isort: skip
-from .dicerolls import DiceRoll  # isort: skip
+from .statistics import Statistics, RollStatistic, RollStatisticRollup  # isort: skip
+from .dicerolls import DiceRoll, RollBatch  # isort: skip
 from .probability import Probability, RollProbability  # isort: skip
 from .changelog import ChangelogParser, ChangelogPoster  # isort: skip
 
@@ -42,6 +48,7 @@ __all__ = [
     "CharacterTrait",
     "DiceRoll",
     "DictionaryTerm",
+    "EmbeddedTrait",
     "GlobalProperty",
     "Guild",
     "GuildChannels",
@@ -50,8 +57,10 @@ __all__ = [
     "InventoryItem",
     "Note",
     "Probability",
+    "RollBatch",
     "RollProbability",
     "RollStatistic",
+    "RollStatisticRollup",
     "Statistics",
     "User",
     "UserMacro",
@@ -1,6 +1,14 @@
 """Class for interacting with AWS services."""
 
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import boto3
 import discord
@@ -8,38 +16,355 @@ from botocore.config import Config
 from botocore.exceptions import ClientError
 from loguru import logger
 
+from valentina.constants import (
+    MAX_S3_CONNECTIONS,
+    MAX_S3_DELETE_BATCH_SIZE,
+    S3_INDEX_TTL,
+)
 from valentina.utils import ValentinaConfig, errors
+from valentina.utils.helpers import time_now
 
 
-class AWSService:
-    """Class for interacting with AWS services."""
+@dataclass(frozen=True, slots=True)
+class S3Object:
+    """An object in the S3 bucket."""
+
+    key: str
+    size: int = 0
+    last_modified: datetime | None = None
+
+
+class S3KeyTree:
+    """A tree of object keys split on "/", so the objects with a prefix are found without scanning every key."""
 
     def __init__(self) -> None:
-        """Initialize the AWS Service class with credentials.
+        self.children: dict[str, S3KeyTree] = {}
+        self.objects: dict[str, S3Object] = {}
+
+    def __len__(self) -> int:
+        """Return the number of objects in the tree."""
+        return len(self.objects) + sum(len(x) for x in self.children.values())
+
+    def node(self, segments: list[str], create: bool = False) -> "S3KeyTree | None":
+        """Return the node at a path of key segments.
+
+        Args:
+            segments (list[str]): The "/" separated segments of the path.
+            create (bool): Whether to create missing nodes. Defaults to False.
+
+        Returns:
+            S3KeyTree | None: The node, or None if it does not exist.
+        """
+        node: S3KeyTree | None = self
+        for segment in segments:
+            if create:
+                node = node.children.setdefault(segment, S3KeyTree())
+            elif (node := node.children.get(segment)) is None:
+                return None
+
+        return node
+
+    def walk(self) -> Iterator[S3Object]:
+        """Yield every object in the tree."""
+        yield from self.objects.values()
+        for child in self.children.values():
+            yield from child.walk()
+
+    def add(self, obj: S3Object) -> None:
+        """Add an object to the tree, replacing any object with the same key."""
+        *segments, name = obj.key.split("/")
+        self.node(segments, create=True).objects[name] = obj
+
+    def remove(self, key: str) -> None:
+        """Remove an object from the tree and prune the nodes left empty."""
+        *segments, name = key.split("/")
+        path = [self]
+        for segment in segments:
+            if (node := path[-1].children.get(segment)) is None:
+                return
+            path.append(node)
+
+        path[-1].objects.pop(name, None)
+        for parent, segment, node in reversed(
+            list(zip(path[:-1], segments, path[1:], strict=True))
+        ):
+            if node.children or node.objects:
+                break
+            del parent.children[segment]
+
+    def get(self, key: str) -> S3Object | None:
+        """Return the object with a key, or None if it is not in the tree."""
+        *segments, name = key.split("/")
+        node = self.node(segments)
+        return node.objects.get(name) if node else None
+
+    def find(self, prefix: str) -> list[S3Object]:
+        """Return every object whose key starts with a prefix, sorted by key.
+
+        Args:
+            prefix (str): The prefix of the keys. Ex. `1/characters/` or `1/characters/2/3`
+
+        Returns:
+            list[S3Object]: The objects with the prefix.
+        """
+        *segments, partial = prefix.split("/")
+        node = self.node(segments)
+        if not node:
+            return []
+
+        found = [obj for name, obj in node.objects.items() if name.startswith(partial)]
+        for name, child in node.children.items():
+            if name.startswith(partial):
+                found.extend(child.walk())
+
+        return sorted(found, key=lambda x: x.key)
+
+    def replace(self, prefix: str, tree: "S3KeyTree") -> None:
+        """Replace every object under a prefix with the objects of another tree under the same prefix.
+
+        Args:
+            prefix (str): A prefix ending with "/", or an empty string to replace every object.
+            tree (S3KeyTree): The tree holding the new objects.
+        """
+        segments = [x for x in prefix.split("/") if x]
+        if not segments:
+            self.children, self.objects = tree.children, tree.objects
+            return
+
+        parent = self.node(segments[:-1], create=True)
+        if replacement := tree.node(segments):
+            parent.children[segments[-1]] = replacement
+        else:
+            parent.children.pop(segments[-1], None)
+
+
+class S3KeyIndex:
+    """Index the keys, sizes, and modification times of the objects in the S3 bucket.
+
+    Each guild's objects are listed from S3 the first time they are needed, and refreshed in the background after S3_INDEX_TTL seconds while the previous index keeps serving requests. Objects uploaded or deleted through AWSService are added to or removed from the index as they change.
+    """
+
+    def __init__(self, service: "AWSService", ttl: float = S3_INDEX_TTL) -> None:
+        self.service = service
+        self.ttl = ttl
+        self.tree = S3KeyTree()
+        self._refreshed: dict[str, float] = {}
+        self._refreshes: dict[str, asyncio.Task] = {}
+        self._journals: dict[str, list[S3Object | str]] = {}
+
+    @staticmethod
+    def _guild_prefix(prefix: str) -> str:
+        """Return the prefix of the guild's objects, which is the first segment of every key."""
+        return f"{prefix.split('/', 1)[0]}/"
+
+    def _changed(self, change: S3Object | str) -> None:
+        """Record an added object or a removed key for the refreshes in progress, which listed the bucket before the change."""
+        key = change.key if isinstance(change, S3Object) else change
+        for prefix, journal in self._journals.items():
+            if key.startswith(prefix):
+                journal.append(change)
+
+    def add(self, key: str, size: int = 0) -> None:
+        """Add an uploaded object to the index.
+
+        Args:
+            key (str): The key of the object.
+            size (int): The size of the object in bytes. Defaults to 0.
+        """
+        obj = S3Object(key=key, size=size, last_modified=time_now())
+        self.tree.add(obj)
+        self._changed(obj)
+
+    def remove(self, *keys: str) -> None:
+        """Remove deleted objects from the index.
 
         Args:
-            aws_access_key_id (str): AWS access key ID.
-            aws_secret_access_key (str): AWS secret access key.
-            bucket_name (str): Name of the S3 bucket to use.
+            *keys (str): The keys of the objects.
         """
-        self.aws_access_key_id = ValentinaConfig().aws_access_key_id
-        self.aws_secret_access_key = ValentinaConfig().aws_secret_access_key
-        self.bucket_name = ValentinaConfig().s3_bucket_name
-
-        if not self.aws_access_key_id or not self.aws_secret_access_key or not self.bucket_name:
-            msg = "AWS"
-            raise errors.MissingConfigurationError(msg)
-
-        self.s3 = boto3.client(
-            "s3",
-            aws_access_key_id=self.aws_access_key_id,
-            aws_secret_access_key=self.aws_secret_access_key,
-            config=Config(retries={"max_attempts": 10, "mode": "standard"}),
+        for key in keys:
+            self.tree.remove(key)
+            self._changed(key)
+
+    async def _refresh(self, prefix: str) -> None:
+        """List every object with a prefix, one page at a time, and replace the indexed objects with them."""
+        journal = self._journals[prefix] = []
+        tree = S3KeyTree()
+        try:
+            async for page in self.service.list_object_pages(prefix):
+                for obj in page:
+                    tree.add(obj)
+        except (ClientError, errors.MissingConfigurationError) as e:
+            logger.error(f"S3: Failed to index objects with prefix '{prefix}': {e}")
+            return
+        finally:
+            del self._journals[prefix]
+            self._refreshes.pop(prefix, None)
+
+        # Apply the changes made while the bucket was being listed
+        for change in journal:
+            if isinstance(change, S3Object):
+                tree.add(change)
+            else:
+                tree.remove(change)
+
+        self.tree.replace(prefix, tree)
+        self._refreshed[prefix] = time.monotonic()
+        logger.debug(f"S3: Indexed {len(tree)} objects with prefix '{prefix}'")
+
+    def refresh(self, prefix: str = "") -> asyncio.Task:
+        """Refresh the index of the objects with a prefix in the background.
+
+        Args:
+            prefix (str): A prefix ending with "/", such as a guild's prefix, or an empty string to refresh every object. Defaults to "".
+
+        Returns:
+            asyncio.Task: The refresh, shared with any refresh of the same prefix in progress.
+        """
+        if prefix not in self._refreshes:
+            self._refreshes[prefix] = asyncio.create_task(self._refresh(prefix))
+
+        return self._refreshes[prefix]
+
+    async def find(self, prefix: str, wait: float | None = None) -> list[S3Object]:
+        """Return the indexed objects with a prefix, sorted by key.
+
+        An index older than S3_INDEX_TTL is returned immediately and refreshed in the background. A guild whose objects were never indexed waits for them to be listed.
+
+        Args:
+            prefix (str): The prefix of the keys. Ex. `1/characters/2/`
+            wait (float | None): The most seconds to wait for a guild whose objects were never indexed. Returns the objects indexed so far when exceeded. Defaults to waiting until they are indexed.
+
+        Returns:
+            list[S3Object]: The objects with the prefix.
+        """
+        guild_prefix = self._guild_prefix(prefix)
+        refreshed = max(self._refreshed.get(guild_prefix, 0), self._refreshed.get("", 0))
+
+        if not refreshed:
+            # Wait on the bucket being indexed when the bot starts rather than listing the guild again
+            refresh = self._refreshes.get("") or self.refresh(guild_prefix)
+            try:
+                await asyncio.wait_for(asyncio.shield(refresh), wait)
+            except TimeoutError:
+                logger.debug(f"S3: Objects with prefix '{guild_prefix}' are still being indexed")
+        elif time.monotonic() - refreshed > self.ttl:
+            self.refresh(guild_prefix)
+
+        return self.tree.find(prefix)
+
+
+class AWSService:
+    """Interact with Amazon S3 without blocking the event loop.
+
+    A single boto3 client, and its connection pool, is created on first use and shared by every caller. boto3 is synchronous so every request is run in a dedicated thread pool, keeping the event loop shared by the Discord bot and the web UI free. Use the process-wide `aws_service` instance rather than creating new instances.
+
+    The keys of the bucket's objects are indexed in `index` so they can be searched without listing the bucket. Objects uploaded, copied, or deleted through this class update the index.
+
+    Set `VALENTINA_S3_ENDPOINT_URL` to use an S3 compatible service such as MinIO.
+    """
+
+    def __init__(self) -> None:
+        self._client: Any = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._region: str | None = None
+        self._lock = threading.Lock()
+        self.index = S3KeyIndex(self)
+
+    @property
+    def bucket(self) -> str:
+        """The name of the S3 bucket."""
+        return ValentinaConfig().s3_bucket_name
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether the AWS credentials and the S3 bucket are configured."""
+        config = ValentinaConfig()
+        return bool(
+            config.aws_access_key_id and config.aws_secret_access_key and config.s3_bucket_name
         )
-        self.bucket = self.bucket_name
-        self.location = self.s3.get_bucket_location(Bucket=self.bucket)  # Ex. us-east-1
 
-    def copy_object(self, source_key: str, dest_key: str) -> bool:  # pragma: no cover
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool used to run boto3 requests."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=MAX_S3_CONNECTIONS, thread_name_prefix="s3"
+            )
+
+        return self._executor
+
+    def _get_client(self) -> Any:
+        """Return the shared boto3 client, creating it on first use.
+
+        Returns:
+            Any: The boto3 S3 client.
+
+        Raises:
+            errors.MissingConfigurationError: If the AWS credentials or bucket are not configured.
+        """
+        with self._lock:
+            if self._client is None:
+                if not self.is_configured:
+                    msg = "AWS"
+                    raise errors.MissingConfigurationError(msg)
+
+                config = ValentinaConfig()
+                self._client = boto3.client(
+                    "s3",
+                    aws_access_key_id=config.aws_access_key_id,
+                    aws_secret_access_key=config.aws_secret_access_key,
+                    endpoint_url=config.s3_endpoint_url or None,
+                    config=Config(
+                        max_pool_connections=MAX_S3_CONNECTIONS,
+                        retries={"max_attempts": 10, "mode": "standard"},
+                    ),
+                )
+
+        return self._client
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking function in the thread pool.
+
+        Args:
+            func (Callable[..., Any]): The function to run.
+            *args (Any): Arguments passed to the function.
+
+        Returns:
+            Any: The result of the function.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def _call(self, method: str, **kwargs: Any) -> Any:
+        """Run a boto3 client method in the thread pool.
+
+        Args:
+            method (str): The name of the client method.
+            **kwargs (Any): Arguments passed to the client method.
+
+        Returns:
+            Any: The result of the client method.
+        """
+        return await self._run(lambda: getattr(self._get_client(), method)(**kwargs))
+
+    async def region(self) -> str | None:
+        """Return the region of the S3 bucket. The region is fetched once and cached for `get_url`.
+
+        Returns:
+            str | None: The region of the bucket, or None when it could not be fetched. Ex. us-east-1
+        """
+        if self._region is None:
+            try:
+                result = await self._call("get_bucket_location", Bucket=self.bucket)
+            except (ClientError, errors.MissingConfigurationError) as e:
+                logger.error(f"S3: Failed to fetch the region of the bucket: {e}")
+                return None
+
+            # Buckets in us-east-1 have a LocationConstraint of None
+            self._region = result.get("LocationConstraint") or "us-east-1"
+
+        return self._region
+
+    async def copy_object(self, source_key: str, dest_key: str) -> bool:  # pragma: no cover
         """Copy an object within the S3 bucket or to another bucket.
 
         Args:
@@ -51,14 +376,18 @@ class AWSService:
         """
         copy_source = {"Bucket": self.bucket, "Key": source_key}
         try:
-            self.s3.copy_object(CopySource=copy_source, Bucket=self.bucket, Key=dest_key)
+            await self._call(
+                "copy_object", CopySource=copy_source, Bucket=self.bucket, Key=dest_key
+            )
         except ClientError as e:
             logger.error(f"Failed to copy object {source_key} to {dest_key}: {e}")
             raise
 
+        source = self.index.tree.get(source_key)
+        self.index.add(dest_key, size=source.size if source else 0)
         return True
 
-    def delete_object(self, key: str) -> bool:  # pragma: no cover
+    async def delete_object(self, key: str) -> bool:  # pragma: no cover
         """Delete an object from the S3 bucket.
 
         Attempt to delete the object from the S3 bucket using the provided key.
@@ -72,15 +401,69 @@ class AWSService:
         """
         try:
             # Attempt to delete the object from the S3 bucket
-            result = self.s3.delete_object(Bucket=self.bucket, Key=key)
+            result = await self._call("delete_object", Bucket=self.bucket, Key=key)
         except ClientError as e:
             logger.error(f"Failed to delete object {key}: {e}")
             raise
 
+        self.index.remove(key)
+
         # Check the DeleteMarker to confirm deletion
         return bool(result.get("DeleteMarker", False))
 
-    def download_file(self, key: str, download_path: str) -> bool:  # pragma: no cover
+    async def delete_objects(self, keys: Iterable[str]) -> list[str]:
+        """Delete many objects from the S3 bucket.
+
+        Keys are deleted with batched `delete_objects` requests of up to 1000 keys each, the maximum S3 accepts, and the batches are sent concurrently. Keys which fail to delete are logged.
+
+        Args:
+            keys (Iterable[str]): Keys of the objects to delete from the S3 bucket.
+
+        Returns:
+            list[str]: The keys which were deleted.
+        """
+        keys = list(dict.fromkeys(keys))
+        batches = [
+            keys[i : i + MAX_S3_DELETE_BATCH_SIZE]
+            for i in range(0, len(keys), MAX_S3_DELETE_BATCH_SIZE)
+        ]
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    self._call(
+                        "delete_objects",
+                        Bucket=self.bucket,
+                        Delete={"Objects": [{"Key": key} for key in batch], "Quiet": False},
+                    )
+                    for batch in batches
+                )
+            )
+        except ClientError as e:
+            logger.error(f"Failed to delete objects: {e}")
+            raise
+
+        deleted: list[str] = []
+        for result in results:
+            deleted.extend(x["Key"] for x in result.get("Deleted", []))
+            for error in result.get("Errors", []):
+                logger.error(f"Failed to delete object {error['Key']}: {error['Message']}")
+
+        self.index.remove(*deleted)
+        return deleted
+
+    async def delete_prefix(self, prefix: str) -> list[str]:
+        """Delete every object in the S3 bucket with a given prefix, such as all of a guild's objects.
+
+        Args:
+            prefix (str): The prefix of the keys to delete.
+
+        Returns:
+            list[str]: The keys which were deleted.
+        """
+        return await self.delete_objects(await self.list_objects(prefix))
+
+    async def download_file(self, key: str, download_path: str) -> bool:  # pragma: no cover
         """Download a file from the S3 bucket to Valentina's server.
 
         Args:
@@ -91,14 +474,14 @@ class AWSService:
             bool: True if the download is successful, False otherwise.
         """
         try:
-            self.s3.download_file(Bucket=self.bucket, Key=key, Filename=download_path)
+            await self._call("download_file", Bucket=self.bucket, Key=key, Filename=download_path)
         except ClientError as e:
             logger.error(f"Failed to download object {key}: {e}")
             raise
 
         return True
 
-    def generate_presigned_url(
+    async def generate_presigned_url(
         self,
         key: str,
         expiration: int = 3600,
@@ -115,8 +498,9 @@ class AWSService:
             str | None: Presigned URL or None if the operation fails.
         """
         try:
-            url = self.s3.generate_presigned_url(
-                "get_object",
+            url = await self._call(
+                "generate_presigned_url",
+                ClientMethod="get_object",
                 Params={"Bucket": self.bucket, "Key": key},
                 ExpiresIn=expiration,
             )
@@ -178,13 +562,61 @@ class AWSService:
             raise
 
     def get_url(self, key: str) -> str:
-        """Get the URL for an object in the S3 bucket."""
+        """Get the URL for an object in the S3 bucket.
+
+        Objects are addressed by path on `VALENTINA_S3_ENDPOINT_URL` when it is set. Otherwise the bucket's regional endpoint is used once `region` has cached the bucket's region, and the global endpoint before then.
+
+        Args:
+            key (str): The key of the object.
+
+        Returns:
+            str: The URL of the object.
+        """
+        if endpoint_url := ValentinaConfig().s3_endpoint_url:
+            return f"{endpoint_url.rstrip('/')}/{self.bucket}/{key}"
+
+        if self._region:
+            return f"https://{self.bucket}.s3.{self._region}.amazonaws.com/{key}"
+
         return f"https://{self.bucket}.s3.amazonaws.com/{key}"
 
-    def list_objects(self, prefix: str) -> list[str]:  # pragma: no cover
+    def _list_keys(self, prefix: str) -> list[str]:  # pragma: no cover
+        """List every key with a given prefix, following pagination. Runs in the thread pool."""
+        paginator = self._get_client().get_paginator("list_objects_v2")
+        return [
+            obj["Key"]
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    async def list_object_pages(self, prefix: str) -> AsyncIterator[list[S3Object]]:
+        """List the objects in the S3 bucket with a given prefix, one page of up to 1000 objects at a time.
+
+        Each page is requested in the thread pool, so the event loop is free between pages.
+
+        Args:
+            prefix (str): The prefix to filter object keys by.
+
+        Yields:
+            list[S3Object]: A page of objects.
+        """
+        kwargs = {"Bucket": self.bucket, "Prefix": prefix}
+        while True:
+            page = await self._call("list_objects_v2", **kwargs)
+            yield [
+                S3Object(key=x["Key"], size=x.get("Size", 0), last_modified=x.get("LastModified"))
+                for x in page.get("Contents", [])
+            ]
+
+            if not page.get("IsTruncated"):
+                return
+
+            kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+    async def list_objects(self, prefix: str) -> list[str]:  # pragma: no cover
         """List all objects in the S3 bucket with a given prefix.
 
-        Use the S3 bucket's object filter method to find all objects that have keys starting with the given prefix. Return these keys as a list of strings.
+        Find all objects that have keys starting with the given prefix, following pagination when there are more than 1000 keys. Return these keys as a list of strings.
 
         Args:
             prefix (str): The prefix to filter object keys by.
@@ -192,10 +624,9 @@ class AWSService:
         Returns:
             list[str]: A list of object keys that start with the given prefix.
         """
-        result = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
-        return [obj["Key"] for obj in result.get("Contents", [])]
+        return await self._run(self._list_keys, prefix)
 
-    def object_exist(self, key: str) -> bool:  # pragma: no cover
+    async def object_exist(self, key: str) -> bool:  # pragma: no cover
         """Check if an object exists in the S3 bucket.
 
         Attempt to load the object from the S3 bucket using the provided key.
@@ -207,9 +638,9 @@ class AWSService:
         Returns:
             bool: True if the object exists, False otherwise.
         """
-        return key in self.list_objects(key)
+        return key in await self.list_objects(key)
 
-    def upload_image(
+    async def upload_image(
         self,
         data: bytes,
         key: str,
@@ -229,19 +660,20 @@ class AWSService:
             bool: True if the upload is successful, False otherwise.
         """
         # Check if the object exists and whether we should overwrite it
-        if not overwrite and self.object_exist(key):
+        if not overwrite and await self.object_exist(key):
             raise errors.S3ObjectExistsError
 
         try:
             # Attempt to upload the file to the S3 bucket
-            self.s3.put_object(Key=key, Bucket=self.bucket, Body=data)
+            await self._call("put_object", Key=key, Bucket=self.bucket, Body=data)
         except (ClientError, discord.HTTPException) as e:
             logger.error(f"Failed to upload file: {e}")
             return False
 
+        self.index.add(key, size=len(data))
         return True
 
-    def upload_file(
+    async def upload_file(
         self,
         ctx: discord.ApplicationContext,
         path: Path,
@@ -250,7 +682,7 @@ class AWSService:
     ) -> bool:  # pragma: no cover
         """Upload a file to an S3 bucket.
 
-        Open the file in binary mode and attempt to upload it to the S3 bucket.
+        Attempt to upload the file to the S3 bucket.
         If the upload fails, log the error and return False.
 
         Args:
@@ -266,17 +698,25 @@ class AWSService:
         key = name or f"{ctx.guild.id}/{path.name}"
 
         # Check if the object exists and whether we should overwrite it
-        if not overwrite and self.object_exist(key):
+        if not overwrite and await self.object_exist(key):
             raise errors.S3ObjectExistsError
 
-        try:
-            # Open the file in binary mode
+        def _put_file() -> int:
             with path.open("rb") as data:
-                # Attempt to upload the file to the S3 bucket
-                self.s3.put_object(Key=key, Bucket=self.bucket, Body=data)
+                self._get_client().put_object(Key=key, Bucket=self.bucket, Body=data)
+
+            return path.stat().st_size
+
+        try:
+            # Read and upload the file in the thread pool
+            size = await self._run(_put_file)
         except (ClientError, FileNotFoundError) as e:
             # Log the error and return False
             logger.error(f"Failed to upload file: {e}")
             return False
 
+        self.index.add(key, size=size)
         return True
+
+
+aws_service = AWSService()
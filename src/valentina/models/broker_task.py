@@ -1,5 +1,6 @@
 """Representation of a task for the task broker."""
 
+import asyncio
 from datetime import datetime
 
 from beanie import (
@@ -9,9 +10,12 @@ from beanie import (
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
+from loguru import logger
 from pydantic import Field
+from pymongo.errors import OperationFailure, PyMongoError
 
 from valentina.constants import BrokerTaskType
 from valentina.utils.helpers import time_now
@@ -37,3 +41,87 @@ class BrokerTask(Document):
     async def guild_id_to_int(self) -> None:
         """Ensure the guild_id is an integer."""
         self.guild_id = int(self.guild_id)
+
+    @after_event(Insert, Save)
+    async def notify_task_broker(self) -> None:
+        """Wake the task broker in this process as soon as the task is written."""
+        if not self.has_error:
+            broker_task_notifier.notify(self.guild_id)
+
+
+class BrokerTaskNotifier:
+    """Wake the task broker as soon as broker tasks are created instead of waiting for the next poll.
+
+    Tasks written by this process, such as those created by the web UI when it runs alongside the bot, notify directly from a BrokerTask event hook. Tasks written by other processes are picked up from a MongoDB change stream when the database runs as a replica set. The bot's polling loop remains as the fallback for everything else.
+    """
+
+    def __init__(self, debounce: float = 1.0) -> None:
+        """Initialize the BrokerTaskNotifier class.
+
+        Args:
+            debounce (float, optional): Seconds to wait after the first notification so bursts of related tasks are handled in one run. Defaults to 1.0.
+        """
+        self.debounce = debounce
+        self._pending: set[int] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._event: asyncio.Event = None
+
+    def _ensure_event(self) -> asyncio.Event:
+        """Return the notification event for the running event loop, creating it if necessary."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._event = asyncio.Event()
+            if self._pending:
+                self._event.set()
+
+        return self._event
+
+    def notify(self, guild_id: int) -> None:
+        """Record that a guild has pending broker tasks and wake anything waiting on them.
+
+        Args:
+            guild_id (int): The ID of the guild with pending tasks.
+        """
+        self._pending.add(int(guild_id))
+        self._ensure_event().set()
+
+    async def wait(self) -> set[int]:
+        """Wait until broker tasks are created.
+
+        Returns:
+            set[int]: The IDs of the guilds with pending tasks.
+        """
+        event = self._ensure_event()
+        await event.wait()
+        await asyncio.sleep(self.debounce)
+
+        event.clear()
+        guild_ids, self._pending = self._pending, set()
+        return guild_ids
+
+    async def watch(self, retry_interval: float = 30.0) -> None:
+        """Notify of broker tasks inserted by any process using a MongoDB change stream.
+
+        Change streams require MongoDB to run as a replica set. On a standalone server this returns immediately, leaving in-process notifications and polling to pick up tasks.
+
+        Args:
+            retry_interval (float, optional): Seconds to wait before reopening the change stream after a database error. Defaults to 30.0.
+        """
+        pipeline = [{"$match": {"operationType": "insert", "fullDocument.has_error": False}}]
+
+        while True:
+            try:
+                async with await BrokerTask.get_pymongo_collection().watch(pipeline) as stream:
+                    logger.info("DATABASE: Watch broker tasks with a change stream")
+                    async for change in stream:
+                        self.notify(change["fullDocument"]["guild_id"])
+            except OperationFailure as e:
+                logger.info(f"DATABASE: Change streams unavailable, poll for broker tasks: {e}")
+                return
+            except PyMongoError as e:
+                logger.error(f"DATABASE: Broker task change stream failed: {e}")
+                await asyncio.sleep(retry_interval)
+
+
+broker_task_notifier = BrokerTaskNotifier()
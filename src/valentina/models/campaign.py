@@ -5,6 +5,7 @@ from uuid import UUID, uuid4
 
 import discord
 from beanie import (
+    Delete,
     DeleteRules,
     Document,
     Indexed,
@@ -14,11 +15,14 @@ from beanie import (
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
 from pydantic import BaseModel, Field
 
 from valentina.constants import EmojiDict
+from valentina.utils.autocomplete_index import IndexKind, autocomplete_index
+from valentina.utils.channel_cache import channel_cache
 from valentina.utils.helpers import renumber_items, time_now
 
 from .character import Character
@@ -66,6 +70,11 @@ class CampaignBook(Document):
     number: int
     notes: list[Link[Note]] = Field(default_factory=list)
 
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_autocomplete_index(self) -> None:
+        """Discard the campaign's cached book autocomplete index so it is rebuilt with this change."""
+        autocomplete_index.invalidate(IndexKind.BOOKS, self.campaign)
+
     @property
     def channel_name(self) -> str:
         """Channel name for the book."""
@@ -91,6 +100,7 @@ class CampaignBook(Document):
             channel (discord.TextChannel): The book's channel.
         """
         if not self.channel or self.channel != channel.id:
+            channel_cache.invalidate(self.channel, channel.id)
             self.channel = channel.id
             await self.save()
 
@@ -140,6 +150,12 @@ class Campaign(Document):
         """Update the date_modified field."""
         self.date_modified = time_now()
 
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_autocomplete_index(self) -> None:
+        """Discard the cached campaign and book autocomplete indexes so they are rebuilt with this change."""
+        autocomplete_index.invalidate(IndexKind.CAMPAIGNS, self.guild)
+        autocomplete_index.invalidate(IndexKind.BOOKS, self.id)
+
     async def fetch_player_characters(self) -> list[Character]:
         """Fetch all player characters in the campaign.
 
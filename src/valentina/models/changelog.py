@@ -2,7 +2,9 @@
 
 import random
 import re
-from typing import TYPE_CHECKING, Optional
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, cast
 
 import discord
 import semver
@@ -11,6 +13,7 @@ from loguru import logger
 
 from valentina.constants import (
     BOT_DESCRIPTIONS,
+    CHANGELOG_CATEGORIES,
     CHANGELOG_EXCLUDE_CATEGORIES,
     CHANGELOG_PATH,
     EmbedColor,
@@ -189,10 +192,149 @@ class ChangelogPoster:  # pragma: no cover
         self.posted = True
 
 
+class ChangelogIndex:
+    """Parse every version in the changelog once.
+
+    Versions are kept sorted by semantic version so the versions between two versions are found with a binary search.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize the ChangelogIndex class.
+
+        Args:
+            text (str): The contents of the changelog file.
+        """
+        self.text = text
+        self.changelog = self.__parse(text)
+        self._versions = sorted((semver.Version.parse(x), x) for x in self.changelog)
+
+    def __len__(self) -> int:
+        """Return the number of versions in the changelog."""
+        return len(self._versions)
+
+    @staticmethod
+    def __parse(text: str) -> dict[str, dict[str, str | list[str]]]:
+        """Parse the changelog into a structured dictionary.
+
+        Iterate through each line of the changelog, identifying version numbers, dates, and categories.
+        Construct a nested dictionary where:
+        - The outer key is the version number
+        - The inner keys are 'date' and category names
+        - The values are either the release date (string) or lists of changelog entries
+
+        Args:
+            text (str): The contents of the changelog file.
+
+        Returns:
+            dict[str, dict[str, str | list[str]]]: A nested dictionary containing structured changelog information.
+                Format: {version: {'date': date_string, category1: [entries], category2: [entries], ...}}
+        """
+        # Prepare compiled regular expressions
+        version_re = re.compile(r"## v(\d+\.\d+\.\d+)")
+        date_re = re.compile(r"\((\d{4}-\d{2}-\d{2})\)")
+        category_re = re.compile(rf"### ({'|'.join(CHANGELOG_CATEGORIES)})", re.IGNORECASE)
+
+        changelog: dict[str, dict[str, str | list[str]]] = {}
+        current_version = ""
+        current_category = ""
+
+        # Parse changelog line by line
+        for line in text.split("\n"):
+            # Check for version line
+            version_match = version_re.match(line)
+            if version_match is not None:
+                current_version = version_match.group(1)
+                date_match = date_re.search(line)
+                changelog[current_version] = {"date": date_match.group(1) if date_match else ""}
+                continue
+
+            # Check for category line
+            category_match = category_re.match(line)
+            if category_match is not None:
+                current_category = category_match.group(1).lower()
+                continue
+
+            # If we are within a version and a category, append non-empty lines to that category
+            if line and current_version and current_category:
+                cleaned_line = re.sub(r" \(#\d+\)$", "", line)  # Clean up PR references
+                entries = changelog[current_version].setdefault(current_category, [])
+                cast("list[str]", entries).append(cleaned_line)
+
+        return changelog
+
+    def versions_between(
+        self, oldest_version: str, newest_version: str, include_oldest: bool = True
+    ) -> list[str]:
+        """Return the versions between two versions, newest first.
+
+        Args:
+            oldest_version (str): The oldest version to return.
+            newest_version (str): The newest version to return.
+            include_oldest (bool): Whether to return the oldest version itself. Defaults to True.
+
+        Returns:
+            list[str]: The versions in the changelog between the two versions.
+        """
+        oldest = (semver.Version.parse(oldest_version),)
+        newest = (semver.Version.parse(newest_version),)
+
+        # Compare only the version of each (version, string) tuple
+        start = (bisect_left if include_oldest else bisect_right)(
+            self._versions, oldest, key=lambda x: x[:1]
+        )
+        end = bisect_right(self._versions, newest, key=lambda x: x[:1])
+
+        return [x for _, x in reversed(self._versions[start:end])]
+
+
+class ChangelogIndexCache:
+    """Cache the parsed changelog.
+
+    The changelog is read and parsed the first time it is needed and again only when the file's modification time or size changes.
+    """
+
+    def __init__(self) -> None:
+        self._indexes: dict[Path, tuple[tuple[int, int], ChangelogIndex]] = {}
+
+    def get(self, path: Path) -> ChangelogIndex:
+        """Return the parsed changelog, parsing it if the file changed since it was cached.
+
+        Args:
+            path (Path): The path to the changelog file.
+
+        Returns:
+            ChangelogIndex: The parsed changelog.
+
+        Raises:
+            FileNotFoundError: If the changelog file does not exist at the specified path.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            logger.error(f"Changelog file not found at {path}")
+            raise
+
+        key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._indexes.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+
+        index = ChangelogIndex(path.read_text())
+        self._indexes[path] = (key, index)
+        logger.debug(f"CHANGELOG: Parsed {len(index)} versions from {path}")
+
+        return index
+
+
+changelog_index_cache = ChangelogIndexCache()
+
+
 class ChangelogParser:
     """Parse and process changelog files.
 
     Provide methods to read, interpret, and manipulate changelog entries. Handle version comparisons, category filtering, and data extraction from structured changelog files. Support various output formats for changelog information, including Discord embeds.
+
+    The changelog file is parsed once into a shared ChangelogIndex, so each parser only selects the versions and categories it needs.
     """
 
     def __init__(
@@ -205,18 +347,7 @@ class ChangelogParser:
     ):
         self.path = CHANGELOG_PATH
         self.bot = bot
-        self.all_categories = [
-            "feat",
-            "fix",
-            "docs",
-            "refactor",
-            "style",
-            "test",
-            "chore",
-            "perf",
-            "ci",
-            "build",
-        ]
+        self.all_categories = list(CHANGELOG_CATEGORIES)
         self.exclude_categories = exclude_categories
         self.exclude_oldest_version = exclude_oldest_version
 
@@ -230,10 +361,9 @@ class ChangelogParser:
             if newest_version
             else "999.999.999"
         )
-        self.full_changelog = self.__get_changelog()
-        self.changelog_dict = self.__parse_changelog()
-        # Clean changelog_dict of excluded categories and empty versions
-        self.__clean_changelog()
+        index = changelog_index_cache.get(self.path)
+        self.full_changelog = index.text
+        self.changelog_dict = self.__select_changelog(index)
 
     @staticmethod
     def __check_version_schema(version: str) -> bool:
@@ -249,132 +379,37 @@ class ChangelogParser:
         """
         return bool(re.match(r"^(\d+\.\d+\.\d+)$", version))
 
-    def __get_changelog(self) -> str:
-        """Read and return the contents of the changelog file.
+    def __select_changelog(self, index: ChangelogIndex) -> dict[str, dict[str, str | list[str]]]:
+        """Select the versions and categories of the parsed changelog to include.
 
-        Attempt to read the changelog file from the specified path. If the file
-        exists, return its contents as a string. If the file is not found, log
-        an error and raise a FileNotFoundError.
-
-        Returns:
-            str: The contents of the changelog file.
-
-        Raises:
-            FileNotFoundError: If the changelog file does not exist at the specified path.
-        """
-        if not self.path.exists():
-            logger.error(f"Changelog file not found at {self.path}")
-            raise FileNotFoundError
-
-        return self.path.read_text()
-
-    def __parse_changelog(self) -> dict[str, dict[str, str | list[str]]]:  # noqa: C901
-        """Parse the changelog into a structured dictionary.
-
-        Iterate through each line of the changelog, identifying version numbers, dates, and categories.
-        Construct a nested dictionary where:
-        - The outer key is the version number
-        - The inner keys are 'date' and category names
-        - The values are either the release date (string) or lists of changelog entries
+        Respect version boundaries set by oldest_version and newest_version attributes and skip the oldest version when exclude_oldest_version is True. Remove categories listed in the exclusion list and skip versions that contain only a date entry and no other changes.
 
-        Respect version boundaries set by oldest_version and newest_version attributes.
-        Skip parsing for versions outside these boundaries or when exclude_oldest_version is True.
+        Args:
+            index (ChangelogIndex): The parsed changelog.
 
         Returns:
-            dict[str, dict[str, str | list[str]]]: A nested dictionary containing structured changelog information.
+            dict[str, dict[str, str | list[str]]]: A nested dictionary containing structured changelog information, newest version first.
                 Format: {version: {'date': date_string, category1: [entries], category2: [entries], ...}}
         """
-        # Prepare compiled regular expressions
-        version_re = re.compile(r"## v(\d+\.\d+\.\d+)")
-        date_re = re.compile(r"\((\d{4}-\d{2}-\d{2})\)")
-        category_re = re.compile(rf"### ({'|'.join(self.all_categories)})", re.IGNORECASE)
-
-        # Initialize the changelog dictionary
         changelog_dict: dict[str, dict[str, str | list[str]]] = {}
-        current_category = ""
-
-        # Parse changelog line by line
-        for line in self.full_changelog.split("\n"):
-            # Skip empty lines
-            if not line:
-                continue
-
-            # Check for version line
-            if version_match := version_re.match(line):
-                version_being_parsed = version_match.group(1)
-
-                # When requested, do not parse the oldest version
-                # This is used when automatically posting the changelog on bot connect
-                if self.exclude_oldest_version and semver.Version.parse(
-                    version_being_parsed,
-                ) == semver.Version.parse(self.oldest_version):
-                    parse_version = False
-                    continue
 
-                if (
-                    semver.Version.parse(version_being_parsed)
-                    >= semver.Version.parse(self.oldest_version)
-                ) and (
-                    semver.Version.parse(version_being_parsed)
-                    <= semver.Version.parse(self.newest_version)
-                ):
-                    changelog_dict[version_being_parsed] = {"date": date_re.search(line).group(1)}
-                    parse_version = True
-                    continue
-
-                # Stop parsing if we are below the to_version
-                if semver.Version.parse(version_being_parsed) < semver.Version.parse(
-                    self.oldest_version,
-                ):
-                    break
-
-                # Do not parse if we are above the from_version
-                if semver.Version.parse(version_being_parsed) > semver.Version.parse(
-                    self.newest_version,
-                ):
-                    parse_version = False
-                    continue
-
-            # Check for category line
-            if category_match := category_re.match(line):
-                current_category = category_match.group(1).lower()
-                continue
-
-            # If we are within a version and a category, append line to that category
-            if parse_version and current_category:  # type: ignore [unreachable] # TODO: Fix unreachable code
-                cleaned_line = re.sub(r" \(#\d+\)$", "", line)  # Clean up PR references
+        for version in index.versions_between(
+            self.oldest_version,
+            self.newest_version,
+            include_oldest=not self.exclude_oldest_version,
+        ):
+            data = {
+                category: entries
+                for category, entries in index.changelog[version].items()
+                if category not in self.exclude_categories
+            }
 
-                if current_category not in changelog_dict[version_being_parsed]:
-                    changelog_dict[version_being_parsed][current_category] = [cleaned_line]
-                else:
-                    changelog_dict[version_being_parsed][current_category].append(cleaned_line)
+            # Skip versions with only a date
+            if len(data) > 1:
+                changelog_dict[version] = data
 
         return changelog_dict
 
-    def __clean_changelog(self) -> None:
-        """Clean up the changelog dictionary by removing excluded categories and empty versions.
-
-        Remove categories listed in the exclusion list from all versions in the changelog. Delete any versions that contain only a date entry and no other changes. Modify the `self.changelog_dict` in-place to reflect these changes.
-
-        This method ensures that the changelog contains only relevant and non-empty entries.
-        """
-        # Remove excluded categories
-        categories_to_remove: dict[str, list[str]] = {
-            key: [category for category in value if category in self.exclude_categories]
-            for key, value in self.changelog_dict.items()
-        }
-
-        for key, categories in categories_to_remove.items():
-            for category in categories:
-                self.changelog_dict[key].pop(category)
-
-        # Identify keys for removal
-        keys_to_remove = [key for key, version in self.changelog_dict.items() if len(version) <= 1]
-
-        # Remove the identified keys
-        for key in keys_to_remove:
-            self.changelog_dict.pop(key)
-
     def has_updates(self) -> bool:
         """Check for meaningful updates in the changelog.
 
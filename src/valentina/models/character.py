@@ -1,6 +1,9 @@
 """Character models for Valentina."""
 
+import asyncio
 import re
+from bisect import insort
+from collections import defaultdict
 from datetime import datetime
 from typing import Union, cast
 from uuid import UUID, uuid4
@@ -8,36 +11,51 @@ from uuid import UUID, uuid4
 import discord
 import inflect
 from beanie import (
+    Delete,
     Document,
     Indexed,
     Insert,
     Link,
+    PydanticObjectId,
     Replace,
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
+from beanie.operators import In
+from bson import ObjectId
 from loguru import logger
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+from pymongo import ReturnDocument, UpdateOne
 
 from valentina.constants import (
+    TRAIT_MIGRATION_BATCH_SIZE,
     CharacterConcept,
     CharClass,
     EmojiDict,
     HunterCreed,
+    ImageVariant,
     TraitCategory,
     VampireClan,
 )
-from valentina.models.aws import AWSService
+from valentina.models.aws import aws_service
 from valentina.utils import errors
+from valentina.utils.autocomplete_index import IndexKind, autocomplete_index
+from valentina.utils.channel_cache import channel_cache
 from valentina.utils.helpers import num_to_circles, time_now
+from valentina.utils.images import create_image_derivatives, derivative_key
 
 from .note import Note
 
 p = inflect.engine()
 p.defnoun("Ability", "Abilities")
 
+# Aggregation expressions for a character's embedded traits and their ids, empty when not yet embedded
+_EMBEDDED_TRAITS = {"$ifNull": ["$embedded_traits", []]}
+_EMBEDDED_TRAIT_IDS = {"$ifNull": ["$embedded_traits.id", []]}
+
 
 class CharacterSheetSection(BaseModel):
     """Represent a character sheet section as a subdocument within Character.
@@ -74,6 +92,7 @@ class CharacterTrait(Document):
     is_custom: bool = False
     max_value: int
     name: str
+    revision: int = 0  # raised by every write of the full trait
     value: int
 
     def __lt__(self, other: "CharacterTrait") -> bool:
@@ -90,6 +109,147 @@ class CharacterTrait(Document):
         """Return the trait's category as a TraitCategory enum."""
         return TraitCategory[self.category_name] if self.category_name else None
 
+    @before_event(Insert, Replace, Save)
+    def raise_revision(self) -> None:
+        """Raise the trait's revision before each write of the full trait."""
+        self.revision += 1
+
+    # save() writes through update(), so its Update event covers it
+    @after_event(Insert, Replace, Update)
+    async def update_embedded_trait(self) -> None:
+        """Write the trait's current values to the copy embedded in its character.
+
+        The embedded copy is only replaced by a copy with a higher revision, so copies of concurrent writes which land out of order never replace a newer copy.
+        """
+        if not ObjectId.is_valid(self.character):
+            return
+
+        entry = {"$literal": EmbeddedTrait.from_trait(self).model_dump()}
+        is_older_copy = {
+            "$and": [
+                {"$eq": ["$$this.id", self.id]},
+                {"$lt": [{"$ifNull": ["$$this.revision", 0]}, self.revision]},
+            ]
+        }
+        replace_entry = {"$cond": [is_older_copy, entry, "$$this"]}
+
+        # Replace an older embedded copy in place or append it in a single atomic update
+        await Character.get_pymongo_collection().update_one(
+            {"_id": ObjectId(self.character)},
+            [
+                {
+                    "$set": {
+                        "embedded_traits": {
+                            "$cond": [
+                                {"$in": [self.id, _EMBEDDED_TRAIT_IDS]},
+                                {"$map": {"input": _EMBEDDED_TRAITS, "in": replace_entry}},
+                                {"$concatArrays": [_EMBEDDED_TRAITS, [entry]]},
+                            ]
+                        }
+                    }
+                }
+            ],
+        )
+
+    @after_event(Delete)
+    async def delete_embedded_trait(self) -> None:
+        """Remove the copy of the trait embedded in its character."""
+        if not ObjectId.is_valid(self.character):
+            return
+
+        await Character.get_pymongo_collection().update_one(
+            {"_id": ObjectId(self.character)},
+            {"$pull": {"embedded_traits": {"id": self.id}}},
+        )
+
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_autocomplete_index(self) -> None:
+        """Discard the character's cached trait autocomplete index so it is rebuilt with this change."""
+        autocomplete_index.invalidate(IndexKind.TRAITS, self.character)
+
+
+class EmbeddedTrait(BaseModel):
+    """Represent a copy of a CharacterTrait stored inside its Character document.
+
+    Embedded traits let a character and all its traits be loaded with a single read. Trait values spent with points are changed in the embedded copy first and mirrored to the CharacterTrait collection. Other writes to a CharacterTrait are mirrored to its embedded copy. Both copies share a revision, which is raised by every write, so a mirrored copy never replaces a newer one. Use `to_trait()` to work with an embedded trait through the CharacterTrait API.
+    """
+
+    id: PydanticObjectId
+    category_name: str
+    display_on_sheet: bool = True
+    is_custom: bool = False
+    max_value: int
+    name: str
+    revision: int = 0
+    value: int
+
+    @classmethod
+    def from_trait(cls, trait: CharacterTrait) -> "EmbeddedTrait":
+        """Create an embedded copy of a CharacterTrait."""
+        return cls(
+            id=trait.id,
+            category_name=trait.category_name,
+            display_on_sheet=trait.display_on_sheet,
+            is_custom=trait.is_custom,
+            max_value=trait.max_value,
+            name=trait.name,
+            revision=trait.revision,
+            value=trait.value,
+        )
+
+    def to_trait(self, character_id: PydanticObjectId | str) -> CharacterTrait:
+        """Return a CharacterTrait with the same id and values, which can be saved as usual.
+
+        Args:
+            character_id (PydanticObjectId | str): The id of the character the trait belongs to.
+
+        Returns:
+            CharacterTrait: The trait.
+        """
+        return CharacterTrait(
+            id=self.id,
+            category_name=self.category_name,
+            character=str(character_id),
+            display_on_sheet=self.display_on_sheet,
+            is_custom=self.is_custom,
+            max_value=self.max_value,
+            name=self.name,
+            revision=self.revision,
+            value=self.value,
+        )
+
+
+class CharacterTraitIndex:
+    """Index a character's loaded traits by name and by category.
+
+    The index is built once from the character's trait list and reused until the list changes, so a trait is found by name in O(1) and the traits in a category are kept sorted by name. Traits which are unfetched links are not indexed.
+    """
+
+    def __init__(self, traits: list) -> None:
+        self._items = list(traits)
+        self.by_name: dict[str, CharacterTrait] = {}
+        self.by_category: defaultdict[str, list[CharacterTrait]] = defaultdict(list)
+
+        for trait in self._items:
+            if isinstance(trait, CharacterTrait):
+                self._index(trait)
+
+    def _index(self, trait: CharacterTrait) -> None:
+        # The first trait with a name wins to match a linear scan of the trait list
+        self.by_name.setdefault(trait.name, trait)
+        insort(self.by_category[trait.category_name], trait)
+
+    def append(self, trait: CharacterTrait) -> None:
+        """Index a trait which was appended to the character's trait list."""
+        self._items.append(trait)
+        self._index(trait)
+
+    def is_current(self, traits: list) -> bool:
+        """Return True if the index was built from the current contents of the trait list."""
+        return len(traits) == len(self._items) and all(
+            x is y for x, y in zip(traits, self._items, strict=True)
+        )
+
 
 class InventoryItem(Document):
     """Represent an item in a character's inventory.
@@ -117,6 +277,7 @@ class Character(Document):
     freebie_points: int = 0
     guild: Indexed(int)  # type: ignore [valid-type]
     images: list[str] = Field(default_factory=list)
+    images_with_derivatives: list[str] = Field(default_factory=list)
     is_alive: bool = True
     name_first: str
     name_last: str
@@ -127,6 +288,8 @@ class Character(Document):
     inventory: list[Link[InventoryItem]] = Field(default_factory=list)
     notes: list[Link[Note]] = Field(default_factory=list)
 
+    _trait_index: CharacterTraitIndex | None = PrivateAttr(default=None)
+
     type_chargen: bool = False
     type_debug: bool = False
     type_storyteller: bool = False
@@ -160,6 +323,12 @@ class Character(Document):
         """Update the date_modified field."""
         self.date_modified = time_now()
 
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_autocomplete_index(self) -> None:
+        """Discard the cached character and trait autocomplete indexes so they are rebuilt with this change."""
+        autocomplete_index.invalidate(IndexKind.CHARACTERS, self.guild)
+        autocomplete_index.invalidate(IndexKind.TRAITS, self.id)
+
     @property
     def name(self) -> str:
         """Return the character's name."""
@@ -219,10 +388,18 @@ class Character(Document):
         except KeyError:
             return None
 
+    @property
+    def trait_index(self) -> CharacterTraitIndex:
+        """Return the index of the character's loaded traits, rebuilding it if the trait list has changed."""
+        if self._trait_index is None or not self._trait_index.is_current(self.traits):
+            self._trait_index = CharacterTraitIndex(self.traits)
+
+        return self._trait_index
+
     async def add_image(self, extension: str, data: bytes) -> str:  # pragma: no cover
         """Add an image to a character and upload it to Amazon S3.
 
-        Generate a unique key for the image, uploads the image to S3, and updates the character in the database to include the new image.
+        Generate a unique key for the image, uploads the image to S3, and updates the character in the database to include the new image. Resized WebP derivatives of the image, one for each ImageVariant, are generated off the event loop and uploaded beside the original once it is uploaded. The derivatives are only served when all of them were uploaded.
 
         Args:
             extension (str): The file extension of the image.
@@ -231,8 +408,6 @@ class Character(Document):
         Returns:
             str: The key to the image in Amazon S3.
         """
-        aws_svc = AWSService()
-
         existing_images = [
             int(re.search(r"(\d+)\.", x.split("/")[-1]).group(1)) for x in self.images
         ]
@@ -242,16 +417,37 @@ class Character(Document):
         image_name = f"{image_number}.{extension}"
         key = f"{key_prefix}/{image_name}"
 
-        # Upload the image to S3
+        # Upload the image first so an existing image's derivatives are never overwritten
         logger.debug(f"S3: Uploading {key} to {self.name}")
-        aws_svc.upload_image(data=data, key=key)
+        derivatives = await create_image_derivatives(data)
+        uploaded = await aws_service.upload_image(data=data, key=key)
 
         # Add the image to the character's data
         self.images.append(key)
 
+        orphans: list[str] = []
+        if uploaded and derivatives:
+            derivative_keys = [derivative_key(key, variant) for variant in derivatives]
+            results = await asyncio.gather(
+                *(
+                    aws_service.upload_image(data=derivative, key=x, overwrite=True)
+                    for x, derivative in zip(derivative_keys, derivatives.values(), strict=True)
+                )
+            )
+
+            # Serve the original image unless every derivative was uploaded
+            if all(results):
+                self.images_with_derivatives.append(key)
+            else:
+                logger.warning(f"S3: Serving {key} without derivatives which failed to upload")
+                orphans = [x for x, result in zip(derivative_keys, results, strict=True) if result]
+
         # Save the character
         await self.save()
 
+        if orphans:
+            await aws_service.delete_objects(orphans)
+
         return key
 
     async def add_trait(
@@ -270,6 +466,7 @@ class Character(Document):
             errors.TraitExistsError: If a trait with the same name and category already exists for the character.
         """
         await self.fetch_all_links()
+        index = self.trait_index
 
         for existing_trait in cast("list[CharacterTrait]", self.traits):
             # If the trait already exists in the character's trait list, return it
@@ -290,10 +487,276 @@ class Character(Document):
 
         await trait.save()
         self.traits.append(trait)
+        index.append(trait)
         await self.save()
 
         return trait
 
+    def stage_trait(self, trait: "CharacterTrait") -> "CharacterTrait":
+        """Add a trait to a character which has not been written to the database.
+
+        The trait is validated and appended to the character's traits in memory. Nothing is written until `insert_with_traits()` is called, so a full character can be assembled without a database round trip per trait.
+
+        Args:
+            trait (CharacterTrait): The trait to add to the character.
+
+        Returns:
+            CharacterTrait: The staged trait object.
+
+        Raises:
+            errors.TraitExistsError: If a trait with the same name and category already exists for the character.
+        """
+        index = self.trait_index
+        for existing_trait in index.by_category[trait.category_name]:
+            if trait.name.lower() == existing_trait.name.lower():
+                msg = f"Trait named '{trait.name}' already exists in category '{trait.category_name}' for character '{self.name}'"
+                raise errors.TraitExistsError(msg)
+
+        self.traits.append(trait)
+        index.append(trait)
+        return trait
+
+    async def insert_with_traits(self) -> "Character":
+        """Write a character assembled in memory and its staged traits to the database.
+
+        All traits are written with a single `insert_many`, the character with a single insert, and the traits are embedded in the character document with a single update. `insert_many` runs no hooks, so no trait is mirrored to the character on its own.
+
+        Returns:
+            Character: The inserted character.
+        """
+        if not self.id:
+            self.id = PydanticObjectId()
+
+        traits = cast("list[CharacterTrait]", self.traits)
+        for trait in traits:
+            trait.id = trait.id or PydanticObjectId()
+            trait.character = str(self.id)
+
+        if traits:
+            await CharacterTrait.insert_many(traits)
+
+        await self.insert()
+        await self.get_pymongo_collection().update_one(
+            {"_id": self.id},
+            {
+                "$set": {
+                    "embedded_traits": [EmbeddedTrait.from_trait(x).model_dump() for x in traits],
+                    "traits_embedded": True,
+                }
+            },
+        )
+        return self
+
+    @classmethod
+    async def get_with_traits(
+        cls, character_id: PydanticObjectId | str, links: tuple[str, ...] = ()
+    ) -> Union["Character", None]:
+        """Fetch a character with its traits loaded, without fetching links which are not needed.
+
+        Characters with embedded traits are loaded with a single read. Use this instead of `get(..., fetch_links=True)` wherever the traits are read.
+
+        Args:
+            character_id (PydanticObjectId | str): The id of the character.
+            links (tuple[str, ...]): The other links to fetch, such as "inventory" or "notes". Defaults to none.
+
+        Returns:
+            Character | None: The character, or None if the id is invalid or the character does not exist.
+        """
+        if not PydanticObjectId.is_valid(character_id):
+            return None
+
+        document = await cls.get_pymongo_collection().find_one(
+            {"_id": PydanticObjectId(character_id)}
+        )
+        if not document:
+            return None
+
+        character = cls.model_validate(document)
+        await character.load_traits(document)
+        for link in links:
+            await character.fetch_link(link)
+
+        return character
+
+    async def load_traits(self, document: dict | None = None) -> None:
+        """Load the character's traits.
+
+        Embedded traits are loaded from the character document. Otherwise the linked traits are fetched and embedded in the character, so the next load is a single read. The embedded traits are not fields of the model and are only written by targeted updates, so saving a character loaded before a trait changed never overwrites them.
+
+        Args:
+            document (dict | None): The character's raw document, when it was already read. Defaults to reading the embedded traits from the database.
+        """
+        if document is None:
+            document = (
+                await self.get_pymongo_collection().find_one(
+                    {"_id": self.id}, projection=["embedded_traits", "traits_embedded"]
+                )
+                or {}
+            )
+
+        if document.get("traits_embedded"):
+            self.traits = [
+                EmbeddedTrait.model_validate(x).to_trait(self.id)
+                for x in document.get("embedded_traits") or []
+            ]
+            return
+
+        await self.fetch_link("traits")
+        await Character.embed_linked_traits(character_ids=[self.id])
+
+    async def change_embedded_trait_value(self, trait: "CharacterTrait", amount: int) -> bool:
+        """Atomically add to the value of a trait embedded in the character if it still has the value in memory.
+
+        The embedded copy is changed with a single compare-and-set on the character document, which raises its revision, and the new value is then mirrored to the CharacterTrait collection unless a newer revision was already written there. Characters which do not yet embed their traits are migrated first.
+
+        Args:
+            trait (CharacterTrait): The trait to change. Updated in place with its new value and revision when it was changed.
+            amount (int): The amount to add to the trait's value. Negative to lower the value.
+
+        Returns:
+            bool: True if the value was changed, False if the embedded trait does not have the value of `trait` or would be raised above its max value.
+        """
+        element: dict = {"id": trait.id, "value": trait.value}
+        if amount > 0:
+            element["max_value"] = {"$gte": trait.value + amount}
+
+        while True:
+            document = await self.get_pymongo_collection().find_one_and_update(
+                {
+                    "_id": self.id,
+                    "traits_embedded": True,
+                    "embedded_traits": {"$elemMatch": element},
+                },
+                {
+                    "$inc": {
+                        "embedded_traits.$[trait].value": amount,
+                        "embedded_traits.$[trait].revision": 1,
+                    }
+                },
+                projection={"embedded_traits": {"$elemMatch": {"id": trait.id}}},
+                array_filters=[{"trait.id": trait.id}],
+                return_document=ReturnDocument.AFTER,
+            )
+            if document:
+                break
+
+            # Retry once the character is migrated, which only happens when it did not yet embed its traits
+            if not await Character.embed_linked_traits(character_ids=[self.id]):
+                return False
+
+        changed = EmbeddedTrait.model_validate(document["embedded_traits"][0])
+        trait.value, trait.revision = changed.value, changed.revision
+
+        await CharacterTrait.get_pymongo_collection().update_one(
+            {"_id": trait.id, "revision": {"$lt": trait.revision}},
+            {"$set": {"value": trait.value, "revision": trait.revision}},
+        )
+        trait.invalidate_autocomplete_index()
+        return True
+
+    async def fetch_embedded_trait(
+        self, trait_id: PydanticObjectId
+    ) -> Union["CharacterTrait", None]:
+        """Fetch the current values of a trait embedded in the character.
+
+        Args:
+            trait_id (PydanticObjectId): The id of the trait.
+
+        Returns:
+            CharacterTrait | None: The trait, or None if it is not embedded in the character.
+        """
+        document = await self.get_pymongo_collection().find_one(
+            {"_id": self.id}, projection={"embedded_traits": {"$elemMatch": {"id": trait_id}}}
+        )
+        if not document or not document.get("embedded_traits"):
+            return None
+
+        return EmbeddedTrait.model_validate(document["embedded_traits"][0]).to_trait(self.id)
+
+    @classmethod
+    async def embed_linked_traits(
+        cls,
+        character_ids: list[PydanticObjectId] | None = None,
+        batch_size: int = TRAIT_MIGRATION_BATCH_SIZE,
+    ) -> int:
+        """Migrate characters to embedded traits by copying their linked traits into the character documents.
+
+        The migration runs online. Characters are read in batches, the traits of a batch are read with a single query, and the batch is written with a single bulk write. Trait writes made during the migration are kept because embedded copies already written by the CharacterTrait hooks are never overwritten. Characters whose trait list changes during the migration are skipped and migrated when next loaded.
+
+        Args:
+            character_ids (list[PydanticObjectId] | None): The characters to migrate. Defaults to all characters which do not yet embed their traits.
+            batch_size (int): The number of characters migrated per batch.
+
+        Returns:
+            int: The number of characters migrated.
+        """
+        collection = cls.get_pymongo_collection()
+        id_query: dict = {"$in": character_ids} if character_ids is not None else {"$exists": True}
+
+        migrated = 0
+        while True:
+            batch = (
+                await collection.find(
+                    {"_id": id_query, "traits_embedded": {"$ne": True}}, {"traits": 1}
+                )
+                .sort("_id", 1)
+                .limit(batch_size)
+                .to_list()
+            )
+            if not batch:
+                break
+
+            id_query["$gt"] = batch[-1]["_id"]
+
+            trait_ids = [ref.id for doc in batch for ref in doc.get("traits") or []]
+            traits = {
+                x.id: x
+                for x in await CharacterTrait.find(In(CharacterTrait.id, trait_ids)).to_list()
+            }
+
+            requests = []
+            for doc in batch:
+                snapshot = [
+                    EmbeddedTrait.from_trait(traits[ref.id]).model_dump()
+                    for ref in doc.get("traits") or []
+                    if ref.id in traits
+                ]
+                # Embedded copies written by the CharacterTrait hooks are newer than the snapshot
+                new_entries = {
+                    "$filter": {
+                        "input": {"$literal": snapshot},
+                        "cond": {"$not": [{"$in": ["$$this.id", _EMBEDDED_TRAIT_IDS]}]},
+                    }
+                }
+                requests.append(
+                    UpdateOne(
+                        # Skip the character if its trait list changed since it was read
+                        {
+                            "_id": doc["_id"],
+                            "traits_embedded": {"$ne": True},
+                            "traits": doc.get("traits"),
+                        },
+                        [
+                            {
+                                "$set": {
+                                    "embedded_traits": {
+                                        "$concatArrays": [_EMBEDDED_TRAITS, new_entries]
+                                    },
+                                    "traits_embedded": True,
+                                }
+                            }
+                        ],
+                    )
+                )
+
+            result = await collection.bulk_write(requests, ordered=False)
+            migrated += result.modified_count
+
+        if migrated:
+            logger.info(f"DATABASE: Embedded traits in {migrated} characters")
+
+        return migrated
+
     async def delete_trait(self, trait_id: str) -> None:
         """Delete a trait from the character and update the database.
 
@@ -311,6 +774,7 @@ class Character(Document):
             await trait.delete()
 
         self.traits = [trait for trait in self.traits if str(trait.id) != str(trait_id)]  # type: ignore [attr-defined]
+        self._trait_index = None
         await self.save()
 
     def concept_description(self) -> str:
@@ -339,6 +803,31 @@ class Character(Document):
 {special_abilities}
 """
 
+    def _image_keys_with_derivatives(self, keys: list[str]) -> list[str]:
+        """Return image keys along with the keys of their derivatives."""
+        all_keys = []
+        for key in keys:
+            all_keys.append(key)
+            if key in self.images_with_derivatives:
+                all_keys.extend(derivative_key(key, variant) for variant in ImageVariant)
+
+        return all_keys
+
+    def image_url(self, key: str, variant: ImageVariant | None = None) -> str:
+        """Get the URL of a character's image at a given size.
+
+        Args:
+            key (str): The key of the original image.
+            variant (ImageVariant | None): The derivative to return. Returns the original image when None or when the image has no derivatives, such as animated images and images uploaded before derivatives were generated. Defaults to None.
+
+        Returns:
+            str: The URL of the image.
+        """
+        if variant and key in self.images_with_derivatives:
+            return aws_service.get_url(derivative_key(key, variant))
+
+        return aws_service.get_url(key)
+
     async def delete_image(self, key: str) -> None:  # pragma: no cover
         """Delete a character's image from both the character data and Amazon S3.
 
@@ -352,23 +841,25 @@ class Character(Document):
         Returns:
             None
         """
-        aws_svc = AWSService()
+        keys = self._image_keys_with_derivatives([key])
 
         # Remove image key from character's data
         if key in self.images:
             self.images.remove(key)
+            if key in self.images_with_derivatives:
+                self.images_with_derivatives.remove(key)
             await self.save()
             logger.debug(f"DATA: Removed image key '{key}' from character '{self.name}'")
 
-        # Delete the image from Amazon S3
-        aws_svc.delete_object(key)
+        # Delete the image and its derivatives from Amazon S3
+        await aws_service.delete_objects(keys)
         logger.info(f"S3: Delete {key} from {self.name}")
 
     async def delete_all_images(self) -> None:
         """Delete all images associated with a character from both S3 storage and database.
 
-        Iterates through all image keys stored in the character's images list, deleting each
-        image from S3 storage and removing the reference from the database.
+        Deletes every image key stored in the character's images list from S3 storage with
+        batched requests and removes the references from the database.
 
         Returns:
             None
@@ -376,23 +867,18 @@ class Character(Document):
         if not self.images:
             return
 
-        aws_svc = AWSService()
-        for key in self.images:
-            aws_svc.delete_object(key)
+        for key in await aws_service.delete_objects(self._image_keys_with_derivatives(self.images)):
             logger.debug(f"S3: Delete {key}")
 
         self.images = []
+        self.images_with_derivatives = []
         await self.save()
 
         logger.info(f"S3: Deleted all images for {self.name}")
 
     async def fetch_trait_by_name(self, name: str) -> Union["CharacterTrait", None]:
         """Fetch a CharacterTrait by name."""
-        for trait in cast("list[CharacterTrait]", self.traits):
-            if trait.name == name:
-                return trait
-
-        return None
+        return self.trait_index.by_name.get(name)
 
     async def update_channel_id(self, channel: discord.TextChannel) -> None:
         """Update the character's channel ID in the database.
@@ -401,6 +887,7 @@ class Character(Document):
             channel (discord.TextChannel): The character's channel.
         """
         if self.channel != channel.id:
+            channel_cache.invalidate(self.channel, channel.id)
             self.channel = channel.id
             await self.save()
 
@@ -420,22 +907,9 @@ class Character(Document):
         Returns:
             list[CharacterTrait]: A list of traits that match the specified category.
         """
-        if show_zeros:
-            return sorted(
-                [
-                    x
-                    for x in cast("list[CharacterTrait]", self.traits)
-                    if x.category_name == category.name
-                ],
-                key=lambda x: x.name,
-            )
+        traits = self.trait_index.by_category.get(category.name, [])
 
-        return sorted(
-            [
-                x
-                for x in cast("list[CharacterTrait]", self.traits)
-                if x.category_name == category.name
-                and not (x.value == 0 and not category.value.show_zero)
-            ],
-            key=lambda x: x.name,
-        )
+        if show_zeros or category.value.show_zero:
+            return list(traits)
+
+        return [x for x in traits if x.value != 0]
@@ -3,11 +3,13 @@
 from typing import TYPE_CHECKING, Optional
 
 import inflect
+import numpy as np
 from loguru import logger
 
 from valentina.constants import MAX_POOL_SIZE, DiceType, EmbedColor, RollResultType
 from valentina.models import Campaign, Character, Guild, RollStatistic
-from valentina.utils import errors, random_num
+from valentina.models.statistics import roll_statistic_writer
+from valentina.utils import errors, random_num_array
 from valentina.utils.helpers import convert_int_to_emoji
 
 p = inflect.engine()
@@ -16,6 +18,43 @@ if TYPE_CHECKING:
     from valentina.discord.bot import ValentinaContext
 
 
+def validate_roll(pool: int, difficulty: int, dice_size: int) -> DiceType:
+    """Validate the parameters of a dice roll.
+
+    Args:
+        pool (int): The number of dice to roll.
+        difficulty (int): The difficulty of the roll.
+        dice_size (int): The number of sides on each die.
+
+    Returns:
+        DiceType: The type of dice being rolled.
+
+    Raises:
+        errors.ValidationError: If any of the parameters are invalid.
+    """
+    dice_size_values = [member.value for member in DiceType]
+    if dice_size not in dice_size_values:
+        msg = f"Invalid dice size `{dice_size}`."
+        raise errors.ValidationError(msg)
+
+    dice_type = DiceType(dice_size)
+
+    if difficulty < 0:
+        msg = f"Difficulty cannot be less than 0. (Got `{difficulty}`.)"
+        raise errors.ValidationError(msg)
+    if difficulty > dice_type.value:
+        msg = f"Difficulty cannot exceed the size of the dice. (Got `{difficulty}` for `{dice_type.name}`.)"
+        raise errors.ValidationError(msg)
+    if pool < 0:
+        msg = f"Pool cannot be less than 0. (Got `{pool}`.)"
+        raise errors.ValidationError(msg)
+    if pool > MAX_POOL_SIZE:
+        msg = f"Pool cannot exceed {MAX_POOL_SIZE}. (Got `{pool}`.)"
+        raise errors.ValidationError(msg)
+
+    return dice_type
+
+
 class DiceRoll:
     """Represent a dice roll and its results.
 
@@ -67,26 +106,7 @@ class DiceRoll:
             msg = "A context must be provided if guild_id, author_id, or author_name are not provided."
             raise errors.ValidationError(msg)
 
-        dice_size_values = [member.value for member in DiceType]
-        if dice_size not in dice_size_values:
-            msg = f"Invalid dice size `{dice_size}`."
-            raise errors.ValidationError(msg)
-
-        self.dice_type = DiceType(dice_size)
-
-        if difficulty < 0:
-            msg = f"Difficulty cannot be less than 0. (Got `{difficulty}`.)"
-            raise errors.ValidationError(msg)
-        if difficulty > self.dice_type.value:
-            msg = f"Difficulty cannot exceed the size of the dice. (Got `{difficulty}` for `{self.dice_type.name}`.)"
-            raise errors.ValidationError(msg)
-        if pool < 0:
-            msg = f"Pool cannot be less than 0. (Got `{pool}`.)"
-            raise errors.ValidationError(msg)
-        if pool > MAX_POOL_SIZE:
-            msg = f"Pool cannot exceed {MAX_POOL_SIZE}. (Got `{pool}`.)"
-            raise errors.ValidationError(msg)
-
+        self.dice_type = validate_roll(pool=pool, difficulty=difficulty, dice_size=dice_size)
         self.difficulty = difficulty
         self.pool = pool
 
@@ -139,7 +159,8 @@ class DiceRoll:
         Record the details of the current dice roll in the database, including
         information about the roll result, character, and associated traits.
         This method is crucial for maintaining historical data and generating
-        roll statistics.
+        roll statistics. The roll is queued and written in a batch with other
+        rolls so the caller does not wait on the database.
 
         Args:
             traits (list[str], optional): A list of trait names associated with
@@ -164,7 +185,7 @@ class DiceRoll:
                 traits=traits,
                 campaign=str(self.campaign.id) if self.campaign else None,
             )
-            await stat.insert()
+            await roll_statistic_writer.add(stat)
 
             logger.debug(
                 f"DICEROLL: {self.author_name or self.ctx.author.display_name} rolled {self.roll} for {self.result_type.name}",
@@ -206,7 +227,7 @@ class DiceRoll:
             first accessed and storing the results for future use.
         """
         if not self._roll:
-            self._roll = [int(random_num(self.dice_type.value)) for x in range(self.pool)]
+            self._roll = random_num_array(self.dice_type.value, size=self.pool).tolist()
 
         return self._roll
 
@@ -226,9 +247,9 @@ class DiceRoll:
             first accessed and storing the results for future use.
         """
         if not self._desperation_roll:
-            self._desperation_roll = [
-                random_num(self.dice_type.value) for x in range(self.desperation_pool)
-            ]
+            self._desperation_roll = random_num_array(
+                self.dice_type.value, size=self.desperation_pool
+            ).tolist()
 
         return self._desperation_roll
 
@@ -479,3 +500,106 @@ class DiceRoll:
                 f"{convert_int_to_emoji(die, images=True)}" for die in sorted(self.desperation_roll)
             )
         return self._desperation_dice_as_emoji_images
+
+
+class RollBatch:
+    """Represent many rolls of the same dice pool.
+
+    Draw every die of every roll with a single call to the random number generator and
+    calculate the results with array operations. The rules match `DiceRoll`, but the cost
+    of validating and rolling is paid once for the whole batch rather than once per roll.
+
+    Use this class to:
+    - Simulate large numbers of rolls for probability calculations
+    - Stress test roll handling
+    - Roll the same pool many times at once
+
+    Attributes:
+        rolls (int): The number of rolls in the batch
+        pool (int): The number of dice in each roll
+        difficulty (int): The difficulty of each roll
+        dice_type (DiceType): The type of dice used for the rolls
+        dice (np.ndarray): A `(rolls, pool)` array of the rolled dice
+        botches (np.ndarray): The number of botches (ones) in each roll
+        criticals (np.ndarray): The number of critical successes in each roll
+        failures (np.ndarray): The number of failed dice, excluding botches, in each roll
+        successes (np.ndarray): The number of successful dice, excluding criticals, in each roll
+        results (np.ndarray): The final result of each roll
+    """
+
+    def __init__(self, rolls: int, pool: int, difficulty: int = 6, dice_size: int = 10) -> None:
+        """Roll the dice pool the given number of times.
+
+        Args:
+            rolls (int): The number of times to roll the pool.
+            pool (int): The number of dice in each roll.
+            difficulty (int, optional): The difficulty of each roll. Defaults to 6.
+            dice_size (int, optional): The number of sides on each die. Defaults to 10.
+
+        Raises:
+            errors.ValidationError: If any of the roll parameters are invalid.
+        """
+        if rolls < 0:
+            msg = f"Rolls cannot be less than 0. (Got `{rolls}`.)"
+            raise errors.ValidationError(msg)
+
+        self.dice_type = validate_roll(pool=pool, difficulty=difficulty, dice_size=dice_size)
+        self.rolls = rolls
+        self.pool = pool
+        self.difficulty = difficulty
+
+        self.dice = random_num_array(self.dice_type.value, size=(rolls, pool))
+
+        self.botches = np.count_nonzero(self.dice == 1, axis=1)
+        self.criticals = np.count_nonzero(self.dice == self.dice_type.value, axis=1)
+        self.failures = np.count_nonzero(
+            (self.dice >= 2) & (self.dice <= difficulty - 1),  # noqa: PLR2004
+            axis=1,
+        )
+        self.successes = np.count_nonzero(
+            (self.dice >= difficulty) & (self.dice <= self.dice_type.value - 1),
+            axis=1,
+        )
+
+        if self.dice_type != DiceType.D10:
+            self.results = self.successes + self.criticals - self.failures - self.botches
+        else:
+            botches = np.maximum(0, self.botches - self.criticals)
+            criticals = np.maximum(0, self.criticals - self.botches)
+            self.results = self.successes + (criticals * 2) - botches
+
+    def __len__(self) -> int:
+        """Return the number of rolls in the batch."""
+        return self.rolls
+
+    @property
+    def result_types(self) -> np.ndarray:
+        """Return the result type of each roll as an array of `RollResultType` values.
+
+        Apply the same rules as `DiceRoll.result_type` to every roll in the batch.
+
+        Returns:
+            np.ndarray: The `RollResultType` value of each roll.
+        """
+        if self.dice_type != DiceType.D10:
+            return np.full(self.rolls, RollResultType.OTHER.value)
+
+        return np.select(
+            [self.results < 0, self.results == 0, self.results > self.pool],
+            [
+                RollResultType.BOTCH.value,
+                RollResultType.FAILURE.value,
+                RollResultType.CRITICAL.value,
+            ],
+            default=RollResultType.SUCCESS.value,
+        )
+
+    @property
+    def result_type_counts(self) -> dict[RollResultType, int]:
+        """Count the number of rolls with each result type.
+
+        Returns:
+            dict[RollResultType, int]: The number of rolls for every `RollResultType`.
+        """
+        counts = np.bincount(self.result_types, minlength=len(RollResultType))
+        return {result_type: int(counts[result_type.value]) for result_type in RollResultType}
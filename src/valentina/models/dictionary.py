@@ -1,15 +1,18 @@
 """Model for the Valentina dictionary."""
 
 import re
+from collections.abc import Callable, Iterable
 from datetime import datetime
 
 from beanie import (
+    Delete,
     Document,
     Insert,
     Replace,
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
 from pydantic import Field
@@ -42,3 +45,121 @@ class DictionaryTerm(Document):
     def normalize_synonyms(self) -> None:
         """Normalize the synonyms."""
         self.synonyms = [x.lower().strip() for x in self.synonyms if re.search(r"\w", x)]
+
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_term_matcher(self) -> None:
+        """Discard the guild's cached term matcher so it is rebuilt with this change."""
+        dictionary_term_cache.invalidate(self.guild_id)
+
+
+class DictionaryTermMatcher:
+    """Match every linkable term and synonym in a guild's dictionary with a single compiled regex.
+
+    All terms and synonyms are combined into one alternation ordered longest first, so text is scanned in a single pass and the longest term wins where terms overlap. Matches are case-insensitive and only match whole words which are not part of a path or URL.
+    """
+
+    def __init__(self, terms: Iterable[DictionaryTerm]) -> None:
+        """Initialize the DictionaryTermMatcher class.
+
+        Args:
+            terms (Iterable[DictionaryTerm]): The guild's dictionary terms. Terms without a definition or link are ignored as there is nothing to link them to.
+        """
+        self.terms: dict[str, DictionaryTerm] = {}
+        for term in terms:
+            if not term.definition and not term.link:
+                continue
+
+            for word in (term.term, *term.synonyms):
+                self.terms.setdefault(word.lower(), term)
+
+        alternation = "|".join(re.escape(x) for x in sorted(self.terms, key=len, reverse=True))
+        self.pattern: re.Pattern[str] | None = (
+            re.compile(rf"\b(?<![\w/])(?:{alternation})\b(?![\w/]|://)", re.IGNORECASE)
+            if self.terms
+            else None
+        )
+
+    def sub(
+        self,
+        repl: Callable[[DictionaryTerm, str], str],
+        value: str,
+        excludes: Iterable[str] = (),
+    ) -> str:
+        """Replace every dictionary term in the text.
+
+        Args:
+            repl (Callable[[DictionaryTerm, str], str]): Called with the matched term and the matched text. Returns the replacement text.
+            value (str): The text to search.
+            excludes (Iterable[str], optional): Terms to leave unchanged, along with their synonyms. Defaults to ().
+
+        Returns:
+            str: The text with every dictionary term replaced.
+        """
+        if self.pattern is None:
+            return value
+
+        excludes = set(excludes)
+
+        def _replace(match: re.Match) -> str:
+            term = self.terms.get(match.group(0).lower())
+            if not term or term.term in excludes:
+                return match.group(0)
+
+            return repl(term, match.group(0))
+
+        return self.pattern.sub(_replace, value)
+
+
+class DictionaryTermCache:
+    """Cache a compiled DictionaryTermMatcher for each guild.
+
+    A guild's matcher is built from the database the first time it is needed and discarded whenever one of the guild's terms is written or deleted.
+    """
+
+    def __init__(self) -> None:
+        self._matchers: dict[int, DictionaryTermMatcher] = {}
+        self._generation = 0
+
+    async def get(self, guild_id: int) -> DictionaryTermMatcher:
+        """Return the term matcher for a guild, building it if it is not cached.
+
+        Args:
+            guild_id (int): The ID of the guild.
+
+        Returns:
+            DictionaryTermMatcher: The guild's term matcher.
+        """
+        guild_id = int(guild_id)
+        if guild_id in self._matchers:
+            return self._matchers[guild_id]
+
+        generation = self._generation
+        matcher = DictionaryTermMatcher(
+            await DictionaryTerm.find(DictionaryTerm.guild_id == guild_id).to_list()
+        )
+
+        # Do not cache a matcher built from terms which changed while they were being fetched
+        if self._generation == generation:
+            self._matchers[guild_id] = matcher
+
+        return matcher
+
+    def invalidate(self, guild_id: int | None = None) -> None:
+        """Discard cached term matchers.
+
+        Args:
+            guild_id (int | None, optional): The guild whose matcher to discard. Discards every guild's matcher when None. Defaults to None.
+        """
+        self._generation += 1
+
+        if guild_id is None:
+            self._matchers.clear()
+        else:
+            self._matchers.pop(int(guild_id), None)
+
+    def clear(self) -> None:
+        """Forget every cached term matcher."""
+        self.invalidate()
+
+
+dictionary_term_cache = DictionaryTermCache()
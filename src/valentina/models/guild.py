@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import discord
 from beanie import (
+    Delete,
     Document,
     Insert,
     Link,
@@ -13,6 +14,7 @@ from beanie import (
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
 from loguru import logger
@@ -20,6 +22,7 @@ from pydantic import BaseModel, Field
 
 from valentina.constants import (
     DICEROLL_THUMBS,
+    STORYTELLER_ROLE_NAMES,
     PermissionManageCampaign,
     PermissionsGrantXP,
     PermissionsKillCharacter,
@@ -29,6 +32,7 @@ from valentina.constants import (
 from valentina.discord.utils import create_player_role, create_storyteller_role
 from valentina.utils import errors
 from valentina.utils.helpers import time_now
+from valentina.utils.permission_cache import guild_permission_cache
 
 from .campaign import Campaign
 
@@ -88,6 +92,11 @@ class Guild(Document):
         """Update the date_modified field."""
         self.date_modified = time_now()
 
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_permission_cache(self) -> None:
+        """Discard the guild's cached permission snapshot so it is reloaded with this change."""
+        guild_permission_cache.invalidate(self.id)
+
     def fetch_changelog_channel(
         self,
         guild: discord.Guild,
@@ -178,6 +187,91 @@ class Guild(Document):
         await create_player_role(guild)
         logger.debug(f"GUILD: Roles created/updated on {self.name}")
 
+    @staticmethod
+    def member_roles(member: discord.Member) -> tuple[bool, bool]:
+        """Return whether a member is an administrator and whether they are a storyteller.
+
+        Args:
+            member (discord.Member): The member to check.
+
+        Returns:
+            tuple[bool, bool]: A tuple of (is_administrator, is_storyteller).
+        """
+        return (
+            member.guild_permissions.administrator,
+            any(role.name in STORYTELLER_ROLE_NAMES for role in member.roles),
+        )
+
+    async def sync_roles(self, guild: discord.Guild) -> bool:
+        """Synchronize the guild's administrators and storytellers with the roles of its members in Discord.
+
+        The target lists are computed from the members in a single pass and written with a single `$set`, and only when they differ from the stored lists. Until the guild's member cache is complete, members missing from it keep their stored roles, so an incomplete cache never removes them.
+
+        Args:
+            guild (discord.Guild): The Discord guild to synchronize.
+
+        Returns:
+            bool: True if the lists were changed.
+        """
+        administrators: set[int] = set()
+        storytellers: set[int] = set()
+        for member in guild.members:
+            if member.bot:
+                continue
+
+            is_administrator, is_storyteller = self.member_roles(member)
+            if is_administrator:
+                administrators.add(member.id)
+            if is_storyteller:
+                storytellers.add(member.id)
+
+        if not guild.chunked:
+            member_ids = {member.id for member in guild.members}
+            administrators.update(set(self.administrators) - member_ids)
+            storytellers.update(set(self.storytellers) - member_ids)
+
+        if administrators == set(self.administrators) and storytellers == set(self.storytellers):
+            return False
+
+        names = {member.id: member.name for member in guild.members}
+        for role, current, target in (
+            ("administrator", set(self.administrators), administrators),
+            ("@Storyteller", set(self.storytellers), storytellers),
+        ):
+            for member_id in target - current:
+                logger.info(f"PERMS: Add {names[member_id]} as {role} in database")
+            for member_id in current - target:
+                logger.info(
+                    f"PERMS: Remove {names.get(member_id, member_id)} as {role} in database"
+                )
+
+        await self.set(
+            {"administrators": sorted(administrators), "storytellers": sorted(storytellers)}
+        )
+        return True
+
+    @classmethod
+    async def sync_member_roles(cls, member: discord.Member) -> None:
+        """Add or remove a single member from their guild's administrators and storytellers.
+
+        Args:
+            member (discord.Member): The member whose roles changed.
+        """
+        is_administrator, is_storyteller = cls.member_roles(member)
+
+        update: dict = {}
+        for field, is_member in (
+            ("administrators", is_administrator),
+            ("storytellers", is_storyteller),
+        ):
+            update.setdefault("$addToSet" if is_member else "$pull", {})[field] = member.id
+
+        await cls.find_one(cls.id == member.guild.id).update(update)
+        guild_permission_cache.invalidate(member.guild.id)
+        logger.info(
+            f"PERMS: Sync roles for {member.name} in {member.guild.name} (administrator: {is_administrator}, storyteller: {is_storyteller})"
+        )
+
     async def delete_campaign(self, campaign: "Campaign") -> None:
         """Delete a campaign from the guild and mark it as deleted in the database.
 
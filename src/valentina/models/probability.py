@@ -1,16 +1,26 @@
 """Utilities for diceroll probability calculations."""
 
-from collections import defaultdict
+import asyncio
+from collections import Counter
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 import discord
+import numpy as np
 from beanie import Document, Indexed
 from loguru import logger
 from pydantic import Field
 
-from valentina.constants import EmbedColor, RollResultType
-from valentina.models import DiceRoll
+from valentina.constants import (
+    PRECOMPUTED_PROBABILITY_MAX_POOL,
+    DiceType,
+    EmbedColor,
+    RollResultType,
+)
+from valentina.models import RollBatch
+from valentina.models.dicerolls import validate_roll
 from valentina.utils.helpers import time_now
 
 if TYPE_CHECKING:
@@ -47,10 +57,151 @@ class RollProbability(Document):
     OTHER: float
 
 
+def calculate_exact_probabilities(pool: int, difficulty: int, dice_size: int) -> dict[str, float]:
+    """Calculate the exact probabilities of a dice roll.
+
+    Classify every face of a single die using the same rules as `DiceRoll` and convolve the per-die outcomes across the pool. For d10 rolls the distribution is tracked over the net of criticals minus botches and the number of successes, which is all that is needed to apply the botch-cancels-critical rule. Rolls with other dice always have a result type of OTHER, so only the expected result is computed for them.
+
+    Args:
+        pool (int): Pool of dice.
+        difficulty (int): Difficulty level.
+        dice_size (int): Size of the dice.
+
+    Returns:
+        dict[str, float]: Percentages keyed by the name of each result field on `RollProbability`.
+    """
+    faces = range(1, dice_size + 1)
+    botch_faces = [face for face in faces if face == 1]
+    critical_faces = [face for face in faces if face == dice_size]
+    failure_faces = [face for face in faces if 2 <= face <= difficulty - 1]  # noqa: PLR2004
+    success_faces = [face for face in faces if difficulty <= face <= dice_size - 1]
+
+    probabilities: dict[str, float] = dict.fromkeys([result.name for result in RollResultType], 0.0)
+    probabilities["botch_dice"] = len(botch_faces) / dice_size * 100
+    probabilities["critical_dice"] = len(critical_faces) / dice_size * 100
+    probabilities["failure_dice"] = len(failure_faces) / dice_size * 100
+    probabilities["success_dice"] = len(success_faces) / dice_size * 100
+
+    if dice_size != DiceType.D10.value:
+        # Results are linear in the dice counts so the expected result is the sum of the per-die expectations
+        expected_result = pool * (
+            len(success_faces) + len(critical_faces) - len(failure_faces) - len(botch_faces)
+        )
+        probabilities["total_results"] = expected_result / dice_size * 100
+        probabilities["OTHER"] = 100.0
+        probabilities["total_successes"] = 0.0
+        probabilities["total_failures"] = 0.0
+        return probabilities
+
+    # Every face moves a die's contribution to (criticals - botches, successes)
+    face_outcomes = Counter(
+        ((face in critical_faces) - (face in botch_faces), int(face in success_faces))
+        for face in faces
+    )
+
+    # Raise the per-die distribution to the size of the pool in the frequency domain. The grid is
+    # large enough that the circular convolution never wraps, with negative nets stored at the end.
+    rows, columns = 1 << (2 * pool).bit_length(), 1 << pool.bit_length()
+    die = np.zeros((rows, columns))
+    for (net, successes), count in face_outcomes.items():
+        die[net % rows, successes % columns] += count / dice_size
+
+    spectrum = np.fft.rfft2(die)
+    pooled, exponent = np.ones_like(spectrum), pool
+    while exponent:
+        if exponent & 1:
+            pooled *= spectrum
+        spectrum, exponent = spectrum * spectrum, exponent >> 1
+
+    # distribution[net + pool, successes] is the probability of rolling that combination
+    distribution = np.fft.irfft2(pooled, s=die.shape).clip(min=0)
+    distribution = np.roll(distribution, pool, axis=0)[: 2 * pool + 1, : pool + 1]
+
+    nets = np.arange(-pool, pool + 1)[:, np.newaxis]
+    success_counts = np.arange(pool + 1)[np.newaxis, :]
+    results = success_counts + 2 * np.maximum(nets, 0) - np.maximum(-nets, 0)
+
+    probabilities["total_results"] = float((distribution * results).sum()) * 100
+    probabilities["BOTCH"] = float(distribution[results < 0].sum()) * 100
+    probabilities["FAILURE"] = float(distribution[results == 0].sum()) * 100
+    probabilities["CRITICAL"] = float(distribution[results > pool].sum()) * 100
+    probabilities["SUCCESS"] = float(distribution[(results > 0) & (results <= pool)].sum()) * 100
+    probabilities["total_successes"] = probabilities["SUCCESS"] + probabilities["CRITICAL"]
+    probabilities["total_failures"] = probabilities["FAILURE"] + probabilities["BOTCH"]
+
+    return probabilities
+
+
+class ProbabilityTable:
+    """In-memory table of exact probabilities for the dice rolls players ask about.
+
+    The table holds every difficulty of d10 pools up to PRECOMPUTED_PROBABILITY_MAX_POOL dice, the only dice the probability command rolls. It is built once when the bot starts and never changes afterwards, so lookups are a single dictionary access and never touch the database. Other rolls are calculated on demand.
+    """
+
+    def __init__(self) -> None:
+        self._table: Mapping[tuple[int, int, int], Mapping[str, float]] = MappingProxyType({})
+
+    @property
+    def is_built(self) -> bool:
+        """Return True if the table has been built."""
+        return bool(self._table)
+
+    def build(self) -> None:
+        """Calculate the probabilities of the precomputed dice rolls and replace the table."""
+        dice_size = DiceType.D10.value
+        table = {
+            (pool, difficulty, dice_size): MappingProxyType(
+                calculate_exact_probabilities(pool=pool, difficulty=difficulty, dice_size=dice_size)
+            )
+            for difficulty in range(dice_size + 1)
+            for pool in range(PRECOMPUTED_PROBABILITY_MAX_POOL + 1)
+        }
+        self._table = MappingProxyType(table)
+        logger.debug(f"BOT: Build probability table with {len(table):,} entries")
+
+    async def warm(self) -> None:
+        """Build the table in a worker thread so the event loop is not blocked."""
+        await asyncio.to_thread(self.build)
+
+    def get(self, pool: int, difficulty: int, dice_size: int) -> Mapping[str, float]:
+        """Return the probabilities of a dice roll.
+
+        Probabilities of rolls which are not precomputed, or of any roll before the table is built, are calculated on demand.
+
+        Args:
+            pool (int): Pool of dice.
+            difficulty (int): Difficulty level.
+            dice_size (int): Size of the dice.
+
+        Returns:
+            Mapping[str, float]: Percentages keyed by the name of each result field on `RollProbability`.
+
+        Raises:
+            errors.ValidationError: If the roll is not valid.
+        """
+        try:
+            return self._table[pool, difficulty, dice_size]
+        except KeyError:
+            validate_roll(pool=pool, difficulty=difficulty, dice_size=dice_size)
+            return calculate_exact_probabilities(
+                pool=pool, difficulty=difficulty, dice_size=dice_size
+            )
+
+
+probability_table = ProbabilityTable()
+
+
 class Probability:
     """Probability utility class used for generating probabilities of success for different dice rolls."""
 
-    def __init__(self, ctx: "ValentinaContext", pool: int, difficulty: int, dice_size: int) -> None:
+    def __init__(
+        self,
+        ctx: "ValentinaContext",
+        pool: int,
+        difficulty: int,
+        dice_size: int,
+        monte_carlo: bool = False,
+    ) -> None:
         """Initialize the Probability class.
 
         Args:
@@ -58,100 +209,77 @@ class Probability:
             pool (int): Pool of dice.
             difficulty (int): Difficulty level.
             dice_size (int): Size of the dice.
+            monte_carlo (bool, optional): Estimate the probabilities by rolling dice instead of calculating them exactly. Useful for cross-checking the exact results. Defaults to False.
         """
         self.ctx = ctx
         self.pool = pool
         self.difficulty = difficulty
         self.dice_size = dice_size
+        self.monte_carlo = monte_carlo
         self.trials = 10000
 
-    async def _calculate(self) -> RollProbability:
-        """Calculate the probability of a given dice roll.
+    def _simulate(self) -> dict[str, float]:
+        """Estimate the probability of a given dice roll by rolling the dice many times.
 
         Returns:
-            RollProbability: RollProbability object containing the results.
+            dict[str, float]: Percentages keyed by the name of each result field on `RollProbability`.
         """
-        # Return results from the database if they exist
-        db_result = await RollProbability.find(
-            RollProbability.pool == self.pool,
-            RollProbability.difficulty == self.difficulty,
-            RollProbability.dice_size == self.dice_size,
-        ).first_or_none()
-
-        if db_result:
-            logger.debug("DATABASE: Return probability results")
-            return db_result
-
-        # Calculate the probabilities
-        logger.debug("BOT: Calculate probability results for the given dice roll")
-
-        total_results = 0
-        botch_dice = 0
-        success_dice = 0
-        failure_dice = 0
-        critical_dice = 0
-        total_successes = 0
-        total_failures = 0
-        result_counts = dict.fromkeys(RollResultType, 0)
-
-        for _ in range(self.trials):
-            roll = DiceRoll(
-                pool=self.pool,
-                ctx=self.ctx,
-                difficulty=self.difficulty,
-                dice_size=self.dice_size,
-            )
-            total_results += roll.result
-            botch_dice += roll.botches
-            success_dice += roll.successes
-            failure_dice += roll.failures
-            critical_dice += roll.criticals
-            result_counts[roll.result_type] += 1
-
-            if roll.result_type in {RollResultType.SUCCESS, RollResultType.CRITICAL}:
-                total_successes += 1
-            if roll.result_type in {RollResultType.FAILURE, RollResultType.BOTCH}:
-                total_failures += 1
-
-        probabilities: dict[str, float] = defaultdict(int)
-        probabilities["total_results"] = total_results / self.trials * 100
-        probabilities["botch_dice"] = botch_dice / self.trials / self.pool * 100
-        probabilities["success_dice"] = success_dice / self.trials / self.pool * 100
-        probabilities["failure_dice"] = failure_dice / self.trials / self.pool * 100
-        probabilities["critical_dice"] = critical_dice / self.trials / self.pool * 100
-        probabilities["total_successes"] = total_successes / self.trials * 100
-        probabilities["total_failures"] = total_failures / self.trials * 100
+        batch = RollBatch(
+            rolls=self.trials,
+            pool=self.pool,
+            difficulty=self.difficulty,
+            dice_size=self.dice_size,
+        )
+        result_counts = batch.result_type_counts
+
+        # Avoid dividing by zero when rolling an empty pool
+        dice_rolled = self.trials * max(self.pool, 1)
+
+        probabilities: dict[str, float] = {}
+        probabilities["total_results"] = float(batch.results.sum()) / self.trials * 100
+        probabilities["botch_dice"] = float(batch.botches.sum()) / dice_rolled * 100
+        probabilities["success_dice"] = float(batch.successes.sum()) / dice_rolled * 100
+        probabilities["failure_dice"] = float(batch.failures.sum()) / dice_rolled * 100
+        probabilities["critical_dice"] = float(batch.criticals.sum()) / dice_rolled * 100
+        probabilities["total_successes"] = (
+            (result_counts[RollResultType.SUCCESS] + result_counts[RollResultType.CRITICAL])
+            / self.trials
+            * 100
+        )
+        probabilities["total_failures"] = (
+            (result_counts[RollResultType.FAILURE] + result_counts[RollResultType.BOTCH])
+            / self.trials
+            * 100
+        )
 
         for outcome, frequency in result_counts.items():
             probabilities[outcome.name] = (frequency / self.trials) * 100
 
-        # Ensure every value exists in the dictionary to prevent bugs in the embed
-        for result in RollResultType:
-            if result.name not in probabilities:
-                probabilities[result.name] = 0
+        return probabilities
 
-        # Save the results to the database
-        logger.debug("DATABASE: Save probability results")
-        probabilities = RollProbability(
+    async def _calculate(self) -> RollProbability:
+        """Calculate the probability of a given dice roll.
+
+        Exact results are read from the in-memory probability table. Monte Carlo estimates are simulated on every call.
+
+        Returns:
+            RollProbability: RollProbability object containing the results.
+        """
+        probabilities: Mapping[str, float]
+        if self.monte_carlo:
+            logger.debug("BOT: Simulate probability results for the given dice roll")
+            probabilities = self._simulate()
+        else:
+            probabilities = probability_table.get(
+                pool=self.pool, difficulty=self.difficulty, dice_size=self.dice_size
+            )
+
+        return RollProbability(
             pool=self.pool,
             difficulty=self.difficulty,
             dice_size=self.dice_size,
-            total_results=probabilities["total_results"],
-            botch_dice=probabilities["botch_dice"],
-            success_dice=probabilities["success_dice"],
-            failure_dice=probabilities["failure_dice"],
-            critical_dice=probabilities["critical_dice"],
-            total_successes=probabilities["total_successes"],
-            total_failures=probabilities["total_failures"],
-            # The name of each value in the RollResultType enum
-            BOTCH=probabilities["BOTCH"],
-            CRITICAL=probabilities["CRITICAL"],
-            FAILURE=probabilities["FAILURE"],
-            SUCCESS=probabilities["SUCCESS"],
-            OTHER=probabilities["OTHER"],
+            **probabilities,
         )
-        await probabilities.insert()
-        return probabilities
 
     def _get_description(self, results: RollProbability) -> str:
         """Return the probability description.
@@ -173,6 +301,12 @@ class Probability:
         else:
             emoji = "👎"
 
+        method = (
+            f"Probabilities based on {self.trials:,} trials"
+            if self.monte_carlo
+            else "Probabilities are calculated exactly"
+        )
+
         return f"""\
 ## Overall success probability: {results.total_successes:.2f}% {emoji}
 
@@ -195,7 +329,7 @@ Success (>= {self.difficulty}):  {results.success_dice:.2f}%
      Botch (1):  {results.botch_dice:.2f}%
 ```
 
-> - Probabilities based on {self.trials:,} trials
+> - {method}
 > - Definitions
 >  - _Critical Success_: More successes than dice rolled
 >  - _Success_: At least one success after all dice are tallied
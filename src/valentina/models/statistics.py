@@ -1,20 +1,45 @@
 """Compute and display statistics."""
 
-from datetime import datetime
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
 
 import discord
-from beanie import Document, Indexed
+import inflect
+from beanie import Document, Indexed, PydanticObjectId
+from loguru import logger
 from pydantic import Field
+from pymongo import ASCENDING, IndexModel, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from valentina.constants import EmbedColor, RollResultType
 from valentina.models import Campaign, Character, Guild
 from valentina.utils import errors
 from valentina.utils.helpers import time_now
 
+p = inflect.engine()
+
 if TYPE_CHECKING:
     from valentina.discord.bot import ValentinaContext
 
+# Fields on RollStatistic which statistics can be scoped to
+STATISTIC_SCOPES = ("guild", "user", "character", "campaign")
+
+# Map each roll result to the field which counts it on RollStatisticRollup
+ROLLUP_RESULT_FIELDS = {
+    RollResultType.BOTCH: "botches",
+    RollResultType.CRITICAL: "criticals",
+    RollResultType.FAILURE: "failures",
+    RollResultType.SUCCESS: "successes",
+    RollResultType.OTHER: "other",
+}
+
+# Length of each rollup period, keyed by its `$dateTrunc` unit
+ROLLUP_PERIODS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
+
+DUPLICATE_KEY_ERROR = 11000  # MongoDB error code for a document whose _id already exists
+
 
 class RollStatistic(Document):
     """Track roll results for statistics."""
@@ -29,6 +54,314 @@ class RollStatistic(Document):
     traits: list[str] = Field(default_factory=list)
     campaign: Indexed(str) | None = None  # type: ignore [valid-type]
 
+    class Settings:
+        """Settings for the RollStatistic model."""
+
+        # Compound indexes which cover the statistics aggregation for each scope
+        indexes = [  # noqa: RUF012
+            IndexModel(
+                [
+                    (scope, ASCENDING),
+                    ("result", ASCENDING),
+                    ("difficulty", ASCENDING),
+                    ("pool", ASCENDING),
+                ]
+            )
+            for scope in STATISTIC_SCOPES
+        ]
+
+
+class RollStatisticRollup(Document):
+    """Running totals of roll results for a single scope and day or week.
+
+    Rollups are updated as each roll is logged so that statistics for a timeframe are answered by summing a few documents instead of scanning every roll. Every roll is counted in both a daily and a weekly rollup, so long timeframes are summed from whole weeks and only their first days are summed from daily rollups.
+    """
+
+    scope: str
+    scope_id: str
+    period: str = "day"  # A key of ROLLUP_PERIODS
+    bucket: datetime
+    botches: int = 0
+    criticals: int = 0
+    failures: int = 0
+    successes: int = 0
+    other: int = 0
+    difficulty_total: int = 0
+    pool_total: int = 0
+
+    class Settings:
+        """Settings for the RollStatisticRollup model."""
+
+        indexes = [  # noqa: RUF012
+            IndexModel(
+                [
+                    ("scope", ASCENDING),
+                    ("scope_id", ASCENDING),
+                    ("period", ASCENDING),
+                    ("bucket", ASCENDING),
+                ],
+                unique=True,
+            )
+        ]
+
+    @staticmethod
+    def bucket_for(date: datetime, period: str = "day") -> datetime:
+        """Return the start of the bucket containing the given date.
+
+        Args:
+            date (datetime): The date to find the bucket for.
+            period (str): The period of the bucket, a key of ROLLUP_PERIODS. Defaults to "day".
+
+        Returns:
+            datetime: Midnight at the start of the date's day, or of the Monday starting its week.
+        """
+        midnight = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        if period == "week":
+            return midnight - timedelta(days=midnight.weekday())
+
+        return midnight
+
+    @classmethod
+    async def record(cls, statistics: list[RollStatistic]) -> None:
+        """Add logged rolls to the rollups for each scope they belong to.
+
+        Args:
+            statistics (list[RollStatistic]): The logged rolls.
+        """
+        operations = [
+            UpdateOne(
+                {
+                    "scope": scope,
+                    "scope_id": str(getattr(statistic, scope)),
+                    "period": period,
+                    "bucket": cls.bucket_for(statistic.date_rolled, period),
+                },
+                {
+                    "$inc": {
+                        ROLLUP_RESULT_FIELDS[statistic.result]: 1,
+                        "difficulty_total": statistic.difficulty,
+                        "pool_total": statistic.pool,
+                    }
+                },
+                upsert=True,
+            )
+            for statistic in statistics
+            for scope in STATISTIC_SCOPES
+            for period in ROLLUP_PERIODS
+            if getattr(statistic, scope) is not None
+        ]
+        if operations:
+            await cls.get_pymongo_collection().bulk_write(operations, ordered=False)
+
+    @classmethod
+    async def rebuild(cls, statistics: list[RollStatistic] | None = None) -> None:
+        """Rebuild rollups from the logged rolls.
+
+        Use this to backfill rollups for rolls which were logged before rollups existed. When rolls are given, only the rollups they belong to are rebuilt. Rebuilding replaces the totals rather than adding to them, so it reconciles rollups which were only partly updated.
+
+        Args:
+            statistics (list[RollStatistic] | None): Rebuild only the rollups of these rolls. Defaults to rebuilding every rollup.
+        """
+        if statistics is None:
+            await cls.delete_all()
+        elif not statistics:
+            return
+
+        result_counts = {
+            field: {"$sum": {"$cond": [{"$eq": ["$result", result.value]}, 1, 0]}}
+            for result, field in ROLLUP_RESULT_FIELDS.items()
+        }
+        for scope in STATISTIC_SCOPES:
+            for period, length in ROLLUP_PERIODS.items():
+                query: dict = {scope: {"$ne": None}}
+                if statistics is not None:
+                    scope_ids = {getattr(x, scope) for x in statistics} - {None}
+                    if not scope_ids:
+                        continue
+
+                    buckets = [cls.bucket_for(x.date_rolled, period) for x in statistics]
+                    query = {
+                        scope: {"$in": list(scope_ids)},
+                        "date_rolled": {"$gte": min(buckets), "$lt": max(buckets) + length},
+                    }
+
+                await cls._rebuild_period(query, scope, period, result_counts)
+
+    @classmethod
+    async def _rebuild_period(
+        cls, query: dict, scope: str, period: str, result_counts: dict
+    ) -> None:
+        """Replace the rollups of one scope and period with totals summed from the matching rolls."""
+        await (
+            RollStatistic.find(query)
+            .aggregate(
+                [
+                    {
+                        "$group": {
+                            "_id": {
+                                "scope_id": {"$toString": f"${scope}"},
+                                "bucket": {
+                                    "$dateTrunc": {
+                                        "date": "$date_rolled",
+                                        "unit": period,
+                                        "startOfWeek": "monday",
+                                    }
+                                },
+                            },
+                            "difficulty_total": {"$sum": "$difficulty"},
+                            "pool_total": {"$sum": "$pool"},
+                            **result_counts,
+                        }
+                    },
+                    {
+                        "$project": {
+                            "_id": 0,
+                            "scope": {"$literal": scope},
+                            "scope_id": "$_id.scope_id",
+                            "period": {"$literal": period},
+                            "bucket": "$_id.bucket",
+                            "difficulty_total": 1,
+                            "pool_total": 1,
+                            **dict.fromkeys(result_counts, 1),
+                        }
+                    },
+                    {
+                        "$merge": {
+                            "into": cls.get_collection_name(),
+                            "on": ["scope", "scope_id", "period", "bucket"],
+                            "whenMatched": "replace",
+                        }
+                    },
+                ]
+            )
+            .to_list()
+        )
+
+
+class RollStatisticWriter:
+    """Buffer logged rolls and write them to the database in batches.
+
+    Rolls are queued in memory and written with a single `insert_many` once the batch size is reached or the flush interval passes, so logging a roll does not wait on the database. The queue is bounded; when it is full, adding a roll waits until the next flush makes room.
+
+    A batch which fails to write is kept and retried first by the next flush. Rolls are given their ids before they are written so a retried batch never writes a roll twice. When the rolls are written but updating their rollups fails, the next flush rebuilds those rollups from the written rolls.
+
+    Statistics flush the buffer before reading so buffered rolls are always counted.
+    """
+
+    def __init__(
+        self, batch_size: int = 50, flush_interval: float = 2.0, max_queue_size: int = 1000
+    ) -> None:
+        """Initialize the RollStatisticWriter class.
+
+        Args:
+            batch_size (int, optional): Flush as soon as this many rolls are queued. Defaults to 50.
+            flush_interval (float, optional): Seconds to wait before flushing a partial batch. Defaults to 2.0.
+            max_queue_size (int, optional): The most rolls which can be queued before adding waits. Defaults to 1000.
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[RollStatistic] = None
+        self._lock: asyncio.Lock = None
+        self._batch_ready: asyncio.Event = None
+        self._task: asyncio.Task | None = None
+        self._unwritten: list[RollStatistic] = []
+        self._unreconciled: list[RollStatistic] = []
+
+    def _ensure_worker(self) -> None:
+        """Start the background flush task for the running event loop if it is not running."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._lock = asyncio.Lock()
+            self._batch_ready = asyncio.Event()
+            self._task = None
+
+        if not self._task or self._task.done():
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Flush the queue whenever a batch is ready or the flush interval passes."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+
+            self._batch_ready.clear()
+            try:
+                await self.flush()
+            except Exception:  # noqa: BLE001
+                # Failed rolls are retried by the next flush, so keep the worker running
+                logger.exception("DATABASE: Failed to write roll statistics")
+
+    async def add(self, statistic: RollStatistic) -> None:
+        """Queue a logged roll to be written to the database.
+
+        Args:
+            statistic (RollStatistic): The logged roll.
+        """
+        self._ensure_worker()
+        await self._queue.put(statistic)
+
+        if self._queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    async def flush(self) -> None:
+        """Write every queued roll to the database."""
+        if not self._queue or self._loop is not asyncio.get_running_loop():
+            return
+
+        async with self._lock:
+            if self._unreconciled:
+                await RollStatisticRollup.rebuild(self._unreconciled)
+                self._unreconciled = []
+
+            # Retry rolls which failed to write, leaving new rolls queued while too many are waiting
+            batch, self._unwritten = self._unwritten, []
+            while not self._queue.empty() and len(batch) < self.max_queue_size:
+                batch.append(self._queue.get_nowait())
+
+            if not batch:
+                return
+
+            for statistic in batch:
+                statistic.id = statistic.id or PydanticObjectId()
+
+            try:
+                await RollStatistic.insert_many(batch, ordered=False)
+            except BulkWriteError as e:
+                # Rolls written by an earlier attempt are duplicates and need no retry
+                if e.details.get("writeConcernErrors") or any(
+                    error["code"] != DUPLICATE_KEY_ERROR for error in e.details["writeErrors"]
+                ):
+                    self._unwritten = batch
+                    raise
+            except BaseException:
+                self._unwritten = batch
+                raise
+
+            try:
+                await RollStatisticRollup.record(batch)
+            except BaseException:
+                self._unreconciled = batch
+                raise
+
+            logger.debug(f"DATABASE: Write {len(batch)} roll statistics")
+
+    async def close(self) -> None:
+        """Stop the background flush task and write every queued roll to the database."""
+        if self._task:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+        await self.flush()
+
+
+roll_statistic_writer = RollStatisticWriter()
+
 
 class Statistics:
     """Compute and display roll statistics for Vampire: The Masquerade.
@@ -44,9 +377,18 @@ class Statistics:
         self,
         ctx: "ValentinaContext" = None,
         guild_id: int | None = None,
+        timeframe: timedelta | None = None,
     ) -> None:
+        """Initialize the Statistics class.
+
+        Args:
+            ctx (ValentinaContext, optional): Context for the discord app.
+            guild_id (int, optional): The guild to compute statistics for when no context is provided.
+            timeframe (timedelta, optional): Only include rolls from this long ago until now, rounded to whole days. Defaults to all rolls.
+        """
         self.ctx = ctx
         self.guild_id = guild_id
+        self.timeframe = timeframe
         self.botches = 0
         self.successes = 0
         self.failures = 0
@@ -141,6 +483,9 @@ class Statistics:
         if with_title:
             msg += f"## {self.title}\n"
 
+        if self.timeframe:
+            msg += f"_Rolls from the last {p.no('day', self.timeframe.days)}_\n"
+
         if self.total_rolls == 0:
             msg += "No statistics found"
             return msg
@@ -198,6 +543,72 @@ class Statistics:
         )
         return embed
 
+    async def _fetch_statistics(self, scope: str, scope_id: int | str) -> None:
+        """Populate the statistics for the rolls in the given scope.
+
+        Statistics for a timeframe are summed from the weekly rollups of its whole weeks and the daily rollups of the days before its first whole week. Otherwise every result type is counted and the difficulty and pool sizes summed with a single `$group` aggregation over the logged rolls.
+
+        Args:
+            scope (str): The RollStatistic field to filter on, one of `STATISTIC_SCOPES`.
+            scope_id (int | str): The id of the guild, user, character or campaign.
+        """
+        # Include rolls which are still waiting to be written
+        await roll_statistic_writer.flush()
+
+        if self.timeframe:
+            start = RollStatisticRollup.bucket_for(time_now() - self.timeframe)
+            first_week = RollStatisticRollup.bucket_for(start, "week")
+            if first_week < start:
+                first_week += ROLLUP_PERIODS["week"]
+
+            rollups = await RollStatisticRollup.find(
+                {
+                    "scope": scope,
+                    "scope_id": str(scope_id),
+                    "$or": [
+                        {"period": "week", "bucket": {"$gte": first_week}},
+                        {"period": "day", "bucket": {"$gte": start, "$lt": first_week}},
+                    ],
+                }
+            ).to_list()
+            counts = {
+                result: sum(getattr(rollup, field) for rollup in rollups)
+                for result, field in ROLLUP_RESULT_FIELDS.items()
+            }
+            difficulty_total = sum(rollup.difficulty_total for rollup in rollups)
+            pool_total = sum(rollup.pool_total for rollup in rollups)
+        else:
+            results = await (
+                RollStatistic.find({scope: scope_id})
+                .aggregate(
+                    [
+                        {
+                            "$group": {
+                                "_id": "$result",
+                                "count": {"$sum": 1},
+                                "difficulty": {"$sum": "$difficulty"},
+                                "pool": {"$sum": "$pool"},
+                            }
+                        }
+                    ]
+                )
+                .to_list()
+            )
+            counts = {RollResultType(result["_id"]): result["count"] for result in results}
+            difficulty_total = sum(result["difficulty"] for result in results)
+            pool_total = sum(result["pool"] for result in results)
+
+        self.botches = counts.get(RollResultType.BOTCH, 0)
+        self.successes = counts.get(RollResultType.SUCCESS, 0)
+        self.criticals = counts.get(RollResultType.CRITICAL, 0)
+        self.failures = counts.get(RollResultType.FAILURE, 0)
+        self.other = counts.get(RollResultType.OTHER, 0)
+        self.total_rolls = sum(counts.values())
+
+        if self.total_rolls:
+            self.average_difficulty = round(difficulty_total / self.total_rolls)
+            self.average_pool = round(pool_total / self.total_rolls)
+
     async def guild_statistics(
         self,
         as_embed: bool = False,
@@ -241,41 +652,7 @@ class Statistics:
             self.thumbnail = self.ctx.guild.icon.url if self.ctx.guild.icon else ""
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.guild == guild_id,
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.guild == guild_id).avg(
-            RollStatistic.difficulty,
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.guild == guild_id).avg(RollStatistic.pool)
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._fetch_statistics("guild", guild_id)
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -316,41 +693,7 @@ class Statistics:
             self.thumbnail = user.display_avatar.url
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.user == user.id,
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.user == user.id).avg(
-            RollStatistic.difficulty,
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.user == user.id).avg(RollStatistic.pool)
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._fetch_statistics("user", user.id)
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -389,43 +732,7 @@ class Statistics:
         self.title = f"Roll statistics for {character.name}"
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.character == str(character.id),
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.character == str(character.id)).avg(
-            RollStatistic.difficulty,
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.character == str(character.id)).avg(
-            RollStatistic.pool,
-        )
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._fetch_statistics("character", str(character.id))
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
@@ -465,43 +772,7 @@ class Statistics:
         self.title = f"Roll statistics for {campaign.name}"
 
         # Grab the data from the database
-        self.botches = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.BOTCH,
-        ).count()
-        self.successes = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.SUCCESS,
-        ).count()
-        self.criticals = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.CRITICAL,
-        ).count()
-        self.failures = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.FAILURE,
-        ).count()
-        self.other = await RollStatistic.find(
-            RollStatistic.campaign == str(campaign.id),
-            RollStatistic.result == RollResultType.OTHER,
-        ).count()
-
-        avg_diff = await RollStatistic.find(RollStatistic.campaign == str(campaign.id)).avg(
-            RollStatistic.difficulty,
-        )
-        if avg_diff:
-            self.average_difficulty = round(avg_diff)
-
-        avg_pool = await RollStatistic.find(RollStatistic.campaign == str(campaign.id)).avg(
-            RollStatistic.pool,
-        )
-        if avg_pool:
-            self.average_pool = round(avg_pool)
-
-        # Calculate total rolls
-        self.total_rolls = (
-            self.botches + self.successes + self.failures + self.criticals + self.other
-        )
+        await self._fetch_statistics("campaign", str(campaign.id))
 
         if as_embed:
             return await self._get_embed(with_title=with_title, with_help=with_help)
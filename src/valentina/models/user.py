@@ -6,6 +6,7 @@ from uuid import UUID, uuid4
 
 import discord
 from beanie import (
+    Delete,
     Document,
     Insert,
     Link,
@@ -13,13 +14,18 @@ from beanie import (
     Save,
     SaveChanges,
     Update,
+    after_event,
     before_event,
 )
+from beanie.odm.utils.dump import get_dict
+from loguru import logger
 from pydantic import BaseModel, Field
+from pymongo import UpdateOne
 
 from valentina.constants import COOL_POINT_VALUE
 from valentina.models import Campaign, Character
 from valentina.utils import errors
+from valentina.utils.autocomplete_index import IndexKind, autocomplete_index
 from valentina.utils.helpers import time_now
 
 
@@ -65,6 +71,11 @@ class User(Document):
         """Update the date_modified field."""
         self.date_modified = time_now()
 
+    @after_event(Insert, Replace, Save, Update, SaveChanges, Delete)
+    def invalidate_autocomplete_index(self) -> None:
+        """Discard the cached character autocomplete indexes which show the user's name."""
+        autocomplete_index.invalidate(IndexKind.CHARACTERS, *self.guilds)
+
     @property
     def lifetime_experience(self) -> int:
         """Calculate and return the user's total lifetime experience across all campaigns.
@@ -256,6 +267,60 @@ class User(Document):
 
         return campaign_experience.cool_points
 
+    @classmethod
+    async def provision_guild_members(
+        cls, guild_id: int, members: dict[int, tuple[str, str | None]]
+    ) -> int:
+        """Create or update the users for the members of a guild with a single bulk write.
+
+        The existing users are read with one query and diffed against the members, so only users who are new, who changed their name or avatar, or who are not yet associated with the guild are written.
+
+        Args:
+            guild_id (int): The id of the guild.
+            members (dict[int, tuple[str, str | None]]): Maps the id of each member to their (display name, avatar url).
+
+        Returns:
+            int: The number of users created or updated.
+        """
+        if not members:
+            return 0
+
+        collection = cls.get_pymongo_collection()
+        existing = {
+            doc["_id"]: doc
+            for doc in await collection.find(
+                {"_id": {"$in": list(members)}}, {"avatar_url": 1, "guilds": 1, "name": 1}
+            ).to_list()
+        }
+
+        # Default values of the fields which are not set from the member, for users who are created
+        defaults = get_dict(cls(id=0), to_db=True)
+        for key in ("_id", "avatar_url", "date_modified", "guilds", "name"):
+            defaults.pop(key, None)
+
+        now = time_now()
+        requests = []
+        for member_id, (name, avatar_url) in members.items():
+            doc = existing.get(member_id)
+            update: dict = {}
+
+            if doc is None or doc.get("name") != name or doc.get("avatar_url") != avatar_url:
+                update["$set"] = {"avatar_url": avatar_url, "date_modified": now, "name": name}
+            if doc is None or guild_id not in doc.get("guilds", []):
+                update["$addToSet"] = {"guilds": guild_id}
+            if doc is None:
+                update["$setOnInsert"] = defaults
+
+            if update:
+                requests.append(UpdateOne({"_id": member_id}, update, upsert=True))
+
+        if requests:
+            await collection.bulk_write(requests, ordered=False)
+            autocomplete_index.invalidate(IndexKind.CHARACTERS, guild_id)
+            logger.debug(f"DATABASE: Update {len(requests)} users in guild {guild_id}")
+
+        return len(requests)
+
     def all_characters(self, guild: discord.Guild) -> list[Character]:
         """Retrieve all characters belonging to the user in the specified guild.
 
@@ -2,7 +2,7 @@
 
 from .config import ValentinaConfig, debug_environment_variables
 from .console import console
-from .helpers import random_num, random_string, renumber_items, truncate_string
+from .helpers import random_num, random_num_array, random_string, renumber_items, truncate_string
 from .logging import instantiate_logger
 
 __all__ = [
@@ -11,6 +11,7 @@ __all__ = [
     "debug_environment_variables",
     "instantiate_logger",
     "random_num",
+    "random_num_array",
     "random_string",
     "renumber_items",
     "truncate_string",
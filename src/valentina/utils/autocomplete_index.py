@@ -0,0 +1,244 @@
+"""Search lightweight copies of documents by name to serve Discord autocomplete from memory."""
+
+import asyncio
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from enum import StrEnum
+from typing import Any
+
+from beanie import PydanticObjectId
+from loguru import logger
+
+from valentina.constants import (
+    AUTOCOMPLETE_FUZZY_CUTOFF,
+    AUTOCOMPLETE_FUZZY_MIN_LENGTH,
+    AUTOCOMPLETE_INDEX_TTL,
+    MAX_OPTION_LIST_SIZE,
+)
+
+
+class IndexKind(StrEnum):
+    """The kinds of documents which are indexed and the id each index is keyed by."""
+
+    BOOKS = "books"  # keyed by campaign id
+    CAMPAIGNS = "campaigns"  # keyed by guild id
+    CHARACTERS = "characters"  # keyed by guild id
+    TRAITS = "traits"  # keyed by character id
+
+
+@dataclass(frozen=True, slots=True)
+class IndexEntry:
+    """A lightweight copy of a document which can be searched by name."""
+
+    id: str
+    name: str
+    number: int = 0
+    campaign: str | None = None
+    owner_id: int | None = None
+    owner_name: str | None = None
+    is_alive: bool = True
+    type_chargen: bool = False
+    type_player: bool = False
+    type_storyteller: bool = False
+
+
+class SearchIndex:
+    """Search entries by prefix, by substring, and by similarity of their names.
+
+    Names are kept sorted so the names starting with a query are found with a binary search.
+    """
+
+    def __init__(
+        self,
+        entries: Iterable[IndexEntry],
+        order: Callable[[IndexEntry], Any] | None = None,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            entries (Iterable[IndexEntry]): The entries to search.
+            order (Callable[[IndexEntry], Any] | None): The sort key of equally ranked matches. Defaults to the name.
+        """
+        self.entries = sorted(entries, key=lambda x: (x.name.casefold(), x.id))
+        self._keys = [x.name.casefold() for x in self.entries]
+        self._words = [key.split() for key in self._keys]
+
+        # The rank of each entry within equally ranked matches
+        self._position = list(range(len(self.entries)))
+        if order:
+            ordered = sorted(self._position, key=lambda i: order(self.entries[i]))
+            for position, i in enumerate(ordered):
+                self._position[i] = position
+
+    def __len__(self) -> int:
+        """Return the number of entries in the index."""
+        return len(self.entries)
+
+    def _similarity(self, matcher: SequenceMatcher, i: int, query: str) -> float:
+        """Return how similar the query is to the name, the start of the name, or any word of the name.
+
+        Args:
+            matcher (SequenceMatcher): A matcher whose second sequence is the query.
+            i (int): The index of the entry.
+            query (str): The casefolded query.
+
+        Returns:
+            float: The best similarity, or 0 when it is below AUTOCOMPLETE_FUZZY_CUTOFF.
+        """
+        key = self._keys[i]
+        best = 0.0
+        for candidate in {key, key[: len(query)], *self._words[i]}:
+            matcher.set_seq1(candidate)
+            # The upper bounds are much cheaper than the ratio and rule out most candidates
+            threshold = max(best, AUTOCOMPLETE_FUZZY_CUTOFF)
+            if matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold:
+                best = max(best, matcher.ratio())
+
+        return best if best >= AUTOCOMPLETE_FUZZY_CUTOFF else 0.0
+
+    def search(
+        self,
+        query: str,
+        where: Callable[[IndexEntry], bool] | None = None,
+        limit: int = MAX_OPTION_LIST_SIZE,
+    ) -> list[IndexEntry]:
+        """Return the entries matching a query, best matches first.
+
+        Names starting with the query rank first, followed by names with a word starting with the query, names containing the query, and finally names similar to the query. An empty query matches every entry.
+
+        Args:
+            query (str): The text to search for. Case is ignored.
+            where (Callable[[IndexEntry], bool] | None): Only return entries for which this returns True.
+            limit (int): The maximum number of entries to return. Defaults to MAX_OPTION_LIST_SIZE.
+
+        Returns:
+            list[IndexEntry]: The matching entries.
+        """
+        query = query.strip().casefold()
+        candidates = [i for i, entry in enumerate(self.entries) if where is None or where(entry)]
+
+        if not query:
+            candidates.sort(key=self._position.__getitem__)
+            return [self.entries[i] for i in candidates[:limit]]
+
+        # Names starting with the query are a contiguous run of the sorted names
+        start = bisect_left(self._keys, query)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(query):
+            end += 1
+
+        ranked: list[tuple[int, int, int]] = []
+        unmatched: list[int] = []
+        for i in candidates:
+            if start <= i < end:
+                ranked.append((0, self._position[i], i))
+            elif (found := self._keys[i].find(query)) != -1:
+                word_start = self._keys[i][found - 1].isspace()
+                ranked.append((1 if word_start else 2, self._position[i], i))
+            else:
+                unmatched.append(i)
+
+        results = [self.entries[i] for *_, i in sorted(ranked)][:limit]
+        if len(results) >= limit or len(query) < AUTOCOMPLETE_FUZZY_MIN_LENGTH:
+            return results
+
+        matcher = SequenceMatcher(autojunk=False)
+        matcher.set_seq2(query)
+        similar = [
+            (-score, self._position[i], i)
+            for i in unmatched
+            if (score := self._similarity(matcher, i, query))
+        ]
+        results.extend(self.entries[i] for *_, i in sorted(similar))
+
+        return results[:limit]
+
+
+class AutocompleteIndex:
+    """Cache a search index of each guild's characters and campaigns, each campaign's books, and each character's traits.
+
+    Indexes are built on first use and rebuilt after they are invalidated by a change to their documents, or after AUTOCOMPLETE_INDEX_TTL seconds to pick up changes made outside of the document event hooks. Concurrent requests for an index share a single build.
+    """
+
+    def __init__(self, ttl: float = AUTOCOMPLETE_INDEX_TTL) -> None:
+        self.ttl = ttl
+        self._indexes: dict[tuple[IndexKind, str], tuple[float, SearchIndex]] = {}
+        self._builds: dict[tuple[IndexKind, str], asyncio.Task[SearchIndex]] = {}
+        self._generations: defaultdict[tuple[IndexKind, str], int] = defaultdict(int)
+
+    async def _build(
+        self,
+        cache_key: tuple[IndexKind, str],
+        generation: int,
+        loader: Callable[[], Awaitable[Iterable[IndexEntry]]],
+        order: Callable[[IndexEntry], Any] | None,
+    ) -> SearchIndex:
+        """Load the entries of an index and cache it unless it was invalidated while loading."""
+        try:
+            index = SearchIndex(await loader(), order=order)
+        finally:
+            if self._builds.get(cache_key) is asyncio.current_task():
+                del self._builds[cache_key]
+
+        if self._generations[cache_key] == generation:
+            self._indexes[cache_key] = (time.monotonic(), index)
+
+        logger.trace(f"AUTOCOMPLETE: Indexed {len(index)} {cache_key[0]} for {cache_key[1]}")
+        return index
+
+    async def get(
+        self,
+        kind: IndexKind,
+        key: int | str | PydanticObjectId,
+        loader: Callable[[], Awaitable[Iterable[IndexEntry]]],
+        order: Callable[[IndexEntry], Any] | None = None,
+    ) -> SearchIndex:
+        """Return a cached index, building it with the loader when it is not cached.
+
+        Args:
+            kind (IndexKind): The kind of documents in the index.
+            key (int | str | PydanticObjectId): The id of the guild, campaign, or character the index belongs to.
+            loader (Callable[[], Awaitable[Iterable[IndexEntry]]]): Load the entries of the index from the database.
+            order (Callable[[IndexEntry], Any] | None): The sort key of equally ranked matches. Defaults to the name.
+
+        Returns:
+            SearchIndex: The index.
+        """
+        cache_key = (kind, str(key))
+        cached = self._indexes.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        if cache_key not in self._builds:
+            self._builds[cache_key] = asyncio.create_task(
+                self._build(cache_key, self._generations[cache_key], loader, order)
+            )
+
+        # Shield the build so an autocomplete request cancelled by the next keystroke does not cancel it for everyone else
+        return await asyncio.shield(self._builds[cache_key])
+
+    def invalidate(self, kind: IndexKind, *keys: int | str | PydanticObjectId | None) -> None:
+        """Forget indexes so they are rebuilt on their next use.
+
+        Args:
+            kind (IndexKind): The kind of documents in the indexes.
+            *keys (int | str | PydanticObjectId | None): The ids the indexes belong to. None values are ignored.
+        """
+        for key in {str(x) for x in keys if x is not None}:
+            cache_key = (kind, key)
+            self._indexes.pop(cache_key, None)
+            if self._builds.pop(cache_key, None):
+                # A build in progress may have loaded the entries before the change
+                self._generations[cache_key] += 1
+
+    def clear(self) -> None:
+        """Forget every index."""
+        for kind, key in {*self._indexes, *self._builds}:
+            self.invalidate(kind, key)
+
+
+autocomplete_index = AutocompleteIndex()
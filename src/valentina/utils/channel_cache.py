@@ -0,0 +1,71 @@
+"""Cache the campaign, book, and character which each Discord channel belongs to."""
+
+from dataclasses import dataclass
+
+from beanie import PydanticObjectId
+
+
+@dataclass(frozen=True)
+class ChannelEntityIds:
+    """The ids of the campaign, book, and character a Discord channel belongs to."""
+
+    campaign_id: PydanticObjectId | None = None
+    book_id: PydanticObjectId | None = None
+    character_id: PydanticObjectId | None = None
+
+
+class ChannelCache:
+    """Map Discord channel ids to the ids of the campaign, book, and character they belong to.
+
+    An entry is only used while its channel remains in the category it was resolved in, so moving a channel between categories needs no invalidation. Anything which changes the channel of a campaign, book, or character must invalidate the channels involved.
+    """
+
+    def __init__(self) -> None:
+        self._channels: dict[int, tuple[int | None, ChannelEntityIds]] = {}
+
+    def get(self, channel_id: int, category_id: int | None) -> ChannelEntityIds | None:
+        """Return the cached ids for a channel, or None if the channel is not cached.
+
+        Args:
+            channel_id (int): The id of the channel.
+            category_id (int | None): The id of the channel's current category.
+
+        Returns:
+            ChannelEntityIds | None: The cached ids.
+        """
+        entry = self._channels.get(channel_id)
+        if entry and entry[0] == category_id:
+            return entry[1]
+
+        return None
+
+    def set(self, channel_id: int, category_id: int | None, ids: ChannelEntityIds) -> None:
+        """Cache the ids resolved for a channel.
+
+        Args:
+            channel_id (int): The id of the channel.
+            category_id (int | None): The id of the channel's current category.
+            ids (ChannelEntityIds): The ids the channel belongs to.
+        """
+        self._channels[channel_id] = (category_id, ids)
+
+    def invalidate(self, *channel_ids: int | None) -> None:
+        """Forget the cached ids of channels. Invalidating a category forgets every channel in it.
+
+        Args:
+            *channel_ids (int | None): The ids of the channels or categories. None values are ignored.
+        """
+        to_remove = {x for x in channel_ids if x}
+        if not to_remove:
+            return
+
+        for channel_id, (category_id, _) in list(self._channels.items()):
+            if channel_id in to_remove or category_id in to_remove:
+                del self._channels[channel_id]
+
+    def clear(self) -> None:
+        """Forget every cached channel."""
+        self._channels.clear()
+
+
+channel_cache = ChannelCache()
@@ -49,6 +49,7 @@ class ValentinaConfig(BaseConfig):  # type: ignore [misc]
     owner_channels: str
     owner_ids: str | None = None
     s3_bucket_name: str | None = None
+    s3_endpoint_url: str | None = None
     test_mongo_uri: str = "mongodb://localhost:27017"
     test_mongo_database_name: str = "test_db"
 
@@ -20,6 +20,7 @@ from valentina.models import (
     Note,
     RollProbability,
     RollStatistic,
+    RollStatisticRollup,
     User,
 )
 from valentina.utils import ValentinaConfig
@@ -87,6 +88,7 @@ async def init_database(
             Note,
             RollProbability,
             RollStatistic,
+            RollStatisticRollup,
             User,
         ],
     )
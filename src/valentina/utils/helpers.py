@@ -4,8 +4,8 @@ import io
 import random
 import string
 from datetime import UTC, datetime
-from urllib.parse import urlencode
 
+import numpy as np
 from aiohttp import ClientSession
 from numpy.random import default_rng
 
@@ -85,56 +85,31 @@ def random_num(ceiling: int = 100) -> int:
     return int(_rng.integers(1, ceiling + 1))
 
 
-def random_string(length: int) -> str:
-    """Generate a random string.
+def random_num_array(ceiling: int, size: int | tuple[int, ...]) -> np.ndarray:
+    """Generate an array of random integers within a specified range.
+
+    Draw every value with a single call to the random number generator. Use this instead of calling `random_num` in a loop when many values are needed at once.
 
     Args:
-        length (int): The length of the string to generate.
+        ceiling (int): The upper limit for the random numbers.
+        size (int | tuple[int, ...]): The shape of the array to generate.
 
     Returns:
-        str: A random string of the given length.
+        np.ndarray: An array of random integers between 1 and the ceiling (inclusive).
     """
-    return "".join(random.choice(string.ascii_letters) for _ in range(length))
-
+    return _rng.integers(1, ceiling + 1, size=size)
 
-async def fetch_random_name(
-    gender: str | None = None,
-    country: str = "us",
-    results: int = 1,
-) -> list[tuple[str, str]] | tuple[str, str]:  # pragma: no cover
-    """Fetch a random name from the randomuser.me API.
 
-    Retrieve one or more random names from the randomuser.me API based on specified criteria.
+def random_string(length: int) -> str:
+    """Generate a random string.
 
     Args:
-        gender (str | None): The gender of the name to fetch. If None, a random gender is chosen.
-        country (str): The country code to fetch the name from. Defaults to "us".
-        results (int): The number of results to fetch. Defaults to 1.
+        length (int): The length of the string to generate.
 
     Returns:
-        list[tuple[str, str]] | tuple[str, str]: If results > 1, returns a list of tuples containing
-        (first_name, last_name). If results == 1, returns a single tuple (first_name, last_name).
+        str: A random string of the given length.
     """
-    if not gender:
-        gender = random.choice(["male", "female"])
-
-    params = {"gender": gender, "nat": country, "inc": "name", "results": results}
-    url = f"https://randomuser.me/api/?{urlencode(params)}"
-
-    async with ClientSession() as session, session.get(url) as res:
-        if 300 > res.status >= 200:  # noqa: PLR2004
-            data = await res.json()
-
-            result = [
-                (result["name"]["first"], result["name"]["last"]) for result in data["results"]
-            ]
-
-            if len(result) == 1:
-                return result[0]
-
-            return result
-
-    return [("John", "Doe")]
+    return "".join(random.choice(string.ascii_letters) for _ in range(length))
 
 
 def divide_total_randomly(
@@ -0,0 +1,86 @@
+"""Generate resized and re-encoded derivatives of uploaded images."""
+
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from loguru import logger
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from valentina.constants import IMAGE_WEBP_QUALITY, MAX_IMAGE_WORKERS, ImageVariant
+
+_executor = ThreadPoolExecutor(max_workers=MAX_IMAGE_WORKERS, thread_name_prefix="images")
+_DERIVATIVE_KEY = re.compile(
+    rf"_(?:{'|'.join(x.name.lower() for x in ImageVariant)})\.webp$",
+)
+
+
+def derivative_key(key: str, variant: ImageVariant) -> str:
+    """Return the S3 key of an image derivative, stored beside the original image.
+
+    Args:
+        key (str): The key of the original image. Ex. `1/characters/2/3.png`
+        variant (ImageVariant): The derivative.
+
+    Returns:
+        str: The key of the derivative. Ex. `1/characters/2/3_sheet.webp`
+    """
+    return f"{key.rsplit('.', 1)[0]}_{variant.name.lower()}.webp"
+
+
+def is_derivative_key(key: str) -> bool:
+    """Return True if an S3 key is the key of an image derivative rather than an original image."""
+    return bool(_DERIVATIVE_KEY.search(key))
+
+
+def _render_derivatives(data: bytes) -> dict[ImageVariant, bytes]:
+    """Resize and re-encode an image as WebP for every ImageVariant. Runs in the worker pool.
+
+    Args:
+        data (bytes): The original image.
+
+    Returns:
+        dict[ImageVariant, bytes]: The encoded derivatives. Empty for animated images, which are served as uploaded.
+    """
+    with Image.open(BytesIO(data)) as original:
+        if getattr(original, "is_animated", False):
+            return {}
+
+        image = ImageOps.exif_transpose(original)
+        has_alpha = image.mode in {"RGBA", "LA"} or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+
+    derivatives = {}
+    for variant in ImageVariant:
+        resized = image.copy()
+        if variant.value:
+            resized.thumbnail((variant.value, variant.value), Image.Resampling.LANCZOS)
+
+        buffer = BytesIO()
+        resized.save(buffer, format="WEBP", quality=IMAGE_WEBP_QUALITY)
+        derivatives[variant] = buffer.getvalue()
+
+    return derivatives
+
+
+async def create_image_derivatives(data: bytes) -> dict[ImageVariant, bytes]:
+    """Generate a WebP derivative of an image for every ImageVariant.
+
+    Images are decoded, resized, and encoded in a worker pool so the event loop is not blocked. Images which can not be decoded are logged and produce no derivatives.
+
+    Args:
+        data (bytes): The original image.
+
+    Returns:
+        dict[ImageVariant, bytes]: The encoded derivatives, or an empty dict when none could be generated.
+    """
+    try:
+        return await asyncio.get_running_loop().run_in_executor(
+            _executor, _render_derivatives, data
+        )
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError) as e:
+        logger.warning(f"IMAGES: Could not generate image derivatives: {e}")
+        return {}
@@ -0,0 +1,143 @@
+"""Generate random names locally for characters and the name generator command."""
+
+import asyncio
+import random
+import threading
+from collections import defaultdict, deque
+
+from faker import Faker
+from loguru import logger
+
+from valentina.constants import NAME_POOL_SIZE
+
+# Faker locales for the country codes used by NameNationality. Faker has no Serbian names so Croatian names are used in their place.
+COUNTRY_LOCALES = {
+    "br": "pt_BR",
+    "de": "de_DE",
+    "dk": "da_DK",
+    "es": "es_ES",
+    "fr": "fr_FR",
+    "gb": "en_GB",
+    "in": "en_IN",
+    "mx": "es_MX",
+    "no": "no_NO",
+    "rs": "hr_HR",
+    "ua": "uk_UA",
+    "us": "en_US",
+}
+
+
+class NameGenerator:
+    """Generate random first and last names with faker without any network requests.
+
+    A pool of pre-generated names is kept for every gender and country. Names are taken from a pool in O(1) and a pool running low is refilled in bulk in a background thread, so generating a name never waits on faker or the network.
+    """
+
+    def __init__(self, pool_size: int = NAME_POOL_SIZE) -> None:
+        self.pool_size = pool_size
+        self._pools: defaultdict[tuple[str, str], deque[tuple[str, str]]] = defaultdict(deque)
+        self._refills: dict[tuple[str, str], asyncio.Task] = {}
+        # Each thread gets its own fakers, each seeded with its own random generator, so refills never share one
+        self._local = threading.local()
+
+    def _faker(self, locale: str) -> Faker:
+        """Return the current thread's faker for a locale, creating it on first use.
+
+        Unseeded fakers share a single module-wide random generator, so each faker is seeded with its own generator.
+
+        Args:
+            locale (str): The faker locale.
+
+        Returns:
+            Faker: The faker for the locale.
+        """
+        fakers: dict[str, Faker] | None = getattr(self._local, "fakers", None)
+        if fakers is None:
+            fakers = self._local.fakers = {}
+
+        if locale not in fakers:
+            faker = Faker(locale)
+            faker.seed_instance()
+            fakers[locale] = faker
+
+        return fakers[locale]
+
+    def _generate(self, gender: str, country: str, count: int) -> list[tuple[str, str]]:
+        """Generate names with faker.
+
+        Args:
+            gender (str): The gender of the names. One of "male" or "female".
+            country (str): The country code of the names.
+            count (int): The number of names to generate.
+
+        Returns:
+            list[tuple[str, str]]: The generated (first_name, last_name) tuples.
+        """
+        faker = self._faker(COUNTRY_LOCALES.get(country, "en_US"))
+        if gender == "female":
+            return [(faker.first_name_female(), faker.last_name_female()) for _ in range(count)]
+
+        return [(faker.first_name_male(), faker.last_name_male()) for _ in range(count)]
+
+    async def _refill(self, key: tuple[str, str]) -> None:
+        """Refill a pool in bulk in a background thread."""
+        try:
+            pool = self._pools[key]
+            names = await asyncio.to_thread(self._generate, *key, self.pool_size - len(pool))
+            pool.extend(names)
+            logger.trace(f"NAMES: Refilled the {key} name pool with {len(names)} names")
+        finally:
+            self._refills.pop(key, None)
+
+    def _schedule_refill(self, key: tuple[str, str]) -> None:
+        """Refill a pool in the background, or immediately when no event loop is running."""
+        if key in self._refills:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pools[key].extend(self._generate(*key, self.pool_size - len(self._pools[key])))
+            return
+
+        self._refills[key] = loop.create_task(self._refill(key))
+
+    def random_name(self, gender: str | None = None, country: str = "us") -> tuple[str, str]:
+        """Return a random name.
+
+        Args:
+            gender (str | None): The gender of the name. One of "male" or "female". If None, a random gender is chosen.
+            country (str): A country code, or a comma separated list of country codes to choose from, such as the value of a NameNationality. Defaults to "us".
+
+        Returns:
+            tuple[str, str]: A tuple of (first_name, last_name).
+        """
+        gender = gender or random.choice(["male", "female"])
+        country = random.choice(country.split(",")).strip().lower()
+        key = (gender, country)
+
+        pool = self._pools[key]
+        name = pool.popleft() if pool else self._generate(gender, country, 1)[0]
+
+        if len(pool) < self.pool_size // 4:
+            self._schedule_refill(key)
+
+        return name
+
+    def random_names(
+        self, gender: str | None = None, country: str = "us", count: int = 1
+    ) -> list[tuple[str, str]]:
+        """Return several random names.
+
+        Args:
+            gender (str | None): The gender of the names. One of "male" or "female". If None, a random gender is chosen for each name.
+            country (str): A country code, or a comma separated list of country codes to choose from. Defaults to "us".
+            count (int): The number of names to return. Defaults to 1.
+
+        Returns:
+            list[tuple[str, str]]: A list of (first_name, last_name) tuples.
+        """
+        return [self.random_name(gender=gender, country=country) for _ in range(count)]
+
+
+name_generator = NameGenerator()
@@ -0,0 +1,113 @@
+"""Cache snapshots of each guild's permission settings, administrators, and storytellers."""
+
+import asyncio
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from valentina.constants import GUILD_PERMISSIONS_CACHE_TTL
+
+if TYPE_CHECKING:
+    from valentina.models.guild import GuildPermissions
+
+
+@dataclass(frozen=True, slots=True)
+class GuildPermissionSnapshot:
+    """An immutable copy of the parts of a guild which decide its members' permissions."""
+
+    guild_id: int
+    version: int
+    permissions: "GuildPermissions"
+    administrators: frozenset[int]
+    storytellers: frozenset[int]
+
+
+class GuildPermissionCache:
+    """Share permission snapshots of each guild between every PermissionManager.
+
+    Each guild has a version which is bumped whenever its snapshot is invalidated. A snapshot loaded under an older version is returned to the callers which requested it but is not cached, so a change saved while a snapshot is loading is never hidden. Snapshots are also reloaded after GUILD_PERMISSIONS_CACHE_TTL seconds to pick up changes made outside of this process.
+    """
+
+    def __init__(self, ttl: float = GUILD_PERMISSIONS_CACHE_TTL) -> None:
+        self.ttl = ttl
+        self._snapshots: dict[int, tuple[float, GuildPermissionSnapshot]] = {}
+        self._loads: dict[int, asyncio.Task[GuildPermissionSnapshot | None]] = {}
+        self._versions: defaultdict[int, int] = defaultdict(int)
+
+    def version(self, guild_id: int) -> int:
+        """Return the current version of a guild's permissions.
+
+        Args:
+            guild_id (int): The id of the guild.
+
+        Returns:
+            int: The version, which changes whenever the guild's snapshot is invalidated.
+        """
+        return self._versions[guild_id]
+
+    async def _load(
+        self,
+        guild_id: int,
+        version: int,
+        loader: Callable[[int], Awaitable[GuildPermissionSnapshot | None]],
+    ) -> GuildPermissionSnapshot | None:
+        """Load a snapshot and cache it unless the guild was invalidated while loading."""
+        try:
+            snapshot = await loader(version)
+        finally:
+            if self._loads.get(guild_id) is asyncio.current_task():
+                del self._loads[guild_id]
+
+        if snapshot and self._versions[guild_id] == version:
+            self._snapshots[guild_id] = (time.monotonic(), snapshot)
+            logger.trace(f"PERMS: Cache permissions of guild {guild_id} at version {version}")
+
+        return snapshot
+
+    async def get(
+        self,
+        guild_id: int,
+        loader: Callable[[int], Awaitable[GuildPermissionSnapshot | None]],
+    ) -> GuildPermissionSnapshot | None:
+        """Return a guild's cached snapshot, loading it with the loader when it is not cached.
+
+        Args:
+            guild_id (int): The id of the guild.
+            loader (Callable[[int], Awaitable[GuildPermissionSnapshot | None]]): Load the snapshot from the database. Called with the version the snapshot is loaded at.
+
+        Returns:
+            GuildPermissionSnapshot | None: The snapshot, or None if the guild does not exist.
+        """
+        cached = self._snapshots.get(guild_id)
+        if cached and time.monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        if guild_id not in self._loads:
+            self._loads[guild_id] = asyncio.create_task(
+                self._load(guild_id, self._versions[guild_id], loader)
+            )
+
+        # Shield the load so a cancelled request does not cancel it for every other request waiting on it
+        return await asyncio.shield(self._loads[guild_id])
+
+    def invalidate(self, *guild_ids: int | None) -> None:
+        """Forget guilds' snapshots and bump their versions so they are reloaded on their next use.
+
+        Args:
+            *guild_ids (int | None): The ids of the guilds. None values are ignored.
+        """
+        for guild_id in {x for x in guild_ids if x is not None}:
+            self._snapshots.pop(guild_id, None)
+            self._loads.pop(guild_id, None)
+            self._versions[guild_id] += 1
+
+    def clear(self) -> None:
+        """Forget every snapshot."""
+        self.invalidate(*self._snapshots, *self._loads)
+
+
+guild_permission_cache = GuildPermissionCache()
@@ -7,9 +7,9 @@ from quart.utils import run_sync
 from quart.views import MethodView
 from werkzeug.utils import secure_filename
 
-from valentina.constants import HTTPStatus
+from valentina.constants import HTTPStatus, ImageVariant
 from valentina.controllers import PermissionManager
-from valentina.models import AWSService, Campaign, Character, User
+from valentina.models import Campaign, Character, User
 from valentina.utils import random_string
 from valentina.webui import catalog
 from valentina.webui.utils import fetch_active_campaign, fetch_guild
@@ -97,9 +97,6 @@ class SetDesperationOrDanger(MethodView):
 class CharacterImageView(MethodView):
     """Handle adding experience to a user."""
 
-    def __init__(self) -> None:
-        self.aws_svc = AWSService()
-
     async def _get_character_object(self, character_id: str) -> Character:
         """Fetch and validate a character object from the database.
 
@@ -149,7 +146,16 @@ class CharacterImageView(MethodView):
             html = await character_image_view.get("507f1f77bcf86cd799439011")
         """
         character = await self._get_character_object(character_id)
-        images = [self.aws_svc.get_url(x) for x in character.images]
+
+        # The original URL identifies the image to delete while the smaller derivatives are displayed
+        images = [
+            (
+                character.image_url(x),
+                character.image_url(x, ImageVariant.SHEET),
+                character.image_url(x, ImageVariant.THUMBNAIL),
+            )
+            for x in character.images
+        ]
         can_edit = session["IS_STORYTELLER"] or session["USER_ID"] == character.user_owner
 
         return catalog.render(
@@ -44,9 +44,7 @@ class CreateRNGCharacter(MethodView):
         )
 
         # Create three characters for the user to choose from
-        characters = [
-            await chargen.generate_full_character(chargen_character=True) for _ in range(3)
-        ]
+        characters = await chargen.generate_full_characters(3, chargen_character=True)
 
         # Add the created characters to the session so they can be acted upon in the next step
         # use a dictionary with the index as the key
@@ -41,24 +41,21 @@ class CharacterView(MethodView):
     async def _get_character_object(self, character_id: str) -> Character:
         """Fetch and return a character object from the database by its ID.
 
-        Retrieve a character from the database using the provided ID and fetch all linked
-        relationships. Validate the ID format and character existence.
+        Retrieve a character from the database using the provided ID with its traits loaded.
+        Other links are fetched by the tabs which display them. Validate the ID format and
+        character existence.
 
         Args:
             character_id (str): Unique identifier of the character to fetch
 
         Returns:
-            Character: Character object with all relationships loaded
+            Character: Character object with its traits loaded
 
         Raises:
             HTTPException: If character_id is invalid (400)
             HTTPException: If character not found (400)
         """
-        try:
-            character = await Character.get(character_id, fetch_links=True)
-        except ValueError:
-            abort(HTTPStatus.BAD_REQUEST.value)
-
+        character = await Character.get_with_traits(character_id)
         if not character:
             abort(HTTPStatus.BAD_REQUEST.value)
 
@@ -149,6 +146,8 @@ class CharacterView(MethodView):
                 return await link_terms(result, link_type="html")
 
             case CharacterViewTab.INFO:
+                await character.fetch_link("inventory")
+                await character.fetch_link("notes")
                 result = await run_sync(
                     lambda: catalog.render(
                         "character_view.Info",
@@ -1,14 +1,17 @@
 """Helpers for the webui."""
 
-import re
+import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Literal
 
+from beanie import PydanticObjectId
+from beanie.operators import In
 from loguru import logger
-from quart import Response, abort, session, url_for
+from quart import Response, abort, g, session, url_for
 
 from valentina.constants import HTTPStatus
 from valentina.models import Campaign, Character, DictionaryTerm, Guild, User
+from valentina.models.dictionary import dictionary_term_cache
 from valentina.utils import ValentinaConfig, console
 
 if TYPE_CHECKING:
@@ -42,37 +45,109 @@ def _guard_against_mangled_session_data() -> Response | None:
     return None
 
 
-async def _char_owner_name(character: Character) -> str:
-    """Get the username of a character owner.
+class RequestLookups:
+    """Request-scoped identity map for the users and campaigns referenced by characters.
 
-    Args:
-        character (Character): The character object to get the owner name of.
-
-    Returns:
-        str: The name of the character owner.
+    Collect the owner and campaign ids of a list of characters and resolve them with a single `$in` query per collection. Documents loaded earlier in the request are reused and concurrent loads wait on queries already in flight rather than repeating them.
     """
-    user = await User.get(int(character.user_owner), fetch_links=False)
-    return user.name
 
+    def __init__(self) -> None:
+        self.users: dict[int, User | None] = {}
+        self.campaigns: dict[str, Campaign | None] = {}
+        self._in_flight: dict[int | str, asyncio.Future] = {}
+
+    async def _load(
+        self,
+        document: type[User] | type[Campaign],
+        cache: dict,
+        ids: set[int] | set[str],
+    ) -> None:
+        """Load documents which are not cached into the identity map.
+
+        Args:
+            document (type[User] | type[Campaign]): The document class to query.
+            cache (dict): The identity map for the document class.
+            ids (set[int] | set[str]): The ids to load.
+        """
+        waiting = {self._in_flight[x] for x in ids if x in self._in_flight}
+        missing = [x for x in ids if x not in cache and x not in self._in_flight]
+
+        if missing:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight.update(dict.fromkeys(missing, future))
+            try:
+                query_ids: list[int | PydanticObjectId] = (
+                    [int(x) for x in missing]
+                    if document is User
+                    else [PydanticObjectId(str(x)) for x in missing]
+                )
+                found = await document.find(In(document.id, query_ids), fetch_links=False).to_list()
+                cache.update(dict.fromkeys(missing))
+                cache.update({(x.id if document is User else str(x.id)): x for x in found})
+            finally:
+                for x in missing:
+                    self._in_flight.pop(x, None)
+                future.set_result(None)
+
+        if waiting:
+            await asyncio.gather(*waiting)
+
+    async def load(self, characters: list[Character]) -> None:
+        """Load the owners and campaigns of the given characters.
+
+        Args:
+            characters (list[Character]): The characters whose owners and campaigns to load.
+        """
+        await asyncio.gather(
+            self._load(User, self.users, {int(x.user_owner) for x in characters if x.user_owner}),
+            self._load(
+                Campaign, self.campaigns, {str(x.campaign) for x in characters if x.campaign}
+            ),
+        )
+
+    def owner_name(self, character: Character) -> str:
+        """Get the username of a character owner.
+
+        Args:
+            character (Character): The character object to get the owner name of. Must have been loaded.
+
+        Returns:
+            str: The name of the character owner.
+        """
+        user = self.users.get(int(character.user_owner)) if character.user_owner else None
+        return user.name if user else ""
+
+    def campaign_name(self, character: Character) -> str:
+        """Get the name of a character's campaign.
+
+        Args:
+            character (Character): The character object to get the campaign name of. Must have been loaded.
+
+        Returns:
+            str: The name of the character's campaign.
+        """
+        if not character.campaign:
+            logger.error(f"WEBUI: Character {character.name} has no campaign")
+            return ""
 
-async def _char_campaign_name(character: Character) -> str:
-    """Get the name of a character's campaign.
+        campaign = self.campaigns.get(str(character.campaign))
+        return campaign.name if campaign else ""
+
+
+async def _load_character_lookups(characters: list[Character]) -> RequestLookups:
+    """Load the owners and campaigns of characters into the request's identity map.
 
     Args:
-        character (Character): The character object to get the campaign name of.
+        characters (list[Character]): The characters whose owners and campaigns to load.
 
     Returns:
-        str: The name of the character's campaign.
+        RequestLookups: The identity map for the current request.
     """
-    if not character.campaign:
-        logger.error(f"WEBUI: Character {character.name} has no campaign")
-        return ""
-
-    campaign = await Campaign.get(str(character.campaign), fetch_links=False)
-    if not campaign:
-        return ""
+    if "request_lookups" not in g:
+        g.request_lookups = RequestLookups()
 
-    return campaign.name
+    await g.request_lookups.load(characters)
+    return g.request_lookups
 
 
 async def fetch_active_campaign(
@@ -307,15 +382,16 @@ async def fetch_user_characters(fetch_links: bool = False) -> list[Character]:
         Character.type_player == True,  # noqa: E712
         fetch_links=fetch_links,
     ).to_list()
+    lookups = await _load_character_lookups(characters)
 
     character_session_list = sorted(
         [
             CharacterSessionObject(
                 id=str(x.id),
                 name=x.name,
-                campaign_name=await _char_campaign_name(x),
+                campaign_name=lookups.campaign_name(x),
                 campaign_id=str(x.campaign),
-                owner_name=await _char_owner_name(x),
+                owner_name=lookups.owner_name(x),
                 owner_id=x.user_owner,
                 type_storyteller=x.type_storyteller,
             ).__dict__
@@ -353,15 +429,16 @@ async def fetch_all_characters(fetch_links: bool = False) -> list[Character]:
         Character.type_player == True,  # noqa: E712
         fetch_links=fetch_links,
     ).to_list()
+    lookups = await _load_character_lookups(characters)
 
     character_session_list = sorted(
         [
             CharacterSessionObject(
                 id=str(x.id),
                 name=x.name,
-                campaign_name=await _char_campaign_name(x),
+                campaign_name=lookups.campaign_name(x),
                 campaign_id=str(x.campaign),
-                owner_name=await _char_owner_name(x),
+                owner_name=lookups.owner_name(x),
                 owner_id=x.user_owner,
                 type_storyteller=x.type_storyteller,
                 is_alive=x.is_alive,
@@ -400,15 +477,16 @@ async def fetch_storyteller_characters(fetch_links: bool = False) -> list[Charac
         Character.type_storyteller == True,  # noqa: E712
         fetch_links=fetch_links,
     ).to_list()
+    lookups = await _load_character_lookups(characters)
 
     character_session_list = sorted(
         [
             CharacterSessionObject(
                 id=str(x.id),
                 name=x.name,
-                campaign_name=await _char_campaign_name(x),
+                campaign_name=lookups.campaign_name(x),
                 campaign_id=str(x.campaign),
-                owner_name=await _char_owner_name(x),
+                owner_name=lookups.owner_name(x),
                 owner_id=x.user_owner,
                 type_storyteller=x.type_storyteller,
                 is_alive=x.is_alive,
@@ -453,12 +531,15 @@ async def update_session() -> None:
     logger.debug("Updating session")
     _guard_against_mangled_session_data()
 
-    await fetch_guild(fetch_links=False)
-    await fetch_user(fetch_links=False)
-    await fetch_user_characters(fetch_links=False)
-    await fetch_campaigns(fetch_links=False)
-    await fetch_all_characters(fetch_links=False)
-    await fetch_storyteller_characters(fetch_links=False)
+    # The fetches are independent so run them concurrently. Character owners and campaigns are shared through the request's identity map.
+    await asyncio.gather(
+        fetch_guild(fetch_links=False),
+        fetch_user(fetch_links=False),
+        fetch_user_characters(fetch_links=False),
+        fetch_campaigns(fetch_links=False),
+        fetch_all_characters(fetch_links=False),
+        fetch_storyteller_characters(fetch_links=False),
+    )
     await is_storyteller()
 
     if ValentinaConfig().webui_debug and ValentinaConfig().webui_log_level.upper() in [
@@ -475,49 +556,33 @@ async def link_terms(
     value: str,
     link_type: Literal["markdown", "html"],
     excludes: list[str] = [],
+    guild_id: int | None = None,
 ) -> str:
     """Convert dictionary terms in text to markdown links.
 
-    Search through text for terms and synonyms that exist in the DictionaryTerm collection and convert them to links pointing to their dictionary entries in the web UI. The search is case-insensitive and only matches whole words.
+    Search through text for terms and synonyms that exist in the guild's DictionaryTerm collection and convert them to links pointing to their dictionary entries in the web UI, or to their external link when they have no definition. The search is case-insensitive and only matches whole words. Each guild's terms are compiled into a single cached matcher so the text is searched in one pass.
 
     Args:
         value (str): The text to process
         link_type (Literal["markdown", "html"]): Whether to return HTML links instead of markdown links.
         excludes (list[str]): A list of terms to exclude from the search.
+        guild_id (int, optional): The guild whose terms to link. Defaults to the guild in the session.
 
     Returns:
-        str: The text with dictionary terms converted to markdown links
+        str: The text with dictionary terms converted to markdown links, or the text unchanged when there is no guild, such as on public pages viewed without logging in.
     """
-    for term in await DictionaryTerm.find().to_list():
-        if term.term in excludes:
-            continue
-
-        patterns_to_check = []
-
-        pattern = re.compile(rf"\b(?<![\w/]){re.escape(term.term)}\b(?![\w/]|://)", re.IGNORECASE)
-        patterns_to_check.append(pattern)
-
-        for synonym in term.synonyms:
-            pattern = re.compile(rf"\b(?<![\w/]){re.escape(synonym)}\b(?![\w/]|://)", re.IGNORECASE)
-            patterns_to_check.append(pattern)
-
-        for pattern in patterns_to_check:
-            if term.definition:
-                if link_type == "html":
-                    value = pattern.sub(
-                        lambda m: f"<a href='{url_for('dictionary.term', term=term.term)}'>{m.group(0)}</a>",  # noqa: B023
-                        value,
-                    )
-                else:
-                    value = pattern.sub(
-                        lambda m: f"[{m.group(0)}]({url_for('dictionary.term', term=term.term)})",  # noqa: B023
-                        value,
-                    )
-
-            if term.link:
-                if link_type == "html":
-                    value = pattern.sub(lambda m: f"<a href='{term.link}'>{m.group(0)}</a>", value)  # noqa: B023
-                else:
-                    value = pattern.sub(lambda m: f"[{m.group(0)}]({term.link})", value)  # noqa: B023
-
-    return value
+    guild_id = guild_id or session.get("GUILD_ID")
+    if not guild_id:
+        return value
+
+    matcher = await dictionary_term_cache.get(guild_id)
+
+    def _link(term: DictionaryTerm, text: str) -> str:
+        url = url_for("dictionary.term", term=term.term) if term.definition else term.link
+
+        if link_type == "html":
+            return f"<a href='{url}'>{text}</a>"
+
+        return f"[{text}]({url})"
+
+    return matcher.sub(_link, value, excludes=excludes)
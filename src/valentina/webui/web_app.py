@@ -19,6 +19,7 @@ from quart_session import Session
 from werkzeug.wrappers.response import Response
 
 from valentina.constants import WEBUI_ROOT_PATH, WebUIEnvironment
+from valentina.models.statistics import roll_statistic_writer
 from valentina.utils import ValentinaConfig
 from valentina.webui.utils.blueprints import import_all_bps
 from valentina.webui.utils.errors import register_error_handlers
@@ -74,6 +75,11 @@ def configure_app(environment: WebUIEnvironment) -> Quart:
 
         return None
 
+    @app.after_serving
+    async def flush_roll_statistics() -> None:
+        """Write any buffered roll statistics to the database when the server stops."""
+        await roll_statistic_writer.close()
+
     return app
 
 
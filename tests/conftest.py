@@ -15,8 +15,12 @@ from loguru import logger
 from pymongo import AsyncMongoClient
 from rich import print as rprint
 
+from valentina.models.dictionary import dictionary_term_cache
 from valentina.utils import ValentinaConfig, console
+from valentina.utils.autocomplete_index import autocomplete_index
+from valentina.utils.channel_cache import channel_cache
 from valentina.utils.database import init_database, test_db_connection
+from valentina.utils.permission_cache import guild_permission_cache
 
 ### Constants for Testing ###
 CHANNEL_CHARACTER_ID = 1234567890
@@ -73,6 +77,11 @@ async def _init_database(request) -> None:
         if "drop_db" in request.keywords:
             # Drop the database after the test
             await client.drop_database(ValentinaConfig().test_mongo_database_name)
+            # Forget ids cached from the dropped database
+            channel_cache.clear()
+            autocomplete_index.clear()
+            dictionary_term_cache.clear()
+            guild_permission_cache.clear()
 
         # Initialize beanie with the Sample document class and a database
         await init_database(
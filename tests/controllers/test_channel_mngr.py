@@ -0,0 +1,34 @@
+# type: ignore
+"""Tests for the ChannelManager controller."""
+
+import asyncio
+import gc
+
+import pytest
+
+from valentina.controllers.channel_mngr import CAMPAIGN_LOCKS, campaign_lock
+
+
+@pytest.mark.no_db
+async def test_campaign_locks_are_dropped_when_released():
+    """Verify a campaign's lock is shared while held and dropped once released."""
+    # GIVEN a campaign's lock which is held
+    lock = campaign_lock("1")
+    async with lock:
+        # WHEN another coroutine waits on the campaign's lock
+        waiter = asyncio.create_task(campaign_lock("1").acquire())
+        await asyncio.sleep(0)
+
+        # THEN it waits on the same lock
+        assert campaign_lock("1") is lock
+        assert not waiter.done()
+
+    await waiter
+    lock.release()
+
+    # WHEN no coroutine holds or waits on the lock
+    del lock, waiter
+    gc.collect()
+
+    # THEN the lock is dropped
+    assert "1" not in CAMPAIGN_LOCKS
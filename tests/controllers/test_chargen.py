@@ -1,8 +1,6 @@
 # type: ignore
 """Test the chargen module."""
 
-from unittest.mock import AsyncMock
-
 import pytest
 
 from tests.conftest import GUILD_ID
@@ -35,9 +33,11 @@ async def test_generate_full_character(
     char_class,
 ):
     """Test the generate_full_character method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
+    # MOCK the name generator
+    mocker.patch(
+        "valentina.controllers.rng_chargen.name_generator.random_name",
+        return_value=("mock_first", "mock_last"),
+    )
 
     # GIVEN a user, campaign, and a character generator
     user = user_factory.build(characters=[])
@@ -174,9 +174,11 @@ async def test_rngchargen_generate_base_character(
     mocker,
 ):
     """Test the generate_base_character method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
+    # MOCK the name generator
+    mocker.patch(
+        "valentina.controllers.rng_chargen.name_generator.random_name",
+        return_value=("mock_first", "mock_last"),
+    )
 
     # GIVEN a user and a character generator
 
@@ -260,13 +262,8 @@ async def test_random_attributes(
     level,
     primary_dots,
     non_primary_dots,
-    mocker,
 ):
     """Test the random_abilities method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
-
     # GIVEN a character and a character generator
     user = user_factory.build()
     char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=level)
@@ -333,13 +330,8 @@ async def test_random_abilities(
     level,
     primary_dots,
     non_primary_dots,
-    mocker,
 ):
     """Test the random_abilities method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
-
     # GIVEN a character and a character generator
     user = user_factory.build()
     char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=level)
@@ -392,13 +384,8 @@ async def test_random_disciplines(
     clan,
     level,
     num_disciplines,
-    mocker,
 ):
     """Test the random_disciplines method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
-
     # GIVEN a character and a character generator
     user = user_factory.build()
     char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=level)
@@ -429,12 +416,8 @@ async def test_random_disciplines(
         (CharClass.VAMPIRE, RNGCharLevel.ELITE, 2),
     ],
 )
-async def test_random_virtues(user_factory, mock_ctx1, char_class, level, modifier, mocker):
+async def test_random_virtues(user_factory, mock_ctx1, char_class, level, modifier):
     """Test the andom_virtues method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
-
     # GIVEN a character and a character generator
     user = user_factory.build()
     char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=level)
@@ -472,13 +455,8 @@ async def test_concept_special_abilities(
     concept,
     section_titles,
     trait_names,
-    mocker,
 ):
     """Test the concept_special_abilities method."""
-    # MOCK the call the fetch_random_name
-    async_mock = AsyncMock(return_value=("mock_first", "mock_last"))
-    mocker.patch("valentina.controllers.rng_chargen.fetch_random_name", side_effect=async_mock)
-
     # GIVEN a character and a character generator
     user = user_factory.build()
     char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user)
@@ -504,3 +482,50 @@ async def test_concept_special_abilities(
     else:
         assert not result.traits
         assert not result.sheet_sections
+
+
+@pytest.mark.drop_db
+async def test_generate_full_characters(user_factory, mock_ctx1):
+    """Test the generate_full_characters method."""
+    # GIVEN a user and a character generator
+    user = user_factory.build(characters=[])
+    await user.insert()
+    char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=RNGCharLevel.NEW)
+
+    # WHEN three characters are generated
+    characters = await char_gen.generate_full_characters(3, chargen_character=True)
+
+    # THEN three distinct characters are written to the database with their traits
+    assert len({x.id for x in characters}) == 3
+    for character in characters:
+        db_character = await Character.get(character.id, fetch_links=True)
+        assert db_character.type_chargen is True
+        assert db_character.traits
+        assert await CharacterTrait.find(
+            CharacterTrait.character == str(character.id)
+        ).count() == len(db_character.traits)
+
+
+@pytest.mark.drop_db
+async def test_generate_draft_characters(user_factory, mock_ctx1):
+    """Test draft characters are not written to the database until inserted."""
+    # GIVEN a user and a character generator
+    user = user_factory.build(characters=[])
+    await user.insert()
+    char_gen = RNGCharGen(guild_id=mock_ctx1.guild.id, user=user, experience_level=RNGCharLevel.NEW)
+
+    # WHEN three draft characters are generated
+    characters = await char_gen.generate_full_characters(3, chargen_character=True, draft=True)
+
+    # THEN the drafts have traits but nothing is written to the database
+    assert len(characters) == 3
+    assert all(x.id is None and x.traits for x in characters)
+    assert await Character.count() == 0
+    assert await CharacterTrait.count() == 0
+
+    # WHEN one draft is inserted
+    selected = await characters[0].insert_with_traits()
+
+    # THEN only the selected character and its traits are written
+    assert await Character.count() == 1
+    assert await CharacterTrait.count() == len(selected.traits)
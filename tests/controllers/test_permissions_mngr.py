@@ -256,3 +256,22 @@ async def test_can_kill_character(
     assert (
         await manager.can_kill_character(author_id=user1.id, character_id=character.id) == expected
     )
+
+
+@pytest.mark.drop_db
+async def test_permissions_reflect_guild_changes(guild_factory, user_factory) -> None:
+    """Verify permission checks see changes saved to the guild after they were first evaluated."""
+    # GIVEN a guild and a user who is not a storyteller
+    guild = guild_factory.build()
+    user = user_factory.build()
+    await guild.insert()
+    manager = PermissionManager(guild.id)
+    assert not await manager.is_storyteller(user.id)
+
+    # WHEN the user is made a storyteller
+    guild.storytellers.append(user.id)
+    await guild.save()
+
+    # THEN existing and new permission managers see the change
+    assert await manager.is_storyteller(user.id)
+    assert await PermissionManager(guild.id).is_storyteller(user.id)
@@ -0,0 +1,194 @@
+# type: ignore
+"""Test the task broker."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from tests.conftest import GUILD_ID
+from tests.factories import *
+from valentina.constants import BrokerTaskType
+from valentina.controllers import TaskBroker
+from valentina.models import BrokerTask
+
+
+@pytest.fixture
+def mock_channel_manager(mocker):
+    """Patch the channel manager methods called by the task broker."""
+    return {
+        name: mocker.patch(
+            f"valentina.controllers.task_broker.ChannelManager.{name}",
+            new_callable=AsyncMock,
+        )
+        for name in (
+            "confirm_book_channel",
+            "confirm_campaign_channels",
+            "confirm_character_channel",
+            "delete_campaign_channels",
+            "sort_campaign_channels",
+        )
+    }
+
+
+@pytest.mark.drop_db
+async def test_coalesce_duplicate_tasks(
+    campaign_factory, book_factory, character_factory, mock_guild1
+):
+    """Verify duplicate tasks for the same character or book are coalesced."""
+    # GIVEN a campaign with a book and a character
+    campaign = await campaign_factory.build(guild=GUILD_ID).insert()
+    book = await book_factory.build(campaign=str(campaign.id)).insert()
+    character = await character_factory.build(
+        guild=GUILD_ID, campaign=str(campaign.id), type_player=True
+    ).insert()
+
+    # GIVEN duplicate tasks for the character and the book
+    tasks = [
+        await BrokerTask(
+            guild_id=GUILD_ID,
+            task=BrokerTaskType.CONFIRM_CHARACTER_CHANNEL,
+            data={"character_id": character.id},
+        ).insert()
+        for _ in range(3)
+    ] + [
+        await BrokerTask(
+            guild_id=GUILD_ID,
+            task=BrokerTaskType.CONFIRM_BOOK_CHANNEL,
+            data={"book_id": book.id, "campaign_id": campaign.id},
+        ).insert()
+        for _ in range(2)
+    ]
+
+    # WHEN the tasks are coalesced
+    work = await TaskBroker(mock_guild1)._coalesce_tasks(tasks)
+
+    # THEN a single unit of work is created for the campaign
+    assert len(work) == 1
+    assert work[0].campaign_id == str(campaign.id)
+    assert not work[0].confirm_campaign
+    assert work[0].book_ids == {str(book.id)}
+    assert list(work[0].characters) == [str(character.id)]
+    assert len(work[0].tasks) == 5
+
+
+@pytest.mark.drop_db
+async def test_coalesce_campaign_task_supersedes(
+    campaign_factory, book_factory, character_factory, mock_guild1
+):
+    """Verify a campaign task supersedes book and character tasks in the same campaign."""
+    # GIVEN a campaign with a book and a character
+    campaign = await campaign_factory.build(guild=GUILD_ID).insert()
+    book = await book_factory.build(campaign=str(campaign.id)).insert()
+    character = await character_factory.build(
+        guild=GUILD_ID, campaign=str(campaign.id), type_player=True
+    ).insert()
+
+    # GIVEN tasks for the campaign, the book, and the character
+    tasks = [
+        await BrokerTask(
+            guild_id=GUILD_ID,
+            task=BrokerTaskType.CONFIRM_CAMPAIGN_CHANNEL,
+            data={"campaign_id": campaign.id},
+        ).insert(),
+        await BrokerTask(
+            guild_id=GUILD_ID,
+            task=BrokerTaskType.CONFIRM_BOOK_CHANNEL,
+            data={"book_id": book.id, "campaign_id": campaign.id},
+        ).insert(),
+        await BrokerTask(
+            guild_id=GUILD_ID,
+            task=BrokerTaskType.CONFIRM_CHARACTER_CHANNEL,
+            data={"character_id": character.id},
+        ).insert(),
+    ]
+
+    # WHEN the tasks are coalesced
+    work = await TaskBroker(mock_guild1)._coalesce_tasks(tasks)
+
+    # THEN only the campaign is confirmed
+    assert len(work) == 1
+    assert work[0].confirm_campaign
+    assert not work[0].book_ids
+    assert not work[0].characters
+    assert len(work[0].tasks) == 3
+
+
+@pytest.mark.drop_db
+async def test_coalesce_flags_invalid_tasks(mock_guild1):
+    """Verify tasks missing required data are flagged with an error."""
+    # GIVEN a task without a character id
+    task = await BrokerTask(
+        guild_id=GUILD_ID,
+        task=BrokerTaskType.CONFIRM_CHARACTER_CHANNEL,
+        data={},
+    ).insert()
+
+    # WHEN the tasks are coalesced
+    work = await TaskBroker(mock_guild1)._coalesce_tasks([task])
+
+    # THEN no work is created and the task is flagged
+    assert work == []
+    assert (await BrokerTask.get(task.id)).has_error
+
+
+@pytest.mark.drop_db
+async def test_run_coalesced_tasks(
+    campaign_factory, character_factory, mock_guild1, mock_channel_manager
+):
+    """Verify run() confirms each character once and deletes every task."""
+    # GIVEN two campaigns with a character each
+    characters = []
+    for _ in range(2):
+        campaign = await campaign_factory.build(guild=GUILD_ID).insert()
+        characters.append(
+            await character_factory.build(
+                guild=GUILD_ID, campaign=str(campaign.id), type_player=True
+            ).insert()
+        )
+
+    # GIVEN duplicate tasks for each character
+    for character in characters:
+        for _ in range(2):
+            await BrokerTask(
+                guild_id=GUILD_ID,
+                task=BrokerTaskType.CONFIRM_CHARACTER_CHANNEL,
+                data={"character_id": character.id},
+            ).insert()
+
+    # WHEN the broker runs
+    await TaskBroker(mock_guild1).run()
+
+    # THEN each character channel is confirmed once and all tasks are deleted
+    assert mock_channel_manager["confirm_character_channel"].await_count == 2
+    assert await BrokerTask.count() == 0
+
+
+@pytest.mark.drop_db
+async def test_run_rebuild_supersedes_other_tasks(
+    campaign_factory, character_factory, mock_guild1, mock_channel_manager
+):
+    """Verify a rebuild task rebuilds every campaign and clears all other tasks."""
+    # GIVEN two campaigns and a character
+    campaign = await campaign_factory.build(guild=GUILD_ID).insert()
+    await campaign_factory.build(guild=GUILD_ID).insert()
+    character = await character_factory.build(
+        guild=GUILD_ID, campaign=str(campaign.id), type_player=True
+    ).insert()
+
+    # GIVEN duplicate rebuild tasks and a character task
+    for _ in range(2):
+        await BrokerTask(guild_id=GUILD_ID, task=BrokerTaskType.REBUILD_CHANNELS).insert()
+    await BrokerTask(
+        guild_id=GUILD_ID,
+        task=BrokerTaskType.CONFIRM_CHARACTER_CHANNEL,
+        data={"character_id": character.id},
+    ).insert()
+
+    # WHEN the broker runs
+    await TaskBroker(mock_guild1).run()
+
+    # THEN every campaign is rebuilt once and all tasks are deleted
+    assert mock_channel_manager["delete_campaign_channels"].await_count == 2
+    assert mock_channel_manager["confirm_campaign_channels"].await_count == 2
+    mock_channel_manager["confirm_character_channel"].assert_not_awaited()
+    assert await BrokerTask.count() == 0
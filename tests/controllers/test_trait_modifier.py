@@ -4,8 +4,9 @@
 import pytest
 
 from tests.factories import *
-from valentina.constants import TraitCategory
+from valentina.constants import TRAIT_RESTORE_ATTEMPTS, TraitCategory
 from valentina.controllers import TraitModifier
+from valentina.models import Character, CharacterTrait, User
 from valentina.models.user import CampaignExperience
 from valentina.utils import errors
 
@@ -88,19 +89,19 @@ async def test_upgrade_with_xp(
     # GIVEN a user, a campaign, a character, and a trait
     campaign = campaign_factory.build()
 
-    user = user_factory.build(
+    user = await user_factory.build(
         campaign_experience={
             str(campaign.id): CampaignExperience(xp_current=30, xp_total=30, cool_points=1),
         },
-    )
+    ).insert()
 
-    trait = trait_factory.build(
+    trait = await trait_factory.build(
         category_name=TraitCategory.SKILLS.name,
         name="Drive",
         value=2,
         max_value=5,
-    )
-    character = character_factory.build(traits=[trait])
+    ).insert()
+    character = await character_factory.build(traits=[trait]).insert()
 
     # WHEN the trait is upgraded with XP
     trait_modifier = TraitModifier(character=character, user=user)
@@ -129,19 +130,19 @@ async def test_downgrade_with_xp(
     # GIVEN a user, a campaign, a character, and a trait
     campaign = campaign_factory.build()
 
-    user = user_factory.build(
+    user = await user_factory.build(
         campaign_experience={
             str(campaign.id): CampaignExperience(xp_current=30, xp_total=30, cool_points=1),
         },
-    )
+    ).insert()
 
-    trait = trait_factory.build(
+    trait = await trait_factory.build(
         category_name=TraitCategory.SKILLS.name,
         name="Drive",
         value=2,
         max_value=5,
-    )
-    character = character_factory.build(traits=[trait])
+    ).insert()
+    character = await character_factory.build(traits=[trait]).insert()
 
     # WHEN the trait is downgraded with XP
     trait_modifier = TraitModifier(character=character, user=user)
@@ -235,3 +236,146 @@ async def test_downgrade_with_freebie(
     # THEN an error should be raised
     with pytest.raises(errors.TraitAtMinValueError):
         downgraded_trait = await trait_modifier.downgrade_with_freebie(trait)
+
+
+@pytest.mark.drop_db
+async def test_concurrent_upgrades_with_xp(
+    user_factory,
+    campaign_factory,
+    character_factory,
+    trait_factory,
+) -> None:
+    """Test concurrent upgrades from stale copies neither lose updates, overspend, nor underpay."""
+    # GIVEN a user with XP and a trait two dots below its max value
+    campaign = campaign_factory.build()
+    user = await user_factory.build(
+        campaign_experience={
+            str(campaign.id): CampaignExperience(xp_current=40, xp_total=40, cool_points=0),
+        },
+    ).insert()
+    trait = await trait_factory.build(
+        category_name=TraitCategory.SKILLS.name,
+        name="Drive",
+        value=3,
+        max_value=5,
+    ).insert()
+    character = await character_factory.build(traits=[trait]).insert()
+
+    # AND two copies of the user and trait loaded at the same time
+    first = TraitModifier(character=character, user=await User.get(user.id))
+    second = TraitModifier(character=character, user=await User.get(user.id))
+    first_trait = await CharacterTrait.get(trait.id)
+    second_trait = await CharacterTrait.get(trait.id)
+
+    # WHEN both copies upgrade the trait
+    await first.upgrade_with_xp(first_trait, campaign)
+    await second.upgrade_with_xp(second_trait, campaign)
+
+    # THEN both upgrades are applied and the second is priced at the value it raised the trait from
+    assert (await CharacterTrait.get(trait.id)).value == 5
+    assert (await Character.get_with_traits(character.id)).traits[0].value == 5
+    assert second_trait.value == 5
+    assert (await User.get(user.id)).fetch_campaign_xp(campaign) == (22, 40, 0)
+    assert second.user.fetch_campaign_xp(campaign) == (22, 40, 0)
+
+    # WHEN the stale copy of the trait is upgraded past its max value
+    assert first_trait.value == 4
+
+    # THEN an error is raised and the XP is refunded
+    with pytest.raises(errors.TraitAtMaxValueError):
+        await first.upgrade_with_xp(first_trait, campaign)
+
+    assert (await CharacterTrait.get(trait.id)).value == 5
+    assert (await User.get(user.id)).fetch_campaign_xp(campaign) == (22, 40, 0)
+
+
+@pytest.mark.drop_db
+async def test_downgrade_restores_trait_when_refund_fails(
+    user_factory, character_factory, trait_factory, mocker
+) -> None:
+    """Test a lowered trait is raised again when its points can not be refunded."""
+    # GIVEN a character with a trait and a refund which fails
+    user = await user_factory.build().insert()
+    trait = await trait_factory.build(
+        category_name=TraitCategory.SKILLS.name,
+        name="Drive",
+        value=2,
+        max_value=5,
+    ).insert()
+    character = await character_factory.build(traits=[trait], freebie_points=20).insert()
+    trait_modifier = TraitModifier(character=character, user=user)
+    mocker.patch.object(
+        trait_modifier, "_change_freebie_points", side_effect=errors.NotEnoughFreebiePointsError
+    )
+
+    # WHEN the trait is downgraded
+    with pytest.raises(errors.NotEnoughFreebiePointsError):
+        await trait_modifier.downgrade_with_freebie(trait)
+
+    # THEN the trait keeps its value
+    assert trait.value == 2
+    assert (await CharacterTrait.get(trait.id)).value == 2
+
+
+@pytest.mark.drop_db
+async def test_stale_downgrade_with_freebie(user_factory, character_factory, trait_factory) -> None:
+    """Test a downgrade from a stale copy is re-priced at the trait's current value."""
+    # GIVEN a character with freebie points and a trait
+    user = await user_factory.build().insert()
+    trait = await trait_factory.build(
+        category_name=TraitCategory.SKILLS.name,
+        name="Drive",
+        value=3,
+        max_value=5,
+    ).insert()
+    character = await character_factory.build(traits=[trait], freebie_points=20).insert()
+
+    # AND a stale copy of the trait loaded before the trait was raised elsewhere
+    stale_trait = await CharacterTrait.get(trait.id)
+    await TraitModifier(character=character, user=user).upgrade_with_freebie(trait)
+    assert character.freebie_points == 12
+
+    # WHEN the stale copy of the trait is downgraded
+    trait_modifier = TraitModifier(character=character, user=user)
+    await trait_modifier.downgrade_with_freebie(stale_trait)
+
+    # THEN the trait is lowered from its current value and the savings of that dot are refunded
+    assert stale_trait.value == 3
+    assert (await CharacterTrait.get(trait.id)).value == 3
+    assert character.freebie_points == 20
+
+
+@pytest.mark.parametrize(
+    "restore_results",
+    [
+        [errors.TraitAtMaxValueError],
+        [False] * TRAIT_RESTORE_ATTEMPTS,
+    ],
+)
+async def test_downgrade_raises_refund_error_when_restore_fails(
+    user_factory, character_factory, trait_factory, mocker, restore_results
+) -> None:
+    """Test the refund error is raised when the lowered trait can not be raised again."""
+    # GIVEN a refund which fails and a trait which can not be raised again
+    trait = trait_factory.build(
+        category_name=TraitCategory.SKILLS.name,
+        name="Drive",
+        value=2,
+        max_value=5,
+    )
+    trait_modifier = TraitModifier(
+        character=character_factory.build(traits=[trait]), user=user_factory.build()
+    )
+    mocker.patch.object(
+        trait_modifier, "_change_freebie_points", side_effect=errors.NotEnoughFreebiePointsError
+    )
+    change_trait_value = mocker.patch.object(
+        trait_modifier, "_change_trait_value", side_effect=[True, *restore_results]
+    )
+
+    # WHEN the trait is downgraded
+    # THEN the refund error is raised after a limited number of attempts to restore the trait
+    with pytest.raises(errors.NotEnoughFreebiePointsError):
+        await trait_modifier.downgrade_with_freebie(trait)
+
+    assert change_trait_value.call_count == 1 + len(restore_results)
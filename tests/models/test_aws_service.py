@@ -7,6 +7,7 @@ import pytest
 
 from tests.conftest import GUILD_ID
 from valentina.models import AWSService
+from valentina.models.aws import S3KeyTree, S3Object
 from valentina.utils import errors
 
 
@@ -34,3 +35,152 @@ def test_get_url(mocker):
     # THEN the correct URL is returned
     svc = AWSService()
     assert svc.get_url(key="1/test/1") == "https://bucket.s3.amazonaws.com/1/test/1"
+
+
+@pytest.mark.no_db
+async def test_get_url_uses_region(mocker):
+    """Test get_url uses the bucket's regional endpoint once the region is cached."""
+    # GIVEN a patched boto3 client for a bucket outside us-east-1
+    client_mock = MagicMock()
+    client_mock.get_bucket_location.return_value = {"LocationConstraint": "eu-west-1"}
+    mocker.patch("valentina.models.aws.boto3.client", return_value=client_mock)
+    svc = AWSService()
+
+    # WHEN the region is cached
+    await svc.region()
+
+    # THEN the regional endpoint is used
+    assert svc.get_url(key="1/test/1") == "https://bucket.s3.eu-west-1.amazonaws.com/1/test/1"
+
+
+@pytest.mark.no_db
+def test_get_url_uses_endpoint_url(mocker):
+    """Test get_url addresses objects by path on an S3 compatible service."""
+    # GIVEN an S3 compatible service
+    mocker.patch(
+        "valentina.models.aws.ValentinaConfig",
+        return_value=MagicMock(s3_bucket_name="bucket", s3_endpoint_url="http://localhost:9000/"),
+    )
+
+    # WHEN the get_url method is called
+    # THEN the URL is on the service
+    svc = AWSService()
+    assert svc.get_url(key="1/test/1") == "http://localhost:9000/bucket/1/test/1"
+
+
+@pytest.mark.no_db
+async def test_delete_objects_batches_keys(mocker):
+    """Test delete_objects sends keys in batches of at most 1000."""
+    # GIVEN a patched boto3 client
+    client_mock = MagicMock()
+    client_mock.delete_objects.side_effect = lambda **kwargs: {
+        "Deleted": kwargs["Delete"]["Objects"]
+    }
+    mocker.patch("valentina.models.aws.boto3.client", return_value=client_mock)
+    svc = AWSService()
+
+    # WHEN 2500 keys are deleted
+    keys = [f"1/characters/1/{i}.png" for i in range(2500)]
+    deleted = await svc.delete_objects(keys)
+
+    # THEN the keys are deleted with three requests
+    assert sorted(deleted) == sorted(keys)
+    assert sorted(
+        len(x.kwargs["Delete"]["Objects"]) for x in client_mock.delete_objects.call_args_list
+    ) == [500, 1000, 1000]
+
+
+@pytest.mark.no_db
+async def test_client_and_region_are_cached(mocker):
+    """Test the boto3 client and the bucket region are created once."""
+    # GIVEN a patched boto3 client
+    client_mock = MagicMock()
+    client_mock.get_bucket_location.return_value = {"LocationConstraint": None}
+    boto_client = mocker.patch("valentina.models.aws.boto3.client", return_value=client_mock)
+    svc = AWSService()
+
+    # WHEN the region is requested twice
+    # THEN the region is fetched once with a single client
+    assert await svc.region() == "us-east-1"
+    assert await svc.region() == "us-east-1"
+    boto_client.assert_called_once()
+    client_mock.get_bucket_location.assert_called_once()
+
+
+@pytest.mark.no_db
+def test_s3_key_tree():
+    """Test objects are found by prefix and removed from the key tree."""
+    # GIVEN a tree of keys
+    tree = S3KeyTree()
+    for key in ["1/characters/2/a.png", "1/characters/2/b.png", "1/characters/3/c.png", "2/d.png"]:
+        tree.add(S3Object(key=key, size=1))
+
+    # THEN objects are found by any prefix
+    assert len(tree) == 4
+    assert [x.key for x in tree.find("1/characters/2/")] == [
+        "1/characters/2/a.png",
+        "1/characters/2/b.png",
+    ]
+    assert [x.key for x in tree.find("1/char")] == [
+        "1/characters/2/a.png",
+        "1/characters/2/b.png",
+        "1/characters/3/c.png",
+    ]
+    assert [x.key for x in tree.find("1/characters/2/b")] == ["1/characters/2/b.png"]
+    assert tree.find("3/") == []
+    assert tree.get("2/d.png").size == 1
+
+    # WHEN objects are removed
+    tree.remove("1/characters/3/c.png")
+    tree.remove("1/missing/e.png")
+
+    # THEN empty branches are pruned
+    assert "3" not in tree.children["1"].children["characters"].children
+    assert len(tree) == 3
+
+    # WHEN a prefix is replaced
+    replacement = S3KeyTree()
+    replacement.add(S3Object(key="1/users/4/f.png"))
+    tree.replace("1/", replacement)
+
+    # THEN only the objects under the prefix are replaced
+    assert [x.key for x in tree.find("")] == ["1/users/4/f.png", "2/d.png"]
+
+
+@pytest.mark.no_db
+async def test_s3_key_index(mocker):
+    """Test the S3 key index lists the bucket by page and follows uploads and deletes."""
+    # GIVEN a patched boto3 client with two pages of objects
+    pages = [
+        {
+            "Contents": [{"Key": "1/a.png", "Size": 10}],
+            "IsTruncated": True,
+            "NextContinuationToken": "token",
+        },
+        {"Contents": [{"Key": "1/b.png", "Size": 20}], "IsTruncated": False},
+    ]
+    client_mock = MagicMock()
+    client_mock.list_objects_v2.side_effect = pages
+    client_mock.delete_objects.side_effect = lambda **kwargs: {
+        "Deleted": kwargs["Delete"]["Objects"]
+    }
+    mocker.patch("valentina.models.aws.boto3.client", return_value=client_mock)
+    svc = AWSService()
+
+    # WHEN a guild's objects are searched for the first time
+    objects = await svc.index.find("1/")
+
+    # THEN every page is listed and indexed
+    assert [(x.key, x.size) for x in objects] == [("1/a.png", 10), ("1/b.png", 20)]
+    assert client_mock.list_objects_v2.call_args_list[1].kwargs["ContinuationToken"] == "token"
+
+    # WHEN objects are uploaded and deleted
+    await svc.upload_image(b"12345", "1/c.png", overwrite=True)
+    await svc.delete_objects(["1/a.png"])
+
+    # THEN the index is updated without listing the bucket again
+    assert [(x.key, x.size) for x in await svc.index.find("1/")] == [
+        ("1/b.png", 20),
+        ("1/c.png", 5),
+    ]
+    assert client_mock.list_objects_v2.call_count == 2
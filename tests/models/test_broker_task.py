@@ -0,0 +1,76 @@
+# type: ignore
+"""Test the BrokerTask model."""
+
+import asyncio
+
+import pytest
+
+from tests.conftest import GUILD_ID
+from valentina.constants import BrokerTaskType
+from valentina.models import BrokerTask
+from valentina.models.broker_task import BrokerTaskNotifier
+
+
+@pytest.fixture
+def notifier(monkeypatch) -> BrokerTaskNotifier:
+    """Replace the shared notifier with a fresh one without a debounce."""
+    notifier = BrokerTaskNotifier(debounce=0)
+    monkeypatch.setattr("valentina.models.broker_task.broker_task_notifier", notifier)
+    return notifier
+
+
+@pytest.mark.no_db
+async def test_notifier_coalesces_guilds():
+    """Verify repeated notifications for a guild are returned once."""
+    # GIVEN a notifier
+    notifier = BrokerTaskNotifier(debounce=0)
+
+    # WHEN several notifications are sent
+    notifier.notify(1)
+    notifier.notify(1)
+    notifier.notify(2)
+
+    # THEN each guild is returned once
+    assert await notifier.wait() == {1, 2}
+
+
+@pytest.mark.no_db
+async def test_notifier_waits_for_notification():
+    """Verify wait() blocks until a notification is sent."""
+    # GIVEN a notifier with nothing pending
+    notifier = BrokerTaskNotifier(debounce=0)
+    waiter = asyncio.create_task(notifier.wait())
+    await asyncio.sleep(0.01)
+    assert not waiter.done()
+
+    # WHEN a notification is sent
+    notifier.notify(GUILD_ID)
+
+    # THEN the waiter returns the guild
+    assert await asyncio.wait_for(waiter, timeout=1) == {GUILD_ID}
+
+
+@pytest.mark.drop_db
+async def test_insert_notifies_task_broker(notifier):
+    """Verify inserting a task notifies the task broker."""
+    # GIVEN a notifier with nothing pending
+
+    # WHEN a task is inserted
+    await BrokerTask(guild_id=GUILD_ID, task=BrokerTaskType.REBUILD_CHANNELS).insert()
+
+    # THEN the guild is pending
+    assert await asyncio.wait_for(notifier.wait(), timeout=1) == {GUILD_ID}
+
+
+@pytest.mark.drop_db
+async def test_errored_task_does_not_notify(notifier):
+    """Verify saving a task flagged with an error does not notify the task broker."""
+    # GIVEN a notifier with nothing pending and a task flagged with an error
+    task = BrokerTask(guild_id=GUILD_ID, task=BrokerTaskType.REBUILD_CHANNELS, has_error=True)
+
+    # WHEN the task is saved
+    await task.save()
+
+    # THEN nothing is pending
+    with pytest.raises(TimeoutError):
+        await asyncio.wait_for(notifier.wait(), timeout=0.1)
@@ -5,6 +5,7 @@ import pytest
 from rich import print  # noqa: A004
 
 from valentina.models import ChangelogParser
+from valentina.models.changelog import ChangelogIndex, changelog_index_cache
 
 sample_changelog = """
 ## v2.0.0 (2023-11-04)
@@ -314,3 +315,40 @@ def test_changelog_get_embed_exclude_oldest(changelog, mock_bot):
 View the [full changelog on Github](https://github.com/natelandau/valentina/releases)
 """
     )
+
+
+def test_changelog_is_parsed_once(changelog, mock_bot, mocker):
+    """Test the changelog is parsed once and again only when the file changes."""
+    # GIVEN a parsed changelog
+    parse = mocker.spy(ChangelogIndex, "__init__")
+    ChangelogParser(mock_bot)
+    index = changelog_index_cache.get(changelog)
+
+    # WHEN more parsers are created
+    parser = ChangelogParser(mock_bot, oldest_version="1.1.0", newest_version="2.0.0")
+
+    # THEN the changelog is not parsed again
+    assert changelog_index_cache.get(changelog) is index
+    assert parse.call_count == 1
+    assert parser.list_of_versions() == ["2.0.0", "1.1.0"]
+
+    # WHEN the changelog file changes
+    changelog.write_text(
+        sample_changelog.replace("## v2.0.0 (2023-11-04)", "## v2.10.0 (2023-11-05)")
+    )
+
+    # THEN the changelog is parsed again
+    parser = ChangelogParser(mock_bot, oldest_version="1.1.0")
+    assert parser.list_of_versions() == ["2.10.0", "1.1.0"]
+    assert changelog_index_cache.get(changelog) is not index
+
+
+def test_changelog_index_versions_between():
+    """Test the ChangelogIndex versions_between method."""
+    index = ChangelogIndex(sample_changelog)
+
+    assert index.versions_between("0.0.1", "999.999.999") == ["2.0.0", "1.1.0", "1.0.0"]
+    assert index.versions_between("1.0.0", "1.1.0") == ["1.1.0", "1.0.0"]
+    assert index.versions_between("1.0.0", "1.1.0", include_oldest=False) == ["1.1.0"]
+    assert index.versions_between("1.0.1", "1.9.0") == ["1.1.0"]
+    assert index.versions_between("2.1.0", "2.0.0") == []
@@ -4,8 +4,15 @@
 import pytest
 
 from tests.factories import *
-from valentina.constants import CharacterConcept, CharClass, HunterCreed, TraitCategory, VampireClan
-from valentina.models import Character, CharacterTrait
+from valentina.constants import (
+    CharacterConcept,
+    CharClass,
+    HunterCreed,
+    ImageVariant,
+    TraitCategory,
+    VampireClan,
+)
+from valentina.models import Character, CharacterTrait, InventoryItem
 from valentina.utils import errors
 
 
@@ -128,6 +135,73 @@ async def test_add_trait(character_factory) -> None:
     assert await CharacterTrait.get(new_trait.id) == new_trait
 
 
+@pytest.mark.drop_db
+async def test_stage_trait_and_insert_with_traits(character_factory) -> None:
+    """Test assembling a character in memory and inserting it with its traits."""
+    # GIVEN a character which has not been inserted
+    character = character_factory.build(id=None, traits=[])
+
+    # WHEN traits are staged
+    for name in ("Strength", "Dexterity"):
+        character.stage_trait(
+            CharacterTrait(
+                category_name=TraitCategory.PHYSICAL.name,
+                name=name,
+                value=2,
+                max_value=5,
+                character="",
+            )
+        )
+
+    # THEN nothing is written to the database
+    assert await CharacterTrait.count() == 0
+
+    # AND a duplicate trait is rejected
+    with pytest.raises(errors.TraitExistsError):
+        character.stage_trait(
+            CharacterTrait(
+                category_name=TraitCategory.PHYSICAL.name,
+                name="strength",
+                value=3,
+                max_value=5,
+                character="",
+            )
+        )
+
+    # WHEN the character is inserted with its traits
+    await character.insert_with_traits()
+
+    # THEN the character and its traits are in the database
+    char = await Character.get(character.id, fetch_links=True)
+    assert sorted(x.name for x in char.traits) == ["Dexterity", "Strength"]
+    assert all(x.character == str(char.id) for x in char.traits)
+    assert await CharacterTrait.count() == 2
+
+    # AND the traits are embedded in the character
+    loaded = await Character.get_with_traits(character.id)
+    assert sorted(x.name for x in loaded.traits) == ["Dexterity", "Strength"]
+
+
+@pytest.mark.no_db
+async def test_image_url(character_factory):
+    """Test image_url returns a derivative only for images which have them."""
+    # GIVEN a character with an image with derivatives and an image without
+    character = character_factory.build(
+        images=["1/characters/2/1.png", "1/characters/2/2.gif"],
+        images_with_derivatives=["1/characters/2/1.png"],
+    )
+
+    # THEN the requested derivative is returned when it exists
+    url = "https://bucket.s3.amazonaws.com/1/characters/2"
+    assert character.image_url("1/characters/2/1.png") == f"{url}/1.png"
+    assert character.image_url("1/characters/2/1.png", ImageVariant.SHEET) == f"{url}/1_sheet.webp"
+    assert (
+        character.image_url("1/characters/2/1.png", ImageVariant.THUMBNAIL)
+        == f"{url}/1_thumbnail.webp"
+    )
+    assert character.image_url("1/characters/2/2.gif", ImageVariant.SHEET) == f"{url}/2.gif"
+
+
 @pytest.mark.no_db
 async def test_fetch_trait_by_name(character_factory, trait_factory):
     """Test the fetch_trait_by_name method."""
@@ -152,6 +226,244 @@ async def test_fetch_trait_by_name(character_factory, trait_factory):
     assert await character.fetch_trait_by_name("Not a trait") is None
 
 
+@pytest.mark.drop_db
+async def test_trait_index(character_factory, trait_factory):
+    """Test the trait index is kept up to date as traits are added and removed."""
+    # GIVEN a character with traits
+    character = await character_factory.build(traits=[]).insert()
+    strength = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+    index = character.trait_index
+
+    # WHEN another trait is added
+    dexterity = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Dexterity", value=1, max_value=5
+        )
+    )
+
+    # THEN the index is updated in place and remains sorted by name
+    assert character.trait_index is index
+    assert await character.fetch_trait_by_name("Dexterity") is dexterity
+    assert character.fetch_traits_by_section(TraitCategory.PHYSICAL) == [dexterity, strength]
+
+    # WHEN a trait is deleted
+    await character.delete_trait(dexterity.id)
+
+    # THEN the trait is removed from the index
+    assert await character.fetch_trait_by_name("Dexterity") is None
+    assert character.fetch_traits_by_section(TraitCategory.PHYSICAL) == [strength]
+
+    # WHEN the trait list is changed directly
+    character.traits.remove(strength)
+
+    # THEN the index is rebuilt
+    assert await character.fetch_trait_by_name("Strength") is None
+
+
+@pytest.mark.drop_db
+async def test_embedded_traits(character_factory, trait_factory):
+    """Test trait writes are mirrored to the traits embedded in the character."""
+    # GIVEN a character with a trait
+    character = await character_factory.build(traits=[]).insert()
+    trait = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+
+    # WHEN the character is loaded with its traits
+    loaded = await Character.get_with_traits(character.id)
+
+    # THEN the traits are read from the character document
+    document = await Character.get_pymongo_collection().find_one({"_id": character.id})
+    assert document["traits_embedded"]
+    assert [(x.id, x.name, x.value) for x in loaded.traits] == [(trait.id, "Strength", 2)]
+
+    # WHEN a loaded trait is updated
+    loaded.traits[0].value = 3
+    await loaded.traits[0].save()
+
+    # THEN the trait and its embedded copy are updated
+    assert (await CharacterTrait.get(trait.id)).value == 3
+    assert (await Character.get_with_traits(character.id)).traits[0].value == 3
+
+    # WHEN the trait is deleted
+    await character.delete_trait(trait.id)
+
+    # THEN the embedded copy is removed
+    assert (await Character.get_with_traits(character.id)).traits == []
+
+
+@pytest.mark.drop_db
+async def test_embedded_trait_is_not_replaced_by_an_older_copy(character_factory, trait_factory):
+    """Test a copy of an older trait write which lands late does not replace the embedded trait."""
+    # GIVEN a character with a trait whose embedded copy was written by a newer write
+    character = await character_factory.build(traits=[]).insert()
+    trait = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+    await Character.get_pymongo_collection().update_one(
+        {"_id": character.id},
+        {"$set": {"embedded_traits.0.value": 4}, "$inc": {"embedded_traits.0.revision": 10}},
+    )
+
+    # WHEN the copy of an older write is mirrored
+    trait.value = 3
+    await trait.save()
+
+    # THEN the embedded trait keeps the newer value
+    assert (await Character.get_with_traits(character.id)).traits[0].value == 4
+
+
+@pytest.mark.drop_db
+async def test_replaced_trait_keeps_its_revision(character_factory, trait_factory):
+    """Test a full write of a trait raises its revision so it is mirrored to the embedded trait."""
+    # GIVEN a character with a trait which was written several times
+    character = await character_factory.build(traits=[]).insert()
+    trait = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+    await trait.save()
+    revision = trait.revision
+
+    # WHEN the trait is replaced
+    trait.value = 3
+    await trait.replace()
+
+    # THEN the revision is raised in both copies and the embedded trait has the new value
+    assert (await CharacterTrait.get(trait.id)).revision == revision + 1
+    embedded = await character.fetch_embedded_trait(trait.id)
+    assert (embedded.value, embedded.revision) == (3, revision + 1)
+
+
+@pytest.mark.drop_db
+async def test_change_embedded_trait_value(character_factory, trait_factory):
+    """Test a trait value is changed in the character and mirrored to the trait."""
+    # GIVEN a character whose traits are only linked
+    character = await character_factory.build(traits=[]).insert()
+    trait = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=3
+        )
+    )
+    await Character.get_pymongo_collection().update_many(
+        {}, {"$unset": {"embedded_traits": "", "traits_embedded": ""}}
+    )
+
+    stale = trait.model_copy()
+
+    # WHEN the trait is raised
+    # THEN the character is migrated, both copies of the trait are raised, and the trait is updated in place
+    assert await character.change_embedded_trait_value(trait, 1)
+    assert (await character.fetch_embedded_trait(trait.id)).value == 3
+    assert (await CharacterTrait.get(trait.id)).value == 3
+    assert trait.value == 3
+    assert (await CharacterTrait.get(trait.id)).revision == trait.revision
+
+    # WHEN the trait is changed from a stale value or raised above its max value
+    # THEN nothing is changed
+    assert not await character.change_embedded_trait_value(stale, -1)
+    assert not await character.change_embedded_trait_value(trait, 1)
+    assert (await character.fetch_embedded_trait(trait.id)).value == 3
+    assert (await CharacterTrait.get(trait.id)).value == 3
+
+
+@pytest.mark.drop_db
+async def test_get_with_traits_fetches_requested_links(character_factory, trait_factory):
+    """Test a character is loaded with its traits and only the other links requested."""
+    # GIVEN a character with a trait and an inventory item
+    character = await character_factory.build(traits=[], inventory=[]).insert()
+    await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+    item = await InventoryItem(character=str(character.id), name="Sword", type="WEAPON").insert()
+    character.inventory.append(item)
+    await character.save()
+
+    # WHEN the character is loaded with its inventory
+    loaded = await Character.get_with_traits(character.id, links=("inventory",))
+
+    # THEN the traits and the inventory are loaded
+    assert [x.name for x in loaded.traits] == ["Strength"]
+    assert [x.name for x in loaded.inventory] == ["Sword"]
+
+    # WHEN a character is loaded with an invalid id
+    # THEN no character is returned
+    assert await Character.get_with_traits("not an id") is None
+
+
+@pytest.mark.drop_db
+async def test_saving_a_stale_character_keeps_embedded_traits(character_factory, trait_factory):
+    """Test saving a character loaded before its traits changed does not overwrite the embedded traits."""
+    # GIVEN a character loaded before a trait is added and before a trait is changed
+    character = await character_factory.build(traits=[]).insert()
+    stale = await Character.get(character.id)
+    strength = await character.add_trait(
+        trait_factory.build(
+            category_name=TraitCategory.PHYSICAL.name, name="Strength", value=2, max_value=5
+        )
+    )
+    loaded = await Character.get_with_traits(character.id)
+    stale_with_traits = await Character.get_with_traits(character.id)
+    loaded.traits[0].value = 4
+    await loaded.traits[0].save()
+
+    # WHEN the stale characters are saved
+    stale.name_first = "Stale"
+    await stale.save()
+    await stale_with_traits.save()
+
+    # THEN the embedded traits keep the latest values
+    reloaded = await Character.get_with_traits(character.id)
+    assert reloaded.name_first == "Stale"
+    assert [(x.id, x.value) for x in reloaded.traits] == [(strength.id, 4)]
+
+
+@pytest.mark.drop_db
+async def test_embed_linked_traits(character_factory, trait_factory):
+    """Test characters with linked traits are migrated to embedded traits."""
+    # GIVEN characters whose traits are only linked
+    characters = []
+    for value in range(3):
+        character = await character_factory.build(traits=[]).insert()
+        await character.add_trait(
+            trait_factory.build(
+                category_name=TraitCategory.PHYSICAL.name,
+                name="Strength",
+                value=value,
+                max_value=5,
+            )
+        )
+        characters.append(character)
+
+    await Character.get_pymongo_collection().update_many(
+        {}, {"$unset": {"embedded_traits": "", "traits_embedded": ""}}
+    )
+
+    # WHEN the characters are migrated
+    migrated = await Character.embed_linked_traits(batch_size=2)
+
+    # THEN every character embeds its traits
+    assert migrated == 3
+    assert await Character.embed_linked_traits() == 0
+    for value, character in enumerate(characters):
+        document = await Character.get_pymongo_collection().find_one({"_id": character.id})
+        assert document["traits_embedded"]
+        assert [(x["name"], x["value"]) for x in document["embedded_traits"]] == [
+            ("Strength", value)
+        ]
+
+
 @pytest.mark.drop_db
 async def test_concept_description(character_factory):
     """Test the concept_description method."""
@@ -1,10 +1,12 @@
 # type: ignore
 """Tests for the dicerolls module."""
 
+import numpy as np
 import pytest
 
 from valentina.constants import RollResultType
-from valentina.models import DiceRoll, RollStatistic
+from valentina.models import DiceRoll, RollBatch, RollStatistic, RollStatisticRollup
+from valentina.models.statistics import roll_statistic_writer
 from valentina.utils import errors
 
 
@@ -141,6 +143,56 @@ def test_roll_exceptions(mock_ctx1):
         DiceRoll(ctx=mock_ctx1, difficulty=6, pool=6, dice_size=3)
 
 
+@pytest.mark.no_db
+def test_roll_batch_matches_diceroll(mock_ctx1, mocker) -> None:
+    """Ensure that a batch of rolls is scored the same as individual rolls."""
+    # GIVEN a batch of rolls with known dice
+    dice = np.array(
+        [[1, 2, 3, 4], [10, 10, 10, 2], [2, 3, 2, 5], [1, 1, 3, 10], [1, 2, 7, 10], [6, 7, 8, 9]]
+    )
+    mocker.patch("valentina.models.dicerolls.random_num_array", return_value=dice)
+
+    # WHEN the batch is rolled
+    batch = RollBatch(rolls=len(dice), pool=4, difficulty=6)
+
+    # THEN assert that every roll matches the equivalent DiceRoll
+    for i, row in enumerate(dice.tolist()):
+        mocker.patch.object(DiceRoll, "roll", row)
+        roll = DiceRoll(pool=4, ctx=mock_ctx1, difficulty=6)
+        assert batch.botches[i] == roll.botches
+        assert batch.criticals[i] == roll.criticals
+        assert batch.failures[i] == roll.failures
+        assert batch.successes[i] == roll.successes
+        assert batch.results[i] == roll.result
+        assert batch.result_types[i] == roll.result_type.value
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize(("pool", "dice_size"), [(10, 10), (3, 6), (0, 10), (5, 100)])
+def test_roll_batch(pool: int, dice_size: int) -> None:
+    """Ensure that a batch rolls the correct number of dice."""
+    # WHEN rolling a batch of dice
+    batch = RollBatch(rolls=1000, pool=pool, difficulty=1, dice_size=dice_size)
+
+    # THEN assert that the correct number of dice are rolled with the correct dice type
+    assert len(batch) == 1000
+    assert batch.dice.shape == (1000, pool)
+    assert ((batch.dice >= 1) & (batch.dice <= dice_size)).all()
+    assert sum(batch.result_type_counts.values()) == 1000
+    if dice_size != 10:
+        assert batch.result_type_counts[RollResultType.OTHER] == 1000
+
+
+@pytest.mark.no_db
+def test_roll_batch_exceptions() -> None:
+    """Ensure that a batch validates its parameters."""
+    with pytest.raises(errors.ValidationError, match="Rolls cannot be less than 0"):
+        RollBatch(rolls=-1, pool=1)
+
+    with pytest.raises(errors.ValidationError, match="Pool cannot exceed 100"):
+        RollBatch(rolls=1, pool=101)
+
+
 @pytest.mark.drop_db
 async def test_log_roll(mock_ctx1):
     """Test diceroll logging to the database."""
@@ -151,9 +203,12 @@ async def test_log_roll(mock_ctx1):
     # WHEN the log_roll method is called
     await d.log_roll(traits)
 
-    # THEN assert that the diceroll is logged
+    # THEN assert that the diceroll is queued and logged when the buffer is flushed
+    assert await RollStatistic.find_all().count() == 0
+    await roll_statistic_writer.flush()
     assert await RollStatistic.find_all().count() == 1
     db_result = await RollStatistic.find_one()
     assert db_result.pool == 3
     assert db_result.difficulty == 6
     assert db_result.traits == ["test_trait1", "test_trait2"]
+    assert await RollStatisticRollup.find(RollStatisticRollup.scope == "guild").count() == 2
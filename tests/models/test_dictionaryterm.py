@@ -4,6 +4,7 @@
 import pytest
 
 from valentina.models import DictionaryTerm
+from valentina.models.dictionary import DictionaryTermMatcher, dictionary_term_cache
 
 
 @pytest.mark.drop_db
@@ -20,3 +21,55 @@ async def test_event_based_actions():
     # Then: The term and synonyms are normalized to lowercase with whitespace trimmed
     assert new_term.term == "test term"
     assert new_term.synonyms == ["test synonym 1", "test synonym 2"]
+
+
+@pytest.mark.no_db
+async def test_term_matcher_longest_match():
+    """Test the term matcher links the longest overlapping term in a single pass."""
+    # Given: Overlapping terms and a term with nothing to link to
+    terms = [
+        DictionaryTerm(term="vampire", definition="abc", guild_id=1),
+        DictionaryTerm(term="vampire lord", synonyms=["elder"], definition="abc", guild_id=1),
+        DictionaryTerm(term="ghoul", guild_id=1),
+    ]
+
+    # When: Text is linked with the matcher
+    matcher = DictionaryTermMatcher(terms)
+    result = matcher.sub(
+        lambda term, text: f"[{text}]({term.term})",
+        "A Vampire Lord, an elder, a vampire, a ghoul and /vampire.",
+    )
+
+    # Then: The longest term wins and paths and unlinkable terms are left alone
+    assert (
+        result
+        == "A [Vampire Lord](vampire lord), an [elder](vampire lord), a [vampire](vampire), a ghoul and /vampire."
+    )
+
+
+@pytest.mark.drop_db
+async def test_term_cache_invalidation():
+    """Test the term cache is scoped to a guild and discarded when a term changes."""
+    # Given: A term in two guilds
+    term = await DictionaryTerm(term="ghoul", definition="abc", guild_id=1).insert()
+    await DictionaryTerm(term="kindred", definition="abc", guild_id=2).insert()
+
+    # When: The matcher for the first guild is fetched
+    matcher = await dictionary_term_cache.get(1)
+
+    # Then: Only the guild's terms are included and the matcher is cached
+    assert set(matcher.terms) == {"ghoul"}
+    assert await dictionary_term_cache.get(1) is matcher
+
+    # When: The term is updated
+    term.synonyms = ["revenant"]
+    await term.save()
+
+    # Then: The matcher is rebuilt with the change
+    assert set((await dictionary_term_cache.get(1)).terms) == {"ghoul", "revenant"}
+
+    # When: The term is deleted
+    await term.delete()
+
+    # Then: The matcher is rebuilt without the term
+    assert not (await dictionary_term_cache.get(1)).terms
@@ -1,11 +1,13 @@
 # type: ignore
 """Test the Guild database model."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from tests.factories import *
 from valentina.constants import DICEROLL_THUMBS, RollResultType
-from valentina.models import Campaign, GuildRollResultThumbnail
+from valentina.models import Campaign, Guild, GuildRollResultThumbnail
 from valentina.utils import errors
 
 
@@ -76,3 +78,66 @@ async def test_delete_campaign(campaign_factory, guild_factory):
     assert guild.campaigns == []
     assert not await Campaign.find(Campaign.is_deleted == False).to_list()  # noqa: E712
     assert campaign.is_deleted
+
+
+def _member(mocker, member_id: int, administrator: bool, roles: list[str], guild=None) -> MagicMock:
+    """Return a mock guild member."""
+    member = mocker.MagicMock()
+    member.id = member_id
+    member.name = f"member{member_id}"
+    member.bot = False
+    member.guild = guild
+    member.guild_permissions.administrator = administrator
+    member.roles = []
+    for name in roles:
+        role = mocker.MagicMock()
+        role.name = name
+        member.roles.append(role)
+
+    return member
+
+
+@pytest.mark.drop_db
+async def test_sync_roles(mocker, mock_guild1, guild_factory):
+    """Test administrators and storytellers are written only when they change."""
+    # GIVEN a guild with stale role lists
+    guild = await guild_factory.build(
+        id=mock_guild1.id, administrators=[1, 99], storytellers=[]
+    ).insert()
+    mock_guild1.members = [
+        _member(mocker, 1, administrator=True, roles=["@everyone"]),
+        _member(mocker, 2, administrator=False, roles=["@everyone", "Storyteller"]),
+        _member(mocker, 3, administrator=False, roles=["@everyone", "Player"]),
+    ]
+
+    # WHEN the roles are synchronized
+    changed = await guild.sync_roles(mock_guild1)
+
+    # THEN the lists match Discord
+    assert changed
+    db_guild = await Guild.get(guild.id)
+    assert db_guild.administrators == [1]
+    assert db_guild.storytellers == [2]
+
+    # WHEN the roles are synchronized again
+    # THEN nothing is written
+    assert not await db_guild.sync_roles(mock_guild1)
+
+    # WHEN the roles are synchronized before the member cache is complete
+    await db_guild.set({"storytellers": [2, 99]})
+    mock_guild1.chunked = False
+
+    # THEN members missing from the cache keep their roles
+    assert not await db_guild.sync_roles(mock_guild1)
+    assert (await Guild.get(guild.id)).storytellers == [2, 99]
+    await db_guild.set({"storytellers": [2]})
+
+    # WHEN a single member's roles change
+    await Guild.sync_member_roles(
+        _member(mocker, 3, administrator=True, roles=["Storyteller"], guild=mock_guild1)
+    )
+
+    # THEN the member is added to both lists
+    db_guild = await Guild.get(guild.id)
+    assert db_guild.administrators == [1, 3]
+    assert db_guild.storytellers == [2, 3]
@@ -6,18 +6,68 @@ import re
 import discord
 import pytest
 
+from valentina.constants import MAX_POOL_SIZE, PRECOMPUTED_PROBABILITY_MAX_POOL
 from valentina.models import Probability, RollProbability
+from valentina.models.probability import ProbabilityTable, calculate_exact_probabilities
+from valentina.utils import errors
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize(
+    ("pool", "difficulty", "dice_size", "expected"),
+    [
+        (
+            1,
+            6,
+            10,
+            {"SUCCESS": 40, "FAILURE": 40, "BOTCH": 10, "CRITICAL": 10, "total_results": 50},
+        ),
+        (
+            2,
+            10,
+            10,
+            {"SUCCESS": 16, "FAILURE": 66, "BOTCH": 17, "CRITICAL": 1, "total_results": 18},
+        ),
+        (0, 6, 10, {"SUCCESS": 0, "FAILURE": 100, "BOTCH": 0, "CRITICAL": 0, "total_results": 0}),
+        (3, 4, 6, {"SUCCESS": 0, "FAILURE": 0, "BOTCH": 0, "OTHER": 100, "total_results": 0}),
+    ],
+)
+def test_calculate_exact_probabilities(pool, difficulty, dice_size, expected):
+    """Test calculating exact probabilities."""
+    # WHEN calculating the exact probabilities of a roll
+    result = calculate_exact_probabilities(pool=pool, difficulty=difficulty, dice_size=dice_size)
+
+    # THEN confirm the probabilities are correct
+    for key, value in expected.items():
+        assert result[key] == pytest.approx(value)
+    assert result["total_successes"] == pytest.approx(result["SUCCESS"] + result["CRITICAL"])
+    assert result["total_failures"] == pytest.approx(result["FAILURE"] + result["BOTCH"])
+
+
+async def test_calculate_monte_carlo(mock_ctx1):
+    """Test the calculate method with Monte Carlo simulation."""
+    # GIVEN a probability instance using Monte Carlo simulation
+    p = Probability(ctx=mock_ctx1, pool=5, difficulty=6, dice_size=10, monte_carlo=True)
+
+    # WHEN calculating the probability of a roll
+    result = await p._calculate()
+
+    # THEN confirm the results are close to the exact results
+    exact = calculate_exact_probabilities(pool=5, difficulty=6, dice_size=10)
+    for key in ("BOTCH", "CRITICAL", "FAILURE", "SUCCESS", "success_dice", "failure_dice"):
+        assert getattr(result, key) == pytest.approx(exact[key], abs=3)
 
 
-async def test_calculate_no_db(mock_ctx1):
+@pytest.mark.drop_db
+async def test_calculate(mock_ctx1):
     """Test the calculate method."""
     # GIVEN an empty RollProbability collection
     # WHEN calculating the probability of a roll
     p = Probability(ctx=mock_ctx1, pool=5, difficulty=6, dice_size=10)
     result = await p._calculate()
 
-    # THEN confirm the probability is correct and the result is saved to the database
-    assert result == await RollProbability.find_one()
+    # THEN confirm the probability is correct and the database is not used
+    assert await RollProbability.find_all().count() == 0
     assert result.pool == 5
     assert result.difficulty == 6
     assert result.dice_size == 10
@@ -34,37 +84,41 @@ async def test_calculate_no_db(mock_ctx1):
     assert round(result.CRITICAL) in range(3, 6)
 
 
-@pytest.mark.drop_db
-async def test_calculate_with_db(mock_ctx1):
-    """Test the calculate method."""
-    # GIVEN a RollProbability collection with a result
-    r = RollProbability(
-        pool=5,
-        difficulty=6,
-        dice_size=10,
-        total_results=200.31,
-        botch_dice=9.99,
-        success_dice=39.722,
-        failure_dice=40.128,
-        critical_dice=10.16,
-        total_successes=75.77000000000001,
-        total_failures=24.23,
-        BOTCH=13.459999999999999,
-        CRITICAL=4.390000000000001,
-        FAILURE=10.77,
-        SUCCESS=71.38,
-        OTHER=0.0,
-    )
-    await r.insert()
+@pytest.mark.no_db
+def test_probability_table():
+    """Test building and reading the probability table."""
+    # GIVEN a probability table
+    table = ProbabilityTable()
+    assert not table.is_built
 
-    # WHEN calculating the probability of a roll
-    p = Probability(ctx=mock_ctx1, pool=5, difficulty=6, dice_size=10)
-    result = await p._calculate()
+    # WHEN the table is built
+    table.build()
+
+    # THEN confirm only d10 rolls up to the precomputed pool size are in the table
+    assert table.is_built
+    assert len(table._table) == (PRECOMPUTED_PROBABILITY_MAX_POOL + 1) * 11
 
-    # THEN confirm the probability is correct and the result pulled from the database
-    db_result = await RollProbability.find_one()
-    assert await RollProbability.find_all().count() == 1
-    assert result.id == db_result.id
+    # AND every valid roll matches the exact calculation
+    assert table.get(pool=5, difficulty=6, dice_size=10) == calculate_exact_probabilities(
+        pool=5, difficulty=6, dice_size=10
+    )
+    assert table.get(pool=MAX_POOL_SIZE, difficulty=100, dice_size=100)["OTHER"] == 100
+    with pytest.raises(TypeError):
+        table.get(pool=5, difficulty=6, dice_size=10)["SUCCESS"] = 0
+
+
+@pytest.mark.no_db
+def test_probability_table_invalid_roll():
+    """Test reading an invalid roll from the probability table."""
+    # GIVEN a probability table
+    table = ProbabilityTable()
+
+    # WHEN reading an invalid roll
+    # THEN confirm an error is raised
+    with pytest.raises(errors.ValidationError, match="Pool cannot exceed"):
+        table.get(pool=MAX_POOL_SIZE + 1, difficulty=6, dice_size=10)
+    with pytest.raises(errors.ValidationError, match="Difficulty cannot exceed"):
+        table.get(pool=5, difficulty=11, dice_size=10)
 
 
 async def test_get_description(mock_ctx1):
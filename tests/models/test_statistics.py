@@ -1,12 +1,22 @@
 # type: ignore
 """Test the Statistics module."""
 
+import asyncio
+from datetime import UTC, datetime, timedelta
+
 import discord
 import pytest
+from pymongo.errors import PyMongoError
 
 from tests.factories import *
 from valentina.constants import RollResultType
-from valentina.models import RollStatistic, Statistics
+from valentina.models import RollStatistic, RollStatisticRollup, Statistics
+from valentina.models.statistics import (
+    ROLLUP_RESULT_FIELDS,
+    RollStatisticWriter,
+    roll_statistic_writer,
+)
+from valentina.utils.helpers import time_now
 
 
 @pytest.mark.drop_db
@@ -319,3 +329,241 @@ async def test_guild_statistics_results_json(mock_ctx1):
         "successes_percentage": "50.00",
         "total_rolls": "2",
     }
+
+
+@pytest.mark.drop_db
+async def test_guild_statistics_timeframe(mock_ctx1):
+    """Test pulling guild statistics for a timeframe."""
+    # GIVEN a guild with a recent roll and an old roll recorded in the rollups
+    recent = RollStatistic(
+        user=1,
+        guild=1,
+        character="1",
+        result=RollResultType.SUCCESS,
+        pool=3,
+        difficulty=6,
+    )
+    old = RollStatistic(
+        user=1,
+        guild=1,
+        character="1",
+        result=RollResultType.BOTCH,
+        pool=1,
+        difficulty=1,
+        date_rolled=time_now() - timedelta(days=40),
+    )
+    await RollStatistic.insert_many([recent, old])
+    await RollStatisticRollup.record([recent, old])
+
+    # WHEN statistics are pulled for the last 30 days
+    s = Statistics(mock_ctx1, timeframe=timedelta(days=30))
+    result = await s.guild_statistics()
+
+    # THEN confirm only the recent roll is counted
+    assert s.successes == 1
+    assert s.botches == 0
+    assert s.total_rolls == 1
+    assert s.average_difficulty == 6
+    assert s.average_pool == 3
+    assert "_Rolls from the last 30 days_" in result
+
+
+@pytest.mark.no_db
+def test_rollup_buckets():
+    """Test rolls are bucketed by day and by weeks starting on Monday."""
+    date = datetime(2024, 5, 16, 13, 30, tzinfo=UTC)  # A Thursday
+
+    assert RollStatisticRollup.bucket_for(date) == datetime(2024, 5, 16, tzinfo=UTC)
+    assert RollStatisticRollup.bucket_for(date, "week") == datetime(2024, 5, 13, tzinfo=UTC)
+
+
+@pytest.mark.drop_db
+async def test_statistics_timeframe_sums_weeks_and_days(mock_ctx1):
+    """Test a timeframe counts every roll in it once from the weekly and daily rollups."""
+    # GIVEN rolls spread over several weeks and recorded in the rollups
+    rolls = [
+        RollStatistic(
+            user=1,
+            guild=1,
+            result=RollResultType.SUCCESS,
+            pool=2,
+            difficulty=6,
+            date_rolled=time_now() - timedelta(days=days),
+        )
+        for days in (0, 1, 6, 8, 13, 20, 27, 45)
+    ]
+    await RollStatistic.insert_many(rolls)
+    await RollStatisticRollup.record(rolls)
+
+    # WHEN statistics are pulled for timeframes starting on every day of the week
+    # THEN each timeframe counts the rolls it contains
+    for days in range(1, 36):
+        s = Statistics(mock_ctx1, timeframe=timedelta(days=days))
+        await s.guild_statistics()
+        start = RollStatisticRollup.bucket_for(time_now() - timedelta(days=days))
+        assert s.successes == sum(x.date_rolled >= start for x in rolls)
+
+
+@pytest.mark.drop_db
+async def test_rebuild_rollups():
+    """Test rebuilding the rollups from the logged rolls."""
+    # GIVEN rolls which are not recorded in the rollups
+    for result in (RollResultType.SUCCESS, RollResultType.SUCCESS, RollResultType.FAILURE):
+        await RollStatistic(
+            user=1,
+            guild=1,
+            character="1",
+            result=result,
+            pool=2,
+            difficulty=6,
+        ).insert()
+
+    # WHEN the rollups are rebuilt
+    await RollStatisticRollup.rebuild()
+
+    # THEN confirm a rollup exists for each scope of the rolls
+    assert await RollStatisticRollup.find_all().count() == 6
+    rollup = await RollStatisticRollup.find_one(
+        RollStatisticRollup.scope == "guild",
+        RollStatisticRollup.scope_id == "1",
+        RollStatisticRollup.period == "day",
+    )
+    assert rollup.successes == 2
+    assert rollup.failures == 1
+    assert rollup.botches == 0
+    assert rollup.pool_total == 6
+    assert rollup.bucket == RollStatisticRollup.bucket_for(time_now())
+
+
+@pytest.mark.drop_db
+@pytest.mark.parametrize(
+    ("scope", "scope_id"),
+    [("guild", 1), ("user", 2), ("character", "1"), ("campaign", "1")],
+)
+async def test_aggregated_statistics_match_counted_results(scope, scope_id):
+    """Test that the aggregated statistics match counting each result type separately."""
+    # GIVEN rolls of every result type spread across several scopes
+    for i, result in enumerate(list(RollResultType) * 3):
+        await RollStatistic(
+            user=1 + i % 2,
+            guild=1 + i % 3,
+            character=str(i % 4),
+            campaign=str(i % 2) if i % 5 else None,
+            result=result,
+            pool=1 + i % 7,
+            difficulty=3 + i % 5,
+        ).insert()
+
+    # WHEN statistics are pulled for the scope
+    s = Statistics()
+    await s._fetch_statistics(scope, scope_id)
+
+    # THEN confirm they match counting each result type separately
+    for result, field in ROLLUP_RESULT_FIELDS.items():
+        count = await RollStatistic.find({scope: scope_id}, RollStatistic.result == result).count()
+        assert getattr(s, field) == count
+    assert s.total_rolls == await RollStatistic.find({scope: scope_id}).count()
+    assert s.total_rolls > 0
+    assert s.average_difficulty == round(
+        await RollStatistic.find({scope: scope_id}).avg(RollStatistic.difficulty)
+    )
+    assert s.average_pool == round(
+        await RollStatistic.find({scope: scope_id}).avg(RollStatistic.pool)
+    )
+
+
+@pytest.mark.drop_db
+async def test_statistics_include_buffered_rolls(mock_ctx1):
+    """Test that statistics include rolls which are still buffered."""
+    # GIVEN a roll which is queued but not yet written
+    await roll_statistic_writer.add(
+        RollStatistic(
+            user=1,
+            guild=1,
+            character="1",
+            result=RollResultType.SUCCESS,
+            pool=1,
+            difficulty=6,
+        )
+    )
+
+    # WHEN statistics are pulled for a guild
+    s = Statistics(mock_ctx1)
+    await s.guild_statistics()
+
+    # THEN confirm the buffered roll is counted
+    assert s.successes == 1
+    assert s.total_rolls == 1
+    assert await RollStatisticRollup.find_all().count() == 6
+
+
+@pytest.mark.drop_db
+async def test_writer_retries_failed_writes(mocker):
+    """Test rolls are kept and written by the next flush when writing them fails."""
+    # GIVEN a queued roll and a database write which fails once
+    writer = RollStatisticWriter()
+    await writer.add(
+        RollStatistic(user=1, guild=1, result=RollResultType.SUCCESS, pool=2, difficulty=6)
+    )
+    mocker.patch.object(RollStatistic, "insert_many", side_effect=PyMongoError("write failed"))
+
+    # WHEN the queue is flushed
+    with pytest.raises(PyMongoError):
+        await writer.flush()
+
+    # THEN the roll is not lost and is written by the next flush
+    assert await RollStatistic.find_all().count() == 0
+    mocker.stopall()
+    await writer.flush()
+    assert await RollStatistic.find_all().count() == 1
+    assert (await RollStatisticRollup.find_one(RollStatisticRollup.scope == "guild")).successes == 1
+    await writer.close()
+
+
+@pytest.mark.drop_db
+async def test_writer_reconciles_failed_rollups(mocker):
+    """Test rollups are rebuilt from the written rolls when updating them fails."""
+    # GIVEN a queued roll and a rollup update which fails once
+    writer = RollStatisticWriter()
+    await writer.add(
+        RollStatistic(user=1, guild=1, result=RollResultType.SUCCESS, pool=2, difficulty=6)
+    )
+    mocker.patch.object(RollStatisticRollup, "record", side_effect=PyMongoError("write failed"))
+
+    # WHEN the queue is flushed
+    with pytest.raises(PyMongoError):
+        await writer.flush()
+
+    # THEN the roll is written but its rollups are missing
+    assert await RollStatistic.find_all().count() == 1
+    assert await RollStatisticRollup.find_all().count() == 0
+
+    # WHEN another roll is flushed
+    mocker.stopall()
+    await writer.add(
+        RollStatistic(user=1, guild=1, result=RollResultType.BOTCH, pool=4, difficulty=6)
+    )
+    await writer.flush()
+
+    # THEN the rollups count every roll exactly once
+    rollup = await RollStatisticRollup.find_one(RollStatisticRollup.scope == "guild")
+    assert (rollup.successes, rollup.botches, rollup.pool_total) == (1, 1, 6)
+    assert await RollStatistic.find_all().count() == 2
+    await writer.close()
+
+
+@pytest.mark.no_db
+async def test_writer_survives_unexpected_errors(mocker):
+    """Test the background writer keeps running when a flush raises an unexpected error."""
+    # GIVEN a writer whose flushes fail
+    writer = RollStatisticWriter(flush_interval=0.01)
+    flush = mocker.patch.object(writer, "flush", side_effect=RuntimeError("unexpected"))
+
+    # WHEN the writer runs for several flush intervals
+    writer._ensure_worker()
+    await asyncio.sleep(0.05)
+
+    # THEN it keeps flushing
+    assert flush.await_count > 1
+    assert not writer._task.done()
+    writer._task.cancel()
@@ -4,6 +4,7 @@
 import pytest
 
 from tests.factories import *
+from valentina.models import User
 from valentina.utils import errors
 
 
@@ -129,3 +130,52 @@ async def test_remove_character(user_factory, character_factory, mock_guild1):
     assert len(user.characters) == 1
     assert character1.id in [x.id for x in user.characters]
     assert character2.id not in [x.id for x in user.characters]
+
+
+@pytest.mark.drop_db
+async def test_provision_guild_members(user_factory):
+    """Test the users for a guild's members are created and updated in bulk."""
+    # GIVEN an existing user in another guild and a user who is up to date
+    existing = await user_factory.build(
+        name="Old Name", avatar_url="https://a", guilds=[2], macros=[], characters=[]
+    ).insert()
+    current = await user_factory.build(
+        name="Current", avatar_url="https://b", guilds=[1], macros=[], characters=[]
+    ).insert()
+
+    # WHEN the guild's members are provisioned
+    written = await User.provision_guild_members(
+        1,
+        {
+            existing.id: ("New Name", "https://a"),
+            current.id: ("Current", "https://b"),
+            12345: ("Newcomer", None),
+        },
+    )
+
+    # THEN only the new and changed users are written
+    assert written == 2
+
+    updated = await User.get(existing.id)
+    assert updated.name == "New Name"
+    assert updated.guilds == [2, 1]
+
+    created = await User.get(12345)
+    assert created.name == "Newcomer"
+    assert created.guilds == [1]
+    assert created.macros == []
+    assert created.campaign_experience == {}
+
+    # WHEN the same members are provisioned again
+    # THEN nothing is written
+    assert (
+        await User.provision_guild_members(
+            1,
+            {
+                existing.id: ("New Name", "https://a"),
+                current.id: ("Current", "https://b"),
+                12345: ("Newcomer", None),
+            },
+        )
+        == 0
+    )
@@ -4,7 +4,7 @@
 import pytest
 
 from tests.factories import *
-from valentina.constants import TraitCategory
+from valentina.constants import MAX_OPTION_LIST_SIZE, TraitCategory
 from valentina.discord.utils import autocomplete
 from valentina.models import CharacterSheetSection
 
@@ -31,6 +31,32 @@ async def test_select_campaign(campaign_factory, mock_ctx1):
     assert result[0].value == str(campaign.id)
 
 
+@pytest.mark.drop_db
+async def test_select_campaign_with_many_matches(campaign_factory, mock_ctx1):
+    """Test that the best matches are returned when more campaigns match than can be displayed."""
+    # GIVEN more campaigns containing a name than can be displayed, and one starting with it
+    for i in range(MAX_OPTION_LIST_SIZE + 5):
+        await campaign_factory.build(
+            name=f"campaign {i} kelly",
+            guild=str(mock_ctx1.interaction.guild.id),
+            is_deleted=False,
+        ).insert()
+    await campaign_factory.build(
+        name="kelly's campaign",
+        guild=str(mock_ctx1.interaction.guild.id),
+        is_deleted=False,
+    ).insert()
+
+    mock_ctx1.value = "kelly"
+
+    # WHEN calling select_campaign
+    result = await autocomplete.select_campaign(mock_ctx1)
+
+    # THEN a full list is returned with the name starting with the input first
+    assert len(result) == MAX_OPTION_LIST_SIZE
+    assert result[0].name == "kelly's campaign"
+
+
 @pytest.mark.no_db
 async def test_select_vampire_clan(mock_ctx1):
     """Test the select_vampire_clan function."""
@@ -576,3 +602,31 @@ async def test_select_trait_from_char_option_two(mock_ctx1, character_factory, t
     assert len(result) == 1
     assert result[0].name == "Dexterity"
     assert result[0].value == str(trait.id)
+
+
+@pytest.mark.drop_db
+async def test_select_any_character_reflects_changes(mock_ctx1, character_factory):
+    """Test the cached character index is rebuilt when a character changes."""
+    # GIVEN a character in the database which has been autocompleted
+    character = character_factory.build(
+        name_first="character",
+        name_last="character",
+        guild=mock_ctx1.interaction.guild.id,
+        is_alive=True,
+    )
+    await character.insert()
+    mock_ctx1.value = "charcter"
+    result = await autocomplete.select_any_character(mock_ctx1)
+    assert [x.name for x in result] == ["character character"]
+
+    # WHEN the character is renamed
+    character.name_first = "renamed"
+    character.is_alive = False
+    await character.save()
+
+    # THEN the change is autocompleted
+    mock_ctx1.value = "ren"
+    result = await autocomplete.select_any_character(mock_ctx1)
+    assert len(result) == 1
+    assert result[0].name == "💀 renamed character"
+    assert result[0].value == str(character.id)
@@ -0,0 +1,95 @@
+# type: ignore
+"""Tests for the autocomplete index."""
+
+import asyncio
+
+import pytest
+
+from valentina.utils.autocomplete_index import (
+    AutocompleteIndex,
+    IndexEntry,
+    IndexKind,
+    SearchIndex,
+)
+
+TRAITS = ["Alertness", "Animal Ken", "Athletics", "Brawl", "Dexterity", "Stamina", "Strength"]
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("", TRAITS),
+        ("st", ["Stamina", "Strength"]),
+        ("KEN", ["Animal Ken"]),
+        ("ta", ["Stamina"]),
+        ("a", ["Alertness", "Animal Ken", "Athletics", "Brawl", "Stamina"]),
+        ("dextirity", ["Dexterity"]),
+        ("athletcs", ["Athletics"]),
+        ("some_thing", []),
+    ],
+)
+def test_search(query, expected):
+    """Verify prefix matches rank before word, substring, and fuzzy matches."""
+    # GIVEN an index of traits
+    index = SearchIndex(IndexEntry(id=str(i), name=name) for i, name in enumerate(TRAITS))
+
+    # WHEN the index is searched
+    results = index.search(query)
+
+    # THEN the matches are returned best first
+    assert [x.name for x in results] == expected
+
+
+@pytest.mark.no_db
+def test_search_filter_order_and_limit():
+    """Verify results are filtered, ordered by the index order, and limited."""
+    # GIVEN an index of books ordered by number
+    index = SearchIndex(
+        [
+            IndexEntry(id="1", name="Book c", number=1),
+            IndexEntry(id="2", name="Book b", number=2),
+            IndexEntry(id="3", name="Book a", number=3),
+        ],
+        order=lambda x: x.number,
+    )
+
+    # THEN equally ranked matches are returned in the index order
+    assert [x.id for x in index.search("book")] == ["1", "2", "3"]
+    assert [x.id for x in index.search("book", limit=2)] == ["1", "2"]
+    assert [x.id for x in index.search("", where=lambda x: x.number > 1)] == ["2", "3"]
+
+
+@pytest.mark.no_db
+async def test_autocomplete_index():
+    """Verify indexes are built once, shared, and rebuilt after they are invalidated."""
+    # GIVEN an autocomplete index and a loader
+    autocomplete_index = AutocompleteIndex()
+    loads = []
+
+    async def load() -> list[IndexEntry]:
+        loads.append(1)
+        await asyncio.sleep(0)
+        return [IndexEntry(id=str(len(loads)), name="Dexterity")]
+
+    # WHEN the index is requested concurrently
+    results = await asyncio.gather(
+        *[autocomplete_index.get(IndexKind.TRAITS, "1", load) for _ in range(5)]
+    )
+
+    # THEN it is loaded once
+    assert len(loads) == 1
+    assert all(x is results[0] for x in results)
+    assert await autocomplete_index.get(IndexKind.TRAITS, 1, load) is results[0]
+
+    # WHEN the index is invalidated while it is rebuilt
+    autocomplete_index.invalidate(IndexKind.TRAITS, "1")
+    build = asyncio.create_task(autocomplete_index.get(IndexKind.TRAITS, "1", load))
+    await asyncio.sleep(0)
+    autocomplete_index.invalidate(IndexKind.TRAITS, "1")
+    await build
+
+    # THEN the stale build is not cached
+    index = await autocomplete_index.get(IndexKind.TRAITS, "1", load)
+    assert len(loads) == 3
+    assert index.entries[0].id == "3"
@@ -0,0 +1,39 @@
+# type: ignore
+"""Tests for the channel cache."""
+
+import pytest
+from beanie import PydanticObjectId
+
+from valentina.utils.channel_cache import ChannelCache, ChannelEntityIds
+
+
+@pytest.mark.no_db
+def test_channel_cache():
+    """Verify cached channels are keyed by their category and can be invalidated."""
+    # GIVEN a cache with channels in a category
+    cache = ChannelCache()
+    character = ChannelEntityIds(campaign_id=PydanticObjectId(), character_id=PydanticObjectId())
+    book = ChannelEntityIds(campaign_id=character.campaign_id, book_id=PydanticObjectId())
+    cache.set(1, 100, character)
+    cache.set(2, 100, book)
+    cache.set(3, None, ChannelEntityIds())
+
+    # THEN channels are returned only while they remain in the same category
+    assert cache.get(1, 100) is character
+    assert cache.get(1, 200) is None
+    assert cache.get(3, None) == ChannelEntityIds()
+    assert cache.get(4, 100) is None
+
+    # WHEN a channel is invalidated
+    cache.invalidate(1, None)
+
+    # THEN only that channel is forgotten
+    assert cache.get(1, 100) is None
+    assert cache.get(2, 100) is book
+
+    # WHEN a category is invalidated
+    cache.invalidate(100)
+
+    # THEN every channel in the category is forgotten
+    assert cache.get(2, 100) is None
+    assert cache.get(3, None) == ChannelEntityIds()
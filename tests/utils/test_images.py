@@ -0,0 +1,60 @@
+# type: ignore
+"""Tests for image derivative utilities."""
+
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from valentina.constants import ImageVariant
+from valentina.utils.images import create_image_derivatives, derivative_key, is_derivative_key
+
+
+def _image_bytes(size: tuple[int, int], image_format: str = "PNG", frames: int = 1) -> bytes:
+    """Return an encoded image of the given size."""
+    images = [Image.new("RGB", size, color=(i * 40, 0, 0)) for i in range(frames)]
+    buffer = BytesIO()
+    images[0].save(buffer, format=image_format, save_all=frames > 1, append_images=images[1:])
+    return buffer.getvalue()
+
+
+@pytest.mark.no_db
+def test_derivative_key():
+    """Test derivative keys are stored beside the original image."""
+    key = derivative_key("1/characters/2/3.png", ImageVariant.SHEET)
+    assert key == "1/characters/2/3_sheet.webp"
+    assert is_derivative_key(key)
+    assert is_derivative_key(derivative_key("1/characters/2/3.png", ImageVariant.THUMBNAIL))
+    assert not is_derivative_key("1/characters/2/3.png")
+    assert not is_derivative_key("1/characters/2/3.webp")
+
+
+@pytest.mark.no_db
+async def test_create_image_derivatives():
+    """Test a WebP derivative is created for every variant without upscaling."""
+    # GIVEN a large image
+    data = _image_bytes((2000, 1000))
+
+    # WHEN derivatives are created
+    derivatives = await create_image_derivatives(data)
+
+    # THEN every variant is resized to fit its bounds
+    assert set(derivatives) == set(ImageVariant)
+    sizes = {}
+    for variant, derivative in derivatives.items():
+        with Image.open(BytesIO(derivative)) as image:
+            assert image.format == "WEBP"
+            sizes[variant] = image.size
+
+    assert sizes == {
+        ImageVariant.THUMBNAIL: (256, 128),
+        ImageVariant.SHEET: (1024, 512),
+        ImageVariant.FULL: (2000, 1000),
+    }
+
+
+@pytest.mark.no_db
+async def test_create_image_derivatives_skips_unsupported_images():
+    """Test animated and invalid images produce no derivatives."""
+    assert await create_image_derivatives(_image_bytes((50, 50), "GIF", frames=2)) == {}
+    assert await create_image_derivatives(b"not an image") == {}
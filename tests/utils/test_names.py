@@ -0,0 +1,74 @@
+# type: ignore
+"""Tests for the name generator."""
+
+import asyncio
+
+import pytest
+
+from valentina.constants import NameNationality
+from valentina.utils.names import COUNTRY_LOCALES, NameGenerator
+
+
+@pytest.mark.no_db
+def test_every_nationality_has_a_locale():
+    """Verify every NameNationality country code maps to a faker locale."""
+    for nationality in NameNationality:
+        for country in nationality.value.split(","):
+            assert country in COUNTRY_LOCALES
+
+
+@pytest.mark.no_db
+@pytest.mark.parametrize("nationality", list(NameNationality))
+def test_random_names(nationality):
+    """Verify names are generated for every nationality without an event loop."""
+    # GIVEN a name generator
+    generator = NameGenerator(pool_size=10)
+
+    # WHEN names are generated
+    names = generator.random_names(gender="female", country=nationality.value, count=5)
+
+    # THEN each name has a first and last name
+    assert len(names) == 5
+    for first, last in names:
+        assert first
+        assert last
+
+
+@pytest.mark.no_db
+async def test_pool_is_refilled_in_background():
+    """Verify a pool running low is refilled in bulk in the background."""
+    # GIVEN a name generator with an empty pool
+    generator = NameGenerator(pool_size=20)
+
+    # WHEN a name is generated
+    first, last = generator.random_name(gender="male", country="de")
+
+    # THEN the name is returned immediately and the pool is refilled in the background
+    assert first
+    assert last
+    refill = generator._refills[("male", "de")]
+    await asyncio.wait_for(refill, timeout=5)
+    assert len(generator._pools[("male", "de")]) == 20
+
+    # WHEN another name is generated
+    generator.random_name(gender="male", country="de")
+
+    # THEN it is taken from the pool
+    assert len(generator._pools[("male", "de")]) == 19
+
+
+@pytest.mark.no_db
+async def test_each_thread_has_its_own_faker():
+    """Verify fakers are not shared between threads so pools can be refilled concurrently."""
+    # GIVEN a name generator
+    generator = NameGenerator()
+
+    # WHEN fakers are requested from this thread and another thread
+    faker = generator._faker("en_US")
+    other = await asyncio.to_thread(generator._faker, "en_US")
+
+    # THEN this thread reuses its faker and the other thread gets its own with its own random generator
+    assert generator._faker("en_US") is faker
+    assert other is not faker
+    assert other.random is not faker.random
+    assert generator._faker("de_DE").random is not faker.random
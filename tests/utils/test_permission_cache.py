@@ -0,0 +1,90 @@
+# type: ignore
+"""Tests for the guild permission cache."""
+
+import asyncio
+
+import pytest
+
+from valentina.models.guild import GuildPermissions
+from valentina.utils.permission_cache import GuildPermissionCache, GuildPermissionSnapshot
+
+
+def _snapshot(version: int, storytellers: set[int] | None = None) -> GuildPermissionSnapshot:
+    """Return a snapshot of guild 1."""
+    return GuildPermissionSnapshot(
+        guild_id=1,
+        version=version,
+        permissions=GuildPermissions(),
+        administrators=frozenset(),
+        storytellers=frozenset(storytellers or ()),
+    )
+
+
+@pytest.mark.no_db
+async def test_snapshots_are_shared_until_invalidated():
+    """Verify concurrent requests share one load and an invalidated guild is reloaded."""
+    # GIVEN a cache and a loader which counts its calls
+    cache = GuildPermissionCache()
+    loads = []
+
+    async def loader(version: int) -> GuildPermissionSnapshot | None:
+        loads.append(version)
+        await asyncio.sleep(0)
+        return _snapshot(version)
+
+    # WHEN the snapshot is requested concurrently and again afterwards
+    first, second = await asyncio.gather(cache.get(1, loader), cache.get(1, loader))
+    third = await cache.get(1, loader)
+
+    # THEN the guild is loaded once
+    assert first is second is third
+    assert loads == [0]
+
+    # WHEN the guild is invalidated
+    cache.invalidate(1, None)
+
+    # THEN its version is bumped and it is reloaded
+    assert cache.version(1) == 1
+    assert (await cache.get(1, loader)).version == 1
+    assert loads == [0, 1]
+
+
+@pytest.mark.no_db
+async def test_snapshot_loaded_before_a_change_is_not_cached():
+    """Verify a snapshot invalidated while loading is not cached."""
+    # GIVEN a cache and a loader which waits until released
+    cache = GuildPermissionCache()
+    release = asyncio.Event()
+
+    async def stale_loader(version: int) -> GuildPermissionSnapshot | None:
+        await release.wait()
+        return _snapshot(version)
+
+    async def loader(version: int) -> GuildPermissionSnapshot | None:
+        return _snapshot(version, storytellers={2})
+
+    # WHEN the guild is invalidated while it is loading
+    load = asyncio.create_task(cache.get(1, stale_loader))
+    await asyncio.sleep(0)
+    cache.invalidate(1)
+    release.set()
+
+    # THEN the stale snapshot is returned to its caller but not cached
+    assert (await load).version == 0
+    snapshot = await cache.get(1, loader)
+    assert snapshot.version == 1
+    assert snapshot.storytellers == {2}
+
+
+@pytest.mark.no_db
+async def test_missing_guilds_are_not_cached():
+    """Verify a guild which does not exist is looked up again."""
+    cache = GuildPermissionCache()
+    loads = []
+
+    async def loader(version: int) -> GuildPermissionSnapshot | None:
+        loads.append(version)
+
+    assert await cache.get(1, loader) is None
+    assert await cache.get(1, loader) is None
+    assert loads == [0, 0]
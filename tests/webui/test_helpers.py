@@ -444,6 +444,55 @@ async def test_fetch_storyteller_characters(
             assert session_character["id"] in [str(character4.id)]
 
 
+async def test_request_lookups(
+    app_request_context,
+    mocker,
+    campaign_factory,
+    character_factory,
+    user_factory,
+    guild_factory,
+):
+    """Test character owners and campaigns are loaded once per request."""
+    # Given: A guild with a campaign and two users
+    guild = guild_factory.build()
+    await guild.insert()
+
+    campaign = campaign_factory.build(guild=guild.id)
+    await campaign.insert()
+
+    user1 = user_factory.build()
+    await user1.insert()
+    user2 = user_factory.build()
+    await user2.insert()
+
+    # And: Three characters owned by the two users
+    characters = []
+    for user in (user1, user1, user2):
+        character = character_factory.build(
+            user_owner=user.id, guild=guild.id, type_player=True, campaign=str(campaign.id)
+        )
+        await character.insert()
+        characters.append(character)
+
+    request_context = asynccontextmanager(app_request_context)
+
+    async with request_context("/"):
+        # When: The character lookups are loaded
+        lookups = await helpers._load_character_lookups(characters)
+
+        # Then: The owner and campaign names are resolved
+        assert lookups.owner_name(characters[0]) == user1.name
+        assert lookups.owner_name(characters[2]) == user2.name
+        assert lookups.campaign_name(characters[0]) == campaign.name
+
+        # When: The same characters are loaded again in the request
+        spy = mocker.spy(helpers.User, "find")
+        assert await helpers._load_character_lookups(characters) is lookups
+
+        # Then: The database is not queried again
+        spy.assert_not_called()
+
+
 async def test_is_storyteller(app_request_context, mock_session, user_factory, guild_factory):
     """Test the is_storyteller function."""
     # Given: A guild exists with one storyteller
@@ -483,22 +532,25 @@ async def test_is_storyteller(app_request_context, mock_session, user_factory, g
 @pytest.mark.drop_db
 async def test_term_linker(app_request_context, mock_session):
     """Test the term linker function."""
-    # Given: Two dictionary terms exist in the database
+    # Given: Two dictionary terms exist in the database for the session's guild
     dict_term1 = DictionaryTerm(
         term="aaaaa",
         synonyms=["bbbbb"],
         definition="abcdefg",
-        guild_id=1,
+        guild_id=987654321,
     )
     dict_term2 = DictionaryTerm(
         term="ccccc",
         synonyms=[],
         link="http://google.com",
-        guild_id=1,
+        guild_id=987654321,
     )
     await dict_term1.insert()
     await dict_term2.insert()
 
+    # And: A term exists for another guild
+    await DictionaryTerm(term="magna", definition="abcdefg", guild_id=1).insert()
+
     # And: A test string containing terms that should be linked
     test_string = "Curaaaaabitur blandit aaaaa tempus ardua bbbbb ridiculous sed ccccc magna."
 
@@ -529,3 +581,18 @@ async def test_term_linker(app_request_context, mock_session):
             await helpers.link_terms(test_string, link_type="markdown", excludes=["aaaaa", "ccccc"])
             == test_string
         )
+
+
+@pytest.mark.drop_db
+async def test_term_linker_without_session(app_request_context):
+    """Test the term linker leaves text unchanged when no one is logged in."""
+    # Given: A dictionary term exists in the database
+    await DictionaryTerm(term="aaaaa", definition="abcdefg", guild_id=987654321).insert()
+
+    # And: The app request context is converted to async
+    request_context = asynccontextmanager(app_request_context)
+
+    async with request_context("/changelog"):
+        # When/Then: The text is returned unchanged without a guild in the session
+        assert "GUILD_ID" not in session
+        assert await helpers.link_terms("blandit aaaaa", link_type="html") == "blandit aaaaa"